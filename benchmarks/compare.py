@@ -0,0 +1,54 @@
+"""
+Compare two JSON reports written by `benchmarks.run`.
+
+    python -m benchmarks.compare before.json after.json
+"""
+
+import argparse
+import json
+
+
+def load(path: str) -> dict[tuple, dict]:
+    with open(path) as file:
+        report = json.load(file)
+    return {
+        (r["transport"], r["payload_bytes"], r["concurrency"]): r
+        for r in report["results"]
+    }
+
+
+def change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args()
+
+    before, after = load(args.before), load(args.after)
+
+    print(
+        f"{'transport':<9} {'payload':>8} {'conc':>5}  "
+        f"{'ops/s':>10} {'change':>8}  {'p99 ms':>9} {'change':>8}"
+    )
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key], after[key]
+        transport, size, concurrency = key
+        ops = change(old["ops_per_sec"], new["ops_per_sec"])
+        p99 = change(old["p99_ms"], new["p99_ms"])
+        print(
+            f"{transport:<9} {size:>8} {concurrency:>5}  "
+            f"{new['ops_per_sec']:>10.0f} {ops:>8}  "
+            f"{new['p99_ms']:>9.3f} {p99:>8}"
+        )
+
+    for key in sorted(before.keys() ^ after.keys()):
+        print(f"only in {'before' if key in before else 'after'}: {key}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Measure throughput, latency and memory of each transport against the local
+stand-ins in `benchmarks.servers`.
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --transports tcp,redis --sizes 64,65536 --concurrency 1,64
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from nest_rpc_client.transport import Transport
+from nest_rpc_client.utils.batch import run_bounded
+
+from .servers import TARGETS, Unavailable
+
+PATTERN = "echo"
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+async def run_requests(
+    transport: Transport, payload: dict, requests: int, concurrency: int
+) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+
+    async def timed_send(pattern: str, data: dict) -> None:
+        started = time.perf_counter()
+        await transport.send(pattern, data)
+        latencies.append(time.perf_counter() - started)
+
+    items = ((PATTERN, payload) for _ in range(requests))
+    started = time.perf_counter()
+    async for _ in run_bounded(
+        timed_send,
+        items,
+        concurrency=concurrency,
+        ordered=False,
+        return_exceptions=False,
+    ):
+        pass
+    return time.perf_counter() - started, latencies
+
+
+async def measure_memory(
+    transport: Transport, payload: dict, requests: int, concurrency: int
+) -> float:
+    """
+    Peak memory allocated while running `requests` calls, divided by the
+    number of requests that were in flight at once.
+    """
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await run_requests(transport, payload, requests, concurrency)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (peak - baseline) / min(concurrency, requests)
+
+
+async def bench_case(
+    transport: Transport, size: int, concurrency: int, requests: int
+) -> dict:
+    payload = {"blob": "x" * size}
+
+    await run_requests(transport, payload, min(requests, 100), concurrency)
+    elapsed, latencies = await run_requests(transport, payload, requests, concurrency)
+    memory = await measure_memory(
+        transport, payload, min(requests, 10 * concurrency), concurrency
+    )
+
+    return {
+        "payload_bytes": size,
+        "concurrency": concurrency,
+        "requests": requests,
+        "ops_per_sec": requests / elapsed,
+        "p50_ms": percentile(latencies, 0.5) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "memory_per_request_bytes": memory,
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main(args: argparse.Namespace) -> dict:
+    results = []
+    skipped = {}
+
+    for name in args.transports:
+        try:
+            async with TARGETS[name]() as transport:
+                for size in args.sizes:
+                    for concurrency in args.concurrency:
+                        result = await bench_case(
+                            transport, size, concurrency, args.requests
+                        )
+                        results.append({"transport": name, **result})
+                        print(
+                            f"{name:<9} {size:>8}B  c={concurrency:<4} "
+                            f"{result['ops_per_sec']:>10.0f} ops/s  "
+                            f"p50={result['p50_ms']:.3f}ms  "
+                            f"p99={result['p99_ms']:.3f}ms  "
+                            f"mem={result['memory_per_request_bytes']:.0f}B/req",
+                            file=sys.stderr,
+                        )
+        except Unavailable as e:
+            skipped[name] = str(e)
+            print(f"{name:<9} skipped: {e}", file=sys.stderr)
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "requests": args.requests,
+        },
+        "skipped": skipped,
+        "results": results,
+    }
+
+
+def int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",")]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--transports",
+        type=lambda value: value.split(","),
+        default=list(TARGETS),
+        help=f"comma separated, from: {', '.join(TARGETS)}",
+    )
+    parser.add_argument("--sizes", type=int_list, default=[64, 4096, 65536])
+    parser.add_argument("--concurrency", type=int_list, default=[1, 16, 128])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--output", help="write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.transports) - set(TARGETS)
+    if unknown:
+        parser.error(f"unknown transports: {', '.join(sorted(unknown))}")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
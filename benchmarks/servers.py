@@ -0,0 +1,236 @@
+"""
+Local stand-ins for the NestJS side of each transport. Every server answers
+a request by echoing its `data` back as the response, using the same reply
+envelope as a NestJS microservice.
+"""
+
+import asyncio
+import json
+import shutil
+import socket
+import subprocess
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from itertools import count
+from types import SimpleNamespace
+
+from nest_rpc_client.config.nats import NATSConfig
+from nest_rpc_client.config.rabbitmq import RabbitMQConfig
+from nest_rpc_client.config.redis import RedisConfig
+from nest_rpc_client.config.tcp import TCPConfig, TCPPoolConfig
+from nest_rpc_client.transport import Transport
+from nest_rpc_client.utils.frame import FrameDecoder, encode_frame
+
+
+class Unavailable(Exception):
+    pass
+
+
+def echo_reply(packet: dict) -> dict:
+    return {"id": packet["id"], "response": packet["data"], "isDisposed": True}
+
+
+async def start_tcp_echo_server() -> asyncio.Server:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        decoder = FrameDecoder()
+        while chunk := await reader.read(65536):
+            frames = []
+            for frame in decoder.feed(chunk):
+                packet = json.loads(frame)
+                if "id" in packet:
+                    frames.append(encode_frame(json.dumps(echo_reply(packet)).encode()))
+            writer.writelines(frames)
+            await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+@asynccontextmanager
+async def tcp_target() -> AsyncIterator[Transport]:
+    from nest_rpc_client.transports.tcp import TCPTransport
+
+    server = await start_tcp_echo_server()
+    port = server.sockets[0].getsockname()[1]
+    transport = TCPTransport(TCPConfig("127.0.0.1", port))
+    await transport.connect()
+    try:
+        yield transport
+    finally:
+        await transport.close()
+        server.close()
+
+
+@asynccontextmanager
+async def tcp_pool_target() -> AsyncIterator[Transport]:
+    from nest_rpc_client.transports.tcp_pool import TCPPoolTransport
+
+    server = await start_tcp_echo_server()
+    port = server.sockets[0].getsockname()[1]
+    transport = TCPPoolTransport(TCPPoolConfig("127.0.0.1", port, pool_size=4))
+    await transport.connect()
+    try:
+        yield transport
+    finally:
+        await transport.close()
+        server.close()
+
+
+@asynccontextmanager
+async def redis_target() -> AsyncIterator[Transport]:
+    try:
+        import fakeredis
+    except ImportError:
+        raise Unavailable("fakeredis is not installed")
+
+    from nest_rpc_client.transports.redis import RedisTransport
+
+    server = fakeredis.FakeServer()
+    responder = fakeredis.FakeAsyncRedis(server=server)
+    pubsub = responder.pubsub()
+    await pubsub.psubscribe("*")
+
+    async def respond():
+        async for msg in pubsub.listen():
+            if msg["type"] != "pmessage" or msg["channel"].endswith(b".reply"):
+                continue
+            packet = json.loads(msg["data"])
+            if "id" in packet:
+                await responder.publish(
+                    f"{packet['pattern']}.reply", json.dumps(echo_reply(packet))
+                )
+
+    task = asyncio.create_task(respond())
+
+    # Skip connect(): it would open a real connection to host/port.
+    transport = RedisTransport(RedisConfig("", 0))
+    transport.client = fakeredis.FakeAsyncRedis(server=server)
+    try:
+        yield transport
+    finally:
+        await transport.close()
+        task.cancel()
+        await pubsub.aclose()
+        await responder.aclose()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def nats_target() -> AsyncIterator[Transport]:
+    binary = shutil.which("nats-server")
+    if binary is None:
+        raise Unavailable("nats-server is not on PATH")
+
+    import nats
+
+    from nest_rpc_client.transports.nats import NATSTransport
+
+    port = free_port()
+    process = subprocess.Popen(
+        [binary, "-a", "127.0.0.1", "-p", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"nats://127.0.0.1:{port}"
+    try:
+        for _ in range(50):
+            try:
+                responder = await nats.connect(url)
+                break
+            except Exception:
+                await asyncio.sleep(0.1)
+        else:
+            raise Unavailable("nats-server did not start")
+
+        async def respond(msg):
+            await msg.respond(json.dumps(echo_reply(json.loads(msg.data))).encode())
+
+        await responder.subscribe("echo", cb=respond)
+
+        transport = NATSTransport(NATSConfig([url]))
+        await transport.connect()
+        try:
+            yield transport
+        finally:
+            await transport.close()
+            await responder.close()
+    finally:
+        process.terminate()
+        process.wait()
+
+
+class InMemoryQueue:
+    def __init__(self, name: str):
+        self.name = name
+        self.callback: Callable | None = None
+
+    async def consume(self, callback: Callable, no_ack: bool = False) -> None:
+        self.callback = callback
+
+
+class InMemoryExchange:
+    def __init__(self, channel: "InMemoryChannel"):
+        self.channel = channel
+
+    async def publish(self, message, routing_key: str) -> None:
+        if not message.reply_to:
+            return
+
+        packet = json.loads(message.body)
+        reply = SimpleNamespace(
+            correlation_id=message.correlation_id,
+            body=json.dumps(echo_reply(packet)).encode(),
+        )
+        callback = self.channel.queues[message.reply_to].callback
+        asyncio.get_running_loop().call_soon(
+            lambda: asyncio.ensure_future(callback(reply))
+        )
+
+
+class InMemoryChannel:
+    """
+    The part of an aio_pika channel used by `RabbitMQTransport`, with a
+    responder bound to the default exchange.
+    """
+
+    def __init__(self):
+        self.default_exchange = InMemoryExchange(self)
+        self.queues: dict[str, InMemoryQueue] = {}
+        self._ids = count()
+
+    async def declare_queue(self, exclusive: bool = False) -> InMemoryQueue:
+        queue = InMemoryQueue(f"amq.gen-{next(self._ids)}")
+        self.queues[queue.name] = queue
+        return queue
+
+    async def close(self) -> None:
+        pass
+
+
+@asynccontextmanager
+async def rabbitmq_target() -> AsyncIterator[Transport]:
+    from nest_rpc_client.transports.rabbitmq import RabbitMQTransport
+
+    # Mirror connect() on top of the in-memory channel.
+    transport = RabbitMQTransport(RabbitMQConfig(url="", queue="rpc_queue"))
+    transport.channel = InMemoryChannel()  # type: ignore
+    transport.reply_queue = await transport.channel.declare_queue(exclusive=True)
+    await transport.reply_queue.consume(transport._on_reply, no_ack=True)
+    try:
+        yield transport
+    finally:
+        await transport.close()
+
+
+TARGETS = {
+    "tcp": tcp_target,
+    "tcp-pool": tcp_pool_target,
+    "redis": redis_target,
+    "nats": nats_target,
+    "rabbitmq": rabbitmq_target,
+}
@@ -1,9 +1,28 @@
+from collections.abc import AsyncIterator, Sequence
+from contextvars import ContextVar
+from typing import Any
+
+from .interceptor import Interceptor, compile_chain
+from .pattern import PatternLike
 from .transport import Transport
+from .utils.batch import BatchItems, run_bounded
+from .utils.decode import decode_response
+
+# Interceptors call `call_next(pattern, data)`, so the `timeout` of the
+# `send` call in progress reaches the end of the chain through this.
+_send_timeout: ContextVar[float | None] = ContextVar("send_timeout", default=None)
 
 
 class Client:
-    def __init__(self, transport: Transport):
+    def __init__(self, transport: Transport, interceptors: Sequence[Interceptor] = ()):
         self.transport = transport
+        self.interceptors = tuple(interceptors)
+        self._send = compile_chain(
+            self.interceptors, "intercept_send", self._send_to_transport
+        )
+        if self._send == self._send_to_transport:
+            self._send = transport.send
+        self._emit = compile_chain(self.interceptors, "intercept_emit", transport.emit)
 
     async def connect(self) -> None:
         await self.transport.connect()
@@ -11,11 +30,90 @@ class Client:
     async def close(self) -> None:
         await self.transport.close()
 
-    async def send(self, pattern: str, data: dict) -> dict:
-        return await self.transport.send(pattern, data)
+    async def send(
+        self,
+        pattern: PatternLike,
+        data: dict,
+        timeout: float | None = None,
+        *,
+        response_type: Any = None,
+    ) -> Any:
+        """
+        Send a request and return its reply. With `response_type` (a
+        dataclass, TypedDict, msgspec `Struct`, pydantic model or a container
+        of them) the reply is converted into it by a decoder compiled once
+        per type, raising `ResponseDecodeError` if it does not fit. Without
+        interceptors the transport's `send_typed` is used, so serializers that
+        support it decode the reply in the same pass that parses it.
+        """
+        # The timeout is handed to the transport rather than enforced here,
+        # so wrapping transports see `RpcTimeoutError` instead of a
+        # cancellation.
+        if self._send == self.transport.send:
+            if response_type is not None:
+                return await self.transport.send_typed(
+                    pattern, data, response_type, timeout
+                )
+            response = await self.transport.send(pattern, data, timeout)
+        else:
+            token = _send_timeout.set(timeout)
+            try:
+                response = await self._send(pattern, data)
+            finally:
+                _send_timeout.reset(token)
+        if response_type is None:
+            return response
+        return decode_response(response, response_type)
+
+    async def emit(self, pattern: PatternLike, data: dict) -> None:
+        return await self._emit(pattern, data)
+
+    async def _send_to_transport(self, pattern: PatternLike, data: dict) -> Any:
+        return await self.transport.send(pattern, data, _send_timeout.get())
+
+    def stream(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> AsyncIterator[Any]:
+        # Interceptors wrap single replies and are not applied to streams.
+        return self.transport.stream(pattern, data, timeout)
+
+    def send_many(
+        self,
+        items: BatchItems,
+        *,
+        concurrency: int = 100,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[tuple[int, Any]]:
+        # Without interceptors the transport's native batched path can be used.
+        if self._send == self.transport.send:
+            return self.transport.send_many(
+                items,
+                concurrency=concurrency,
+                ordered=ordered,
+                return_exceptions=return_exceptions,
+            )
+        return run_bounded(
+            self._send,
+            items,
+            concurrency=concurrency,
+            ordered=ordered,
+            return_exceptions=return_exceptions,
+        )
+
+    async def emit_many(self, items: BatchItems, *, concurrency: int = 100) -> None:
+        if self._emit == self.transport.emit:
+            await self.transport.emit_many(items, concurrency=concurrency)
+            return
 
-    async def emit(self, pattern: str, data: dict) -> None:
-        return await self.transport.emit(pattern, data)
+        async for _ in run_bounded(
+            self._emit,
+            items,
+            concurrency=concurrency,
+            ordered=False,
+            return_exceptions=False,
+        ):
+            pass
 
     async def __aenter__(self):
         await self.connect()
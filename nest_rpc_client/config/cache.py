@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class CachePolicy:
+    ttl: float
+    max_size: int = 1024
+    cache_errors: bool = False
+
+
+@dataclass
+class CacheConfig:
+    policies: dict[str, CachePolicy] = field(default_factory=dict)
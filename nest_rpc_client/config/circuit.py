@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+
+from ..exceptions.timeout import RpcTimeoutError
+
+
+@dataclass
+class CircuitBreakerConfig:
+    failure_rate: float = 0.5
+    minimum_requests: int = 20
+    window: float = 10.0
+    open_duration: float = 5.0
+    half_open_requests: int = 1
+    trip_on: tuple[type[BaseException], ...] = (ConnectionError, RpcTimeoutError)
+    patterns: set[str] | None = field(default=None)
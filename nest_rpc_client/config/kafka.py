@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+
+from ..pattern import PatternLike
+from ..serializer import Serializer
+from ..serializers.json import JSONSerializer
+
+
+@dataclass
+class KafkaConfig:
+    bootstrap_servers: str | list[str]
+    reply_patterns: list[PatternLike] = field(default_factory=list)
+    client_id: str = "nest-rpc-client"
+    response_timeout: float | None = None
+    serializer: Serializer = field(default_factory=JSONSerializer)
+    reply_partition: int = 0
+    linger_ms: int = 5
+    max_batch_size: int = 16384
+    compression_type: str | None = None
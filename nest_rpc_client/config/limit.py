@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class AIMDLimit:
+    """
+    Add one slot while the limit is in use and requests succeed; multiply the
+    limit by `backoff_ratio` on a timeout, a connection error or a request
+    slower than `latency_threshold`.
+    """
+
+    backoff_ratio: float = 0.9
+    latency_threshold: float | None = None
+
+
+@dataclass
+class GradientLimit:
+    """
+    Scale the limit by the ratio of the long-term average latency to the
+    latest one, so that growing latency (queueing on the server) shrinks it.
+    """
+
+    smoothing: float = 0.2
+    long_window: int = 600
+    tolerance: float = 1.5
+
+
+@dataclass
+class LimitConfig:
+    max_in_flight: int = 1000
+    pattern_limits: dict[str, int] = field(default_factory=dict)
+    adaptive: AIMDLimit | GradientLimit | None = None
+    min_limit: int = 1
+    initial_limit: int | None = None
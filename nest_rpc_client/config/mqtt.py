@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+
+from ..serializer import Serializer
+from ..serializers.json import JSONSerializer
+
+
+@dataclass
+class MQTTConfig:
+    host: str
+    port: int = 1883
+    username: str | None = None
+    password: str | None = None
+    client_id: str | None = None
+    response_timeout: float | None = None
+    serializer: Serializer = field(default_factory=JSONSerializer)
+    qos: int = 1
+    emit_qos: int = 0
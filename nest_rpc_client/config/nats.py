@@ -1,7 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from ..serializer import Serializer
+from ..serializers.json import JSONSerializer
 
 
 @dataclass
 class NATSConfig:
     servers: list[str]
-    response_timeout: int = 10
+    response_timeout: float = 10
+    serializer: Serializer = field(default_factory=JSONSerializer)
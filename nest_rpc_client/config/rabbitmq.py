@@ -1,7 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from ..serializer import Serializer
+from ..serializers.json import JSONSerializer
 
 
 @dataclass
 class RabbitMQConfig:
     url: str
     queue: str
+    response_timeout: float | None = None
+    serializer: Serializer = field(default_factory=JSONSerializer)
+    emit_linger: float | None = None
+    emit_batch_size: int = 100
+    stream_buffer: int = 100
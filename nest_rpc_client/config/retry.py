@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+
+from ..exceptions.timeout import RpcTimeoutError
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 3
+    initial_backoff: float = 0.05
+    max_backoff: float = 2.0
+    multiplier: float = 2.0
+    jitter: float = 0.2
+    retry_on: tuple[type[BaseException], ...] = (ConnectionError, RpcTimeoutError)
+
+
+@dataclass
+class HedgePolicy:
+    delay: float | None = None
+    quantile: float = 0.95
+    initial_delay: float = 0.05
+    min_delay: float = 0.001
+    window: int = 1000
+
+
+@dataclass
+class RetryConfig:
+    default: RetryPolicy | None = field(default_factory=RetryPolicy)
+    policies: dict[str, RetryPolicy] = field(default_factory=dict)
+    hedging: dict[str, HedgePolicy] = field(default_factory=dict)
+    budget_ratio: float = 0.1
+    budget_min_per_second: float = 10.0
+    budget_burst: float = 100.0
@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+
+from ..exceptions.circuit import CircuitOpenError
+from ..exceptions.timeout import RpcTimeoutError
+from ..transport import Transport
+
+
+@dataclass
+class Route:
+    transport: Transport
+    fallback: Transport | None = None
+    fallback_on: tuple[type[BaseException], ...] = (
+        ConnectionError,
+        RpcTimeoutError,
+        CircuitOpenError,
+    )
+
+
+@dataclass
+class RouterConfig:
+    routes: dict[str, Transport | Route] = field(default_factory=dict)
+    default: Transport | Route | None = None
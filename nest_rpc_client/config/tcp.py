@@ -1,7 +1,39 @@
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from ..pattern import PatternLike
+from ..serializer import Serializer
+from ..serializers.json import JSONSerializer
+from .circuit import CircuitBreakerConfig
 
 
 @dataclass
 class TCPConfig:
     host: str
     port: int
+    response_timeout: float | None = None
+    serializer: Serializer = field(default_factory=JSONSerializer)
+    emit_linger: float | None = None
+    emit_batch_size: int = 100
+    stream_buffer: int = 100
+
+
+@dataclass
+class TCPPoolConfig(TCPConfig):
+    pool_size: int = 4
+    reconnect_delay: float = 1.0
+    circuit_breaker: CircuitBreakerConfig | None = None
+
+
+@dataclass
+class TCPClusterConfig:
+    endpoints: list[TCPConfig]
+    strategy: Literal[
+        "round_robin", "least_outstanding", "ewma", "consistent_hash"
+    ] = "least_outstanding"
+    hash_key: Callable[[PatternLike, Any], Any] | None = None
+    virtual_nodes: int = 100
+    ewma_alpha: float = 0.3
+    eject_after: int = 3
+    probe_interval: float = 1.0
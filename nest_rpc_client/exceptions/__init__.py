@@ -0,0 +1,13 @@
+from .circuit import CircuitOpenError
+from .decode import ResponseDecodeError
+from .rpc import RpcException
+from .stream import StreamOverflowError
+from .timeout import RpcTimeoutError
+
+__all__ = [
+    "CircuitOpenError",
+    "ResponseDecodeError",
+    "RpcException",
+    "RpcTimeoutError",
+    "StreamOverflowError",
+]
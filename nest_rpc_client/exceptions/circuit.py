@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class CircuitOpenError(Exception):
+    circuit: str
+    retry_after: float
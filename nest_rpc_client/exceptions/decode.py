@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class ResponseDecodeError(ValueError):
+    response_type: Any
+    reason: str
@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class RpcTimeoutError(TimeoutError):
+    pattern: str
+    timeout: float
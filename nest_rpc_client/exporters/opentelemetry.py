@@ -0,0 +1,62 @@
+from opentelemetry import metrics
+from opentelemetry.metrics import Meter
+
+from ..metrics import Metrics, RequestSample
+
+
+class OpenTelemetryMetrics(Metrics):
+    enabled = True
+
+    def __init__(self, meter: Meter | None = None):
+        meter = meter or metrics.get_meter("nest_rpc_client")
+
+        self.requests = meter.create_counter(
+            "rpc.client.requests", description="RPC requests sent"
+        )
+        self.errors = meter.create_counter(
+            "rpc.client.errors", description="RPC requests that raised"
+        )
+        self.in_flight = meter.create_up_down_counter(
+            "rpc.client.in_flight", description="RPC requests awaiting a reply"
+        )
+        self.latency = meter.create_histogram(
+            "rpc.client.duration",
+            unit="s",
+            description="RPC request latency by phase (encode, wire, decode, total)",
+        )
+        self.events = meter.create_counter(
+            "rpc.client.events", description="Events emitted"
+        )
+        self.bytes = meter.create_counter(
+            "rpc.client.bytes", unit="By", description="Message bytes sent and received"
+        )
+        self.circuit_transitions = meter.create_counter(
+            "rpc.client.circuit_transitions",
+            description="Circuit breaker state changes",
+        )
+
+    def request_started(self, pattern: str) -> None:
+        attributes = {"pattern": pattern}
+        self.requests.add(1, attributes)
+        self.in_flight.add(1, attributes)
+
+    def request_finished(
+        self, sample: RequestSample, error: BaseException | None
+    ) -> None:
+        attributes = {"pattern": sample.pattern}
+        self.in_flight.add(-1, attributes)
+        if error is not None:
+            self.errors.add(1, {**attributes, "error": type(error).__name__})
+
+        for phase in ("encode", "wire", "decode", "total"):
+            self.latency.record(getattr(sample, phase), {**attributes, "phase": phase})
+        self.bytes.add(sample.bytes_out, {**attributes, "direction": "out"})
+        self.bytes.add(sample.bytes_in, {**attributes, "direction": "in"})
+
+    def event_emitted(self, pattern: str, bytes_out: int) -> None:
+        attributes = {"pattern": pattern}
+        self.events.add(1, attributes)
+        self.bytes.add(bytes_out, {**attributes, "direction": "out"})
+
+    def circuit_state_changed(self, circuit: str, state: str) -> None:
+        self.circuit_transitions.add(1, {"circuit": circuit, "state": state})
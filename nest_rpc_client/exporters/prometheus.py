@@ -0,0 +1,92 @@
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
+
+from ..metrics import DEFAULT_BUCKETS, Metrics, RequestSample
+
+_CIRCUIT_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+class PrometheusMetrics(Metrics):
+    enabled = True
+
+    def __init__(
+        self,
+        namespace: str = "nest_rpc_client",
+        registry: CollectorRegistry = REGISTRY,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.requests = Counter(
+            "requests",
+            "RPC requests sent",
+            ["pattern"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.errors = Counter(
+            "request_errors",
+            "RPC requests that raised",
+            ["pattern"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.in_flight = Gauge(
+            "requests_in_flight",
+            "RPC requests awaiting a reply",
+            ["pattern"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.latency = Histogram(
+            "request_phase_seconds",
+            "RPC request latency by phase (encode, wire, decode, total)",
+            ["pattern", "phase"],
+            namespace=namespace,
+            registry=registry,
+            buckets=buckets,
+        )
+        self.events = Counter(
+            "events",
+            "Events emitted",
+            ["pattern"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.bytes = Counter(
+            "bytes",
+            "Message bytes sent and received",
+            ["pattern", "direction"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.circuits = Gauge(
+            "circuit_state",
+            "Circuit breaker state (0 closed, 1 half open, 2 open)",
+            ["circuit"],
+            namespace=namespace,
+            registry=registry,
+        )
+
+    def request_started(self, pattern: str) -> None:
+        self.requests.labels(pattern).inc()
+        self.in_flight.labels(pattern).inc()
+
+    def request_finished(
+        self, sample: RequestSample, error: BaseException | None
+    ) -> None:
+        pattern = sample.pattern
+        self.in_flight.labels(pattern).dec()
+        if error is not None:
+            self.errors.labels(pattern).inc()
+
+        self.latency.labels(pattern, "encode").observe(sample.encode)
+        self.latency.labels(pattern, "wire").observe(sample.wire)
+        self.latency.labels(pattern, "decode").observe(sample.decode)
+        self.latency.labels(pattern, "total").observe(sample.total)
+        self.bytes.labels(pattern, "out").inc(sample.bytes_out)
+        self.bytes.labels(pattern, "in").inc(sample.bytes_in)
+
+    def event_emitted(self, pattern: str, bytes_out: int) -> None:
+        self.events.labels(pattern).inc()
+        self.bytes.labels(pattern, "out").inc(bytes_out)
+
+    def circuit_state_changed(self, circuit: str, state: str) -> None:
+        self.circuits.labels(circuit).set(_CIRCUIT_STATES[state])
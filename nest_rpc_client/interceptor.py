@@ -0,0 +1,44 @@
+from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
+from typing import Any
+
+from .pattern import PatternLike
+
+SendHandler = Callable[[PatternLike, Any], Awaitable[Any]]
+EmitHandler = Callable[[PatternLike, Any], Awaitable[None]]
+
+
+class Interceptor:
+    """
+    Hook around `Client.send` and `Client.emit`.
+
+    Override `intercept_send` and/or `intercept_emit`. Call `call_next` to
+    continue down the chain (optionally with a different pattern or data),
+    skip it to short-circuit, and inspect or replace its result afterwards.
+    """
+
+    async def intercept_send(
+        self, pattern: PatternLike, data: Any, call_next: SendHandler
+    ) -> Any:
+        return await call_next(pattern, data)
+
+    async def intercept_emit(
+        self, pattern: PatternLike, data: Any, call_next: EmitHandler
+    ) -> None:
+        await call_next(pattern, data)
+
+
+def compile_chain(
+    interceptors: Sequence[Interceptor], method: str, handler: Callable
+) -> Callable:
+    """
+    Wrap `handler` with the `method` hook of every interceptor, the first
+    interceptor being the outermost. Interceptors that do not override the
+    hook are left out of the chain.
+    """
+    default = getattr(Interceptor, method)
+    for interceptor in reversed(interceptors):
+        if getattr(type(interceptor), method) is default:
+            continue
+        handler = partial(getattr(interceptor, method), call_next=handler)
+    return handler
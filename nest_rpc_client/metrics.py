@@ -0,0 +1,192 @@
+import bisect
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
+
+from .pattern import Pattern, PatternLike, as_pattern
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class RequestSample:
+    """
+    Timings and sizes of one `send` call, split into the encode phase
+    (building the envelope), the wire phase (until the reply is received)
+    and the decode phase (parsing the reply). `total` is the wall-clock time
+    of the whole call. A call that ends without a reply, such as a timeout,
+    spends everything after encoding on the wire.
+    """
+
+    __slots__ = (
+        "pattern",
+        "started",
+        "encode",
+        "wire",
+        "decode",
+        "bytes_out",
+        "bytes_in",
+        "_encoded_at",
+        "_finished_at",
+        "_replied",
+    )
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.started = perf_counter()
+        self.encode = 0.0
+        self.wire = 0.0
+        self.decode = 0.0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self._encoded_at = self.started
+        self._finished_at: float | None = None
+        self._replied = False
+
+    @property
+    def total(self) -> float:
+        finished_at = self._finished_at
+        if finished_at is None:
+            finished_at = perf_counter()
+        return finished_at - self.started
+
+    def encoded(self, bytes_out: int) -> None:
+        self._encoded_at = perf_counter()
+        self.encode = self._encoded_at - self.started
+        self.bytes_out = bytes_out
+
+    def replied(self, bytes_in: int, decode: float) -> None:
+        """
+        Record a reply of `bytes_in` bytes that took `decode` seconds to parse
+        and was parsed just now.
+        """
+        self.decode = decode
+        self.wire = max(perf_counter() - decode - self._encoded_at, 0.0)
+        self.bytes_in = bytes_in
+        self._replied = True
+
+    def finished(self) -> None:
+        self._finished_at = perf_counter()
+        if not self._replied:
+            self.wire = self._finished_at - self._encoded_at
+
+
+class Metrics:
+    """
+    Hook interface transports report to. This base class records nothing;
+    transports check `enabled` before measuring anything, so the default
+    costs a single attribute lookup per call.
+    """
+
+    enabled: bool = False
+
+    def request_started(self, pattern: str) -> None:
+        pass
+
+    def request_finished(
+        self, sample: RequestSample, error: BaseException | None
+    ) -> None:
+        pass
+
+    def event_emitted(self, pattern: str, bytes_out: int) -> None:
+        pass
+
+    def circuit_state_changed(self, circuit: str, state: str) -> None:
+        pass
+
+    async def measure_request(
+        self,
+        pattern: PatternLike,
+        data: Any,
+        send: Callable[[Pattern, Any, RequestSample | None], Awaitable[Any]],
+    ) -> Any:
+        pattern = as_pattern(pattern)
+        sample = RequestSample(pattern.route)
+        self.request_started(pattern.route)
+        try:
+            result = await send(pattern, data, sample)
+        except BaseException as e:
+            sample.finished()
+            self.request_finished(sample, e)
+            raise
+        sample.finished()
+        self.request_finished(sample, None)
+        return result
+
+
+NO_METRICS = Metrics()
+
+
+@dataclass
+class PatternStats:
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    events: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    latency: dict[str, list[int]] = field(default_factory=dict)
+
+
+class InMemoryMetrics(Metrics):
+    """
+    Keeps per-pattern counters and bucketed latency histograms (one per
+    phase: `encode`, `wire`, `decode` and `total`) in memory.
+    """
+
+    enabled = True
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.patterns: dict[str, PatternStats] = {}
+        self.circuits: dict[str, str] = {}
+
+    def stats(self, pattern: str) -> PatternStats:
+        stats = self.patterns.get(pattern)
+        if stats is None:
+            stats = self.patterns[pattern] = PatternStats()
+        return stats
+
+    def request_started(self, pattern: str) -> None:
+        stats = self.stats(pattern)
+        stats.requests += 1
+        stats.in_flight += 1
+
+    def request_finished(
+        self, sample: RequestSample, error: BaseException | None
+    ) -> None:
+        stats = self.stats(sample.pattern)
+        stats.in_flight -= 1
+        stats.bytes_out += sample.bytes_out
+        stats.bytes_in += sample.bytes_in
+        if error is not None:
+            stats.errors += 1
+
+        for phase in ("encode", "wire", "decode", "total"):
+            counts = stats.latency.get(phase)
+            if counts is None:
+                counts = stats.latency[phase] = [0] * (len(self.buckets) + 1)
+            counts[bisect.bisect_left(self.buckets, getattr(sample, phase))] += 1
+
+    def event_emitted(self, pattern: str, bytes_out: int) -> None:
+        stats = self.stats(pattern)
+        stats.events += 1
+        stats.bytes_out += bytes_out
+
+    def circuit_state_changed(self, circuit: str, state: str) -> None:
+        self.circuits[circuit] = state
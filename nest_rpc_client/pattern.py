@@ -0,0 +1,148 @@
+import json
+import math
+import unicodedata
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any, TypeAlias
+
+_MAX_INTERNED = 10_000
+
+
+def _route(value: Any) -> str:
+    # Mirrors NestJS `transformPatternToRoute`: object keys are sorted with
+    # `localeCompare`, string values are written quoted but unescaped and
+    # everything else as JavaScript's `String()` would write it.
+    if isinstance(value, (dict, list)):
+        if isinstance(value, list):
+            value = {str(index): item for index, item in enumerate(value)}
+        params = []
+        for key in sorted(value, key=_collation_key):
+            item = value[key]
+            route = f'"{item}"' if isinstance(item, str) else _route(item)
+            params.append(f'"{key}":{route}')
+        return "{" + ",".join(params) + "}"
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return _js_number(value)
+    return str(value)
+
+
+# ICU's order of whitespace and ASCII punctuation, which all sort before
+# digits and letters. Other symbols follow them by code point.
+_PUNCTUATION_ORDER = {
+    char: rank
+    for rank, char in enumerate("\t\n\v\f\r _-,;:!?.'\"()[]{}@*/\\&#%`^+<=>|~$")
+}
+
+
+def _collation_key(text: str) -> tuple:
+    # Approximates the ICU root collation behind `localeCompare`: symbols
+    # and punctuation sort before digits and digits before letters. Letters
+    # compare case-insensitively, then by accents, then lowercase first.
+    decomposed = unicodedata.normalize("NFD", text)
+    base = "".join(char for char in decomposed if not unicodedata.combining(char))
+    primary = tuple(_primary_weight(char) for char in base.casefold())
+    return primary, decomposed.casefold(), tuple(char.isupper() for char in base)
+
+
+def _primary_weight(char: str) -> tuple[int, Any]:
+    if char.isalpha():
+        return 2, char
+    if char.isnumeric():
+        return 1, char
+    return 0, _PUNCTUATION_ORDER.get(char, len(_PUNCTUATION_ORDER) + ord(char))
+
+
+def _js_number(value: float) -> str:
+    # Lays out the shortest round-trip digits like `Number.prototype.toString`.
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    if value == 0:
+        return "0"
+    sign = "-" if value < 0 else ""
+    _, digit_tuple, exponent = Decimal(repr(abs(value))).normalize().as_tuple()
+    digits = "".join(map(str, digit_tuple))
+    point = exponent + len(digits)  # type: ignore[operator]
+    if len(digits) <= point <= 21:
+        return f"{sign}{digits}{'0' * (point - len(digits))}"
+    if 0 < point <= 21:
+        return f"{sign}{digits[:point]}.{digits[point:]}"
+    if -6 < point <= 0:
+        return f"{sign}0.{'0' * -point}{digits}"
+    mantissa = digits[0] + (f".{digits[1:]}" if len(digits) > 1 else "")
+    return f"{sign}{mantissa}e{point - 1:+d}"
+
+
+class Pattern:
+    """
+    A message pattern: a string (`"get_user"`) or a NestJS object pattern
+    (`{"cmd": "get_user"}`). Strings holding a JSON object are treated as
+    object patterns.
+
+    `route` is the canonical string NestJS registers handlers under and
+    uses as the channel, subject or topic name. Serializers cache the
+    constant parts of the encoded envelope on the pattern (see `template`),
+    so a long-lived `Pattern` is encoded only once.
+    """
+
+    __slots__ = ("value", "route", "_templates")
+
+    def __init__(self, value: "str | dict | Pattern"):
+        if isinstance(value, Pattern):
+            value = value.value
+        if isinstance(value, str) and value.startswith("{"):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+        self.value: str | dict = value
+        self.route = _route(value)
+        self._templates: dict[Any, Any] = {}
+
+    def template(self, key: Any, build: Callable[["Pattern"], Any]) -> Any:
+        """Return the cached `build(self)`, building it once per `key`."""
+        template = self._templates.get(key)
+        if template is None:
+            template = self._templates[key] = build(self)
+        return template
+
+    def __str__(self) -> str:
+        return self.route
+
+    def __repr__(self) -> str:
+        return f"Pattern({self.value!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Pattern):
+            return self.route == other.route
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.route)
+
+
+PatternLike: TypeAlias = str | dict | Pattern
+
+_interned: dict[str, Pattern] = {}
+
+
+def as_pattern(pattern: PatternLike) -> Pattern:
+    """
+    Return `pattern` as a `Pattern`. String patterns are interned, so their
+    route and envelope templates are also computed only once.
+    """
+    if isinstance(pattern, Pattern):
+        return pattern
+    if isinstance(pattern, str):
+        interned = _interned.get(pattern)
+        if interned is None:
+            if len(_interned) >= _MAX_INTERNED:
+                _interned.clear()
+            interned = _interned[pattern] = Pattern(pattern)
+        return interned
+    return Pattern(pattern)
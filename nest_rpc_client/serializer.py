@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from .pattern import Pattern
+from .utils.decode import decode_response
+
+
+class Serializer(ABC):
+    # Whether encoded envelopes can be arbitrary bytes rather than UTF-8 text.
+    binary: bool = False
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode a message envelope into bytes sent over the wire.
+        """
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes | str) -> Any:
+        """
+        Decode a reply received from the wire.
+        """
+        pass
+
+    def loads_reply(self, data: bytes | str, response_type: Any) -> Any:
+        """
+        Decode a reply envelope whose `response` is converted into
+        `response_type`, raising `ResponseDecodeError` if it does not fit.
+        Serializers that can validate while parsing override this to skip the
+        separate walk over the decoded reply.
+        """
+        reply = self.loads(data)
+        if "response" in reply and "err" not in reply:
+            reply["response"] = decode_response(reply["response"], response_type)
+        return reply
+
+    def encode_packet(
+        self, pattern: Pattern, data: Any, correlation_id: str | None = None
+    ) -> bytes:
+        """
+        Encode the `{id, pattern, data}` request envelope, or `{pattern, data}`
+        for an event when `correlation_id` is None.
+        Serializers can override this to splice `data` into a template cached
+        on the pattern instead of encoding the whole envelope.
+        """
+        if correlation_id is None:
+            return self.dumps({"pattern": pattern.value, "data": data})
+        return self.dumps(
+            {"id": correlation_id, "pattern": pattern.value, "data": data}
+        )
@@ -0,0 +1,31 @@
+import json
+from typing import Any
+
+from ..pattern import Pattern
+from ..serializer import Serializer
+
+
+class JSONSerializer(Serializer):
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def encode_packet(
+        self, pattern: Pattern, data: Any, correlation_id: str | None = None
+    ) -> bytes:
+        # Produces the same bytes as `dumps` of the full envelope.
+        request, event = pattern.template(type(self), self._templates)
+        if correlation_id is None:
+            return b"".join((event, self.dumps(data), b"}"))
+        return b"".join(
+            (b'{"id": "', correlation_id.encode(), request, self.dumps(data), b"}")
+        )
+
+    def _templates(self, pattern: Pattern) -> tuple[bytes, bytes]:
+        encoded = self.dumps(pattern.value)
+        return (
+            b'", "pattern": ' + encoded + b', "data": ',
+            b'{"pattern": ' + encoded + b', "data": ',
+        )
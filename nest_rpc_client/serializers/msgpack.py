@@ -0,0 +1,39 @@
+from typing import Any
+
+import msgpack
+
+from ..pattern import Pattern
+from ..serializer import Serializer
+
+# Map headers for 3 and 2 entries, and the packed "id" key.
+_REQUEST_HEAD = b"\x83" + msgpack.packb("id")
+_EVENT_HEAD = b"\x82"
+
+
+class MsgpackSerializer(Serializer):
+    """
+    MessagePack encoding. The NestJS side has to be configured with a matching
+    custom serializer/deserializer, and it cannot be used with `TCPTransport`,
+    whose framing requires text payloads.
+    """
+
+    binary = True
+
+    def dumps(self, obj: Any) -> bytes:
+        return msgpack.packb(obj, use_bin_type=True)
+
+    def loads(self, data: bytes | str) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+    def encode_packet(
+        self, pattern: Pattern, data: Any, correlation_id: str | None = None
+    ) -> bytes:
+        middle = pattern.template(type(self), self._template)
+        if correlation_id is None:
+            return b"".join((_EVENT_HEAD, middle, self.dumps(data)))
+        return b"".join(
+            (_REQUEST_HEAD, self.dumps(correlation_id), middle, self.dumps(data))
+        )
+
+    def _template(self, pattern: Pattern) -> bytes:
+        return self.dumps("pattern") + self.dumps(pattern.value) + self.dumps("data")
@@ -0,0 +1,88 @@
+from typing import Any, Generic, TypeVar
+
+import msgspec
+
+from ..pattern import Pattern
+from ..serializer import Serializer
+from ..utils.decode import get_decoder
+
+T = TypeVar("T")
+
+
+class _Reply(msgspec.Struct, Generic[T]):
+    response: T | msgspec.UnsetType = msgspec.UNSET
+    err: Any = msgspec.UNSET
+
+
+def _decode_other(tp: type, value: Any) -> Any:
+    # Types msgspec does not know, such as pydantic models, go through the
+    # decoders compiled by `get_decoder`.
+    return get_decoder(tp)(value)
+
+
+_reply_decoders: dict[Any, msgspec.json.Decoder | None] = {}
+
+
+def _reply_decoder(response_type: Any) -> msgspec.json.Decoder | None:
+    try:
+        return _reply_decoders[response_type]
+    except KeyError:
+        pass
+    try:
+        decoder = msgspec.json.Decoder(_Reply[response_type], dec_hook=_decode_other)
+    except TypeError:
+        decoder = None
+    _reply_decoders[response_type] = decoder
+    return decoder
+
+
+class MsgspecSerializer(Serializer):
+    """
+    JSON encoding with msgspec. Typed replies are validated and converted
+    while the envelope is parsed, without building an intermediate dict.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        return msgspec.json.encode(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return msgspec.json.decode(data)
+
+    def loads_reply(self, data: bytes | str, response_type: Any) -> Any:
+        decoder = _reply_decoder(response_type)
+        if decoder is None:
+            return super().loads_reply(data, response_type)
+        try:
+            reply = decoder.decode(data)
+        except msgspec.ValidationError:
+            # Replies that do not fit are parsed again, so they raise the same
+            # errors as with the other serializers.
+            return super().loads_reply(data, response_type)
+        if reply.err is not msgspec.UNSET:
+            return {"err": reply.err}
+        if reply.response is msgspec.UNSET:
+            return super().loads_reply(data, response_type)
+        return {"response": reply.response}
+
+    def encode_packet(
+        self, pattern: Pattern, data: Any, correlation_id: str | None = None
+    ) -> bytes:
+        request, event = pattern.template(type(self), self._templates)
+        if correlation_id is None:
+            return b"".join((event, msgspec.json.encode(data), b"}"))
+        return b"".join(
+            (
+                b'{"id":"',
+                correlation_id.encode(),
+                request,
+                msgspec.json.encode(data),
+                b"}",
+            )
+        )
+
+    def _templates(self, pattern: Pattern) -> tuple[bytes, bytes]:
+        encoded = msgspec.json.encode(pattern.value)
+        return (
+            b'","pattern":' + encoded + b',"data":',
+            b'{"pattern":' + encoded + b',"data":',
+        )
@@ -0,0 +1,31 @@
+from typing import Any
+
+import orjson
+
+from ..pattern import Pattern
+from ..serializer import Serializer
+
+
+class OrjsonSerializer(Serializer):
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def encode_packet(
+        self, pattern: Pattern, data: Any, correlation_id: str | None = None
+    ) -> bytes:
+        request, event = pattern.template(type(self), self._templates)
+        if correlation_id is None:
+            return b"".join((event, orjson.dumps(data), b"}"))
+        return b"".join(
+            (b'{"id":"', correlation_id.encode(), request, orjson.dumps(data), b"}")
+        )
+
+    def _templates(self, pattern: Pattern) -> tuple[bytes, bytes]:
+        encoded = orjson.dumps(pattern.value)
+        return (
+            b'","pattern":' + encoded + b',"data":',
+            b'{"pattern":' + encoded + b',"data":',
+        )
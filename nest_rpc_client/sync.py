@@ -0,0 +1,115 @@
+import asyncio
+import threading
+from collections.abc import Coroutine, Sequence
+from concurrent.futures import Future
+from typing import Any
+
+from .client import Client
+from .interceptor import Interceptor
+from .pattern import PatternLike
+from .transport import Transport
+
+
+class SyncClient:
+    """
+    Blocking facade over `Client` for synchronous code.
+
+    The client owns a background thread running a persistent event loop in
+    which the transport stays connected, so every call reuses the same
+    connections. All methods are safe to call from any number of threads.
+    """
+
+    def __init__(self, transport: Transport, interceptors: Sequence[Interceptor] = ()):
+        self.client = Client(transport, interceptors)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def transport(self) -> Transport:
+        return self.client.transport
+
+    def connect(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="nest-rpc-client", daemon=True
+            )
+            thread.start()
+            self._loop, self._thread = loop, thread
+            try:
+                self._submit(self.client.connect()).result()
+            except BaseException:
+                self._stop()
+                raise
+
+    def close(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                return
+            try:
+                self._submit(self.client.close()).result()
+            finally:
+                self._stop()
+
+    def send(
+        self,
+        pattern: PatternLike,
+        data: dict,
+        timeout: float | None = None,
+        *,
+        response_type: Any = None,
+    ) -> Any:
+        return self.send_future(
+            pattern, data, timeout, response_type=response_type
+        ).result()
+
+    def emit(self, pattern: PatternLike, data: dict) -> None:
+        self.emit_future(pattern, data).result()
+
+    def flush(self) -> None:
+        self._submit(self.client.transport.flush()).result()
+
+    def send_future(
+        self,
+        pattern: PatternLike,
+        data: dict,
+        timeout: float | None = None,
+        *,
+        response_type: Any = None,
+    ) -> Future:
+        return self._submit(
+            self.client.send(pattern, data, timeout, response_type=response_type)
+        )
+
+    def emit_future(self, pattern: PatternLike, data: dict) -> Future:
+        return self._submit(self.client.emit(pattern, data))
+
+    def _submit(self, coroutine: Coroutine) -> Future:
+        loop = self._loop
+        if loop is None:
+            coroutine.close()
+            raise ConnectionError("SyncClient is not connected")
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("SyncClient cannot be called from its own event loop")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+    def _stop(self) -> None:
+        loop, thread = self._loop, self._thread
+        self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
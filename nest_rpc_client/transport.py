@@ -1,8 +1,16 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any
 
+from .metrics import NO_METRICS, Metrics
+from .pattern import PatternLike
+from .utils.batch import BatchItems, run_bounded
+from .utils.decode import decode_response
+
 
 class Transport(ABC):
+    metrics: Metrics = NO_METRICS
+
     @abstractmethod
     async def connect(self) -> None:
         """
@@ -18,17 +26,90 @@ class Transport(ABC):
         pass
 
     @abstractmethod
-    async def send(self, pattern: str, data: dict) -> Any:
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> Any:
         """
         RPC-style request/response.
         Client expects a single reply
+        `timeout` overrides the transport's default response timeout;
+        exceeding it raises `RpcTimeoutError`.
         """
         pass
 
+    async def send_typed(
+        self,
+        pattern: PatternLike,
+        data: dict,
+        response_type: Any,
+        timeout: float | None = None,
+    ) -> Any:
+        """
+        `send` whose reply is converted into `response_type`, raising
+        `ResponseDecodeError` if it does not fit.
+        Transports can override this to decode the reply while parsing it.
+        """
+        return decode_response(await self.send(pattern, data, timeout), response_type)
+
     @abstractmethod
-    async def emit(self, pattern: str, data: dict) -> None:
+    async def emit(self, pattern: PatternLike, data: dict) -> None:
         """
         Fire-and-forget event.
         Client does not expect a reply.
         """
         pass
+
+    async def stream(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> AsyncIterator[Any]:
+        """
+        RPC request whose handler returns an `Observable`.
+        Yields every reply until NestJS marks the stream as disposed.
+        `timeout` applies to the wait for each reply.
+        Transports without native streaming yield the single `send` reply.
+        """
+        yield await self.send(pattern, data, timeout)
+
+    async def flush(self) -> None:
+        """
+        Write out any buffered events.
+        Transports that coalesce `emit` calls override this.
+        """
+        pass
+
+    async def send_many(
+        self,
+        items: BatchItems,
+        *,
+        concurrency: int = 100,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[tuple[int, Any]]:
+        """
+        Send many `(pattern, data)` requests with at most `concurrency` in flight.
+        Yields `(index, result)` pairs in input order, or in completion order
+        when `ordered` is False.
+        Transports can override this with a native batched implementation.
+        """
+        async for item in run_bounded(
+            self.send,
+            items,
+            concurrency=concurrency,
+            ordered=ordered,
+            return_exceptions=return_exceptions,
+        ):
+            yield item
+
+    async def emit_many(self, items: BatchItems, *, concurrency: int = 100) -> None:
+        """
+        Emit many `(pattern, data)` events with at most `concurrency` in flight.
+        Transports can override this with a native batched implementation.
+        """
+        async for _ in run_bounded(
+            self.emit,
+            items,
+            concurrency=concurrency,
+            ordered=False,
+            return_exceptions=False,
+        ):
+            pass
@@ -0,0 +1,110 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+from ..config.cache import CacheConfig, CachePolicy
+from ..exceptions.rpc import RpcException
+from ..pattern import Pattern, PatternLike, as_pattern
+from ..transport import Transport
+from ..utils.tasks import retrieve_exception
+from ..utils.timeout import with_timeout
+from .wrapper import WrapperTransport
+
+
+def cache_key(data: Any) -> bytes:
+    canonical = json.dumps(
+        data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+
+class CachingTransport(WrapperTransport):
+    """
+    Caches `send` replies for the patterns listed in `CacheConfig.policies`.
+
+    Entries expire after the policy TTL and are evicted in LRU order once a
+    pattern holds `max_size` of them. Concurrent identical requests share a
+    single call to the wrapped transport. Patterns without a policy, and all
+    events, go straight to the wrapped transport.
+
+    Cached replies are returned as-is, so every hit shares the same object;
+    callers must treat them as read-only. Cached errors are raised as a fresh
+    `RpcException` on each hit.
+    """
+
+    config: CacheConfig
+
+    def __init__(self, transport: Transport, config: CacheConfig):
+        super().__init__(transport)
+        self.config = config
+        self._policies = {
+            as_pattern(pattern).route: policy
+            for pattern, policy in config.policies.items()
+        }
+        self._entries: dict[str, OrderedDict[bytes, tuple[float, bool, Any]]] = {
+            route: OrderedDict() for route in self._policies
+        }
+        self._in_flight: dict[tuple[str, bytes], asyncio.Task] = {}
+
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> Any:
+        pattern = as_pattern(pattern)
+        policy = self._policies.get(pattern.route)
+        if policy is None:
+            return await self.transport.send(pattern, data, timeout)
+
+        key = cache_key(data)
+        entries = self._entries[pattern.route]
+        entry = entries.get(key)
+        if entry is not None:
+            expires_at, is_error, value = entry
+            if expires_at > time.monotonic():
+                entries.move_to_end(key)
+                if is_error:
+                    raise RpcException(value)
+                return value
+            del entries[key]
+
+        task = self._in_flight.get((pattern.route, key))
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(pattern, data, key, policy))
+            task.add_done_callback(retrieve_exception)
+            self._in_flight[(pattern.route, key)] = task
+
+        # The shared call keeps running if this caller times out, so other
+        # callers and the cache still get its result.
+        return await with_timeout(asyncio.shield(task), pattern, timeout)
+
+    def invalidate(self, pattern: PatternLike | None = None) -> None:
+        route = None if pattern is None else as_pattern(pattern).route
+        for name, entries in self._entries.items():
+            if route is None or name == route:
+                entries.clear()
+
+    async def _fetch(
+        self, pattern: Pattern, data: dict, key: bytes, policy: CachePolicy
+    ) -> Any:
+        try:
+            result = await self.transport.send(pattern, data)
+        except RpcException as e:
+            if policy.cache_errors:
+                self._store(pattern.route, key, policy, True, e.err)
+            raise
+        else:
+            self._store(pattern.route, key, policy, False, result)
+            return result
+        finally:
+            del self._in_flight[(pattern.route, key)]
+
+    def _store(
+        self, route: str, key: bytes, policy: CachePolicy, is_error: bool, value: Any
+    ) -> None:
+        entries = self._entries[route]
+        entries[key] = (time.monotonic() + policy.ttl, is_error, value)
+        entries.move_to_end(key)
+        while len(entries) > policy.max_size:
+            entries.popitem(last=False)
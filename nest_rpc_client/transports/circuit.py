@@ -0,0 +1,50 @@
+from typing import Any
+
+from ..config.circuit import CircuitBreakerConfig
+from ..exceptions.circuit import CircuitOpenError
+from ..pattern import PatternLike, as_pattern
+from ..transport import Transport
+from ..utils.circuit import CircuitBreaker, CircuitState
+from .wrapper import WrapperTransport
+
+
+class CircuitBreakerTransport(WrapperTransport):
+    """
+    Keeps a `CircuitBreaker` per pattern around `send`. While a pattern's
+    circuit is open, `send` raises `CircuitOpenError` immediately instead of
+    waiting for the degraded service to time out.
+    """
+
+    config: CircuitBreakerConfig
+
+    def __init__(self, transport: Transport, config: CircuitBreakerConfig):
+        super().__init__(transport)
+        self.config = config
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self._routes: set[str] | None = None
+        if config.patterns is not None:
+            self._routes = {as_pattern(pattern).route for pattern in config.patterns}
+
+    def states(self) -> dict[str, CircuitState]:
+        return {pattern: breaker.state for pattern, breaker in self.breakers.items()}
+
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> Any:
+        route = as_pattern(pattern).route
+        if self._routes is not None and route not in self._routes:
+            return await self.transport.send(pattern, data, timeout)
+
+        breaker = self.breakers.get(route)
+        if breaker is None:
+            breaker = self.breakers[route] = CircuitBreaker(
+                route, self.config, self._state_changed
+            )
+
+        if not breaker.allow():
+            raise CircuitOpenError(route, breaker.retry_after)
+        return await breaker.call(self.transport.send(pattern, data, timeout))
+
+    def _state_changed(self, circuit: str, state: CircuitState) -> None:
+        if self.metrics.enabled:
+            self.metrics.circuit_state_changed(circuit, state.value)
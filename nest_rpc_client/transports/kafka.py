@@ -0,0 +1,234 @@
+import asyncio
+import uuid
+from time import perf_counter
+from typing import Any
+
+from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
+from aiokafka.structs import ConsumerRecord, TopicPartition
+
+from ..config.kafka import KafkaConfig
+from ..metrics import RequestSample
+from ..pattern import Pattern, PatternLike, as_pattern
+from ..transport import Transport
+from ..utils.parse_response import parse_response
+from ..utils.timeout import with_timeout
+
+# NestJS `KafkaHeaders`
+CORRELATION_ID = "kafka_correlationId"
+REPLY_TOPIC = "kafka_replyTopic"
+REPLY_PARTITION = "kafka_replyPartition"
+NEST_ERR = "kafka_nest-err"
+NEST_IS_DISPOSED = "kafka_nest-is-disposed"
+
+
+class KafkaTransport(Transport):
+    """
+    Sends requests to the `<pattern>` topic with NestJS correlation headers
+    and reads replies from `<pattern>.reply` with a single consumer.
+
+    As with NestJS's `subscribeToResponseOf`, the patterns to `send` must be
+    listed in `KafkaConfig.reply_patterns` so their reply topics are
+    assigned once at connect instead of rebalancing on every new pattern.
+    Replies are requested on `reply_partition`.
+    """
+
+    config: KafkaConfig
+    producer: AIOKafkaProducer
+    consumer: AIOKafkaConsumer
+
+    def __init__(self, config: KafkaConfig):
+        self.config = config
+        self.producer = None  # type: ignore
+        self.consumer = None  # type: ignore
+        self._reply_topics = {
+            f"{as_pattern(pattern).route}.reply" for pattern in config.reply_patterns
+        }
+        self._reply_partition = str(config.reply_partition).encode()
+        self._pending: dict[str, asyncio.Future] = {}
+        self._samples: dict[str, RequestSample] = {}
+        self._consumer_task: asyncio.Task | None = None
+
+    async def connect(self) -> None:
+        self.producer = AIOKafkaProducer(
+            bootstrap_servers=self.config.bootstrap_servers,
+            client_id=self.config.client_id,
+            linger_ms=self.config.linger_ms,
+            max_batch_size=self.config.max_batch_size,
+            compression_type=self.config.compression_type,
+        )
+        await self.producer.start()
+
+        if not self._reply_topics:
+            return
+
+        self.consumer = AIOKafkaConsumer(
+            bootstrap_servers=self.config.bootstrap_servers,
+            client_id=self.config.client_id,
+            enable_auto_commit=False,
+            auto_offset_reset="latest",
+        )
+        await self.consumer.start()
+
+        partitions = [
+            TopicPartition(topic, self.config.reply_partition)
+            for topic in sorted(self._reply_topics)
+        ]
+        self.consumer.assign(partitions)
+        # Resolve the end offsets now, so replies to the first requests are
+        # not skipped by a lazy reset.
+        await self.consumer.seek_to_end(*partitions)
+        for partition in partitions:
+            await self.consumer.position(partition)
+
+        self._consumer_task = asyncio.create_task(self._consume())
+
+    async def close(self) -> None:
+        self._fail_pending(ConnectionError("Kafka transport closed"))
+        if self._consumer_task:
+            self._consumer_task.cancel()
+            try:
+                await self._consumer_task
+            except asyncio.CancelledError:
+                pass
+            self._consumer_task = None
+        if self.consumer:
+            await self.consumer.stop()
+            self.consumer = None  # type: ignore
+        if self.producer:
+            await self.producer.stop()
+            self.producer = None  # type: ignore
+
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> Any:
+        pattern = as_pattern(pattern)
+        reply_topic = f"{pattern.route}.reply"
+        if reply_topic not in self._reply_topics:
+            raise ValueError(
+                f"Kafka reply topic {reply_topic!r} is not consumed; "
+                f"add {pattern.route!r} to KafkaConfig.reply_patterns"
+            )
+
+        if timeout is None:
+            timeout = self.config.response_timeout
+
+        if self.metrics.enabled:
+            request = self.metrics.measure_request(pattern, data, self._send)
+        else:
+            request = self._send(pattern, data, None)
+        return await with_timeout(request, pattern, timeout)
+
+    async def _send(
+        self, pattern: Pattern, data: dict, sample: RequestSample | None
+    ) -> Any:
+        correlation_id = str(uuid.uuid4())
+        value = self.config.serializer.dumps(data)
+        if sample is not None:
+            sample.encoded(len(value))
+            self._samples[correlation_id] = sample
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[correlation_id] = future
+        try:
+            # `send` only appends to the producer's batch; the reply confirms
+            # delivery, so only delivery failures are watched.
+            delivery = await self.producer.send(
+                pattern.route,
+                value,
+                headers=[
+                    (CORRELATION_ID, correlation_id.encode()),
+                    (REPLY_TOPIC, f"{pattern.route}.reply".encode()),
+                    (REPLY_PARTITION, self._reply_partition),
+                ],
+            )
+            delivery.add_done_callback(
+                lambda delivered: self._delivered(correlation_id, delivered)
+            )
+
+            response_body = await future
+        finally:
+            self._pending.pop(correlation_id, None)
+            if sample is not None:
+                self._samples.pop(correlation_id, None)
+
+        return parse_response(response_body)
+
+    async def emit(self, pattern: PatternLike, data: dict) -> None:
+        route = as_pattern(pattern).route
+        value = self.config.serializer.dumps(data)
+        if self.metrics.enabled:
+            self.metrics.event_emitted(route, len(value))
+        await self.producer.send(route, value)
+
+    async def flush(self) -> None:
+        if self.producer:
+            await self.producer.flush()
+
+    def _delivered(self, correlation_id: str, delivery: asyncio.Future) -> None:
+        if delivery.cancelled() or delivery.exception() is None:
+            return
+        future = self._pending.pop(correlation_id, None)
+        if future is not None and not future.done():
+            future.set_exception(delivery.exception())  # type: ignore[arg-type]
+
+    async def _consume(self) -> None:
+        error: Exception = ConnectionError("Kafka reply consumer stopped")
+        try:
+            while True:
+                batches = await self.consumer.getmany(timeout_ms=1000)
+                for records in batches.values():
+                    for record in records:
+                        self._dispatch(record)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            self._fail_pending(error)
+
+    def _dispatch(self, record: ConsumerRecord) -> None:
+        headers = dict(record.headers)
+        correlation_id = headers.get(CORRELATION_ID, b"").decode()
+        # Replies to other clients on the same partition are ignored.
+        future = self._pending.pop(correlation_id, None)
+        if future is None or future.done():
+            return
+
+        started = perf_counter()
+        try:
+            response_body = self._decode(record, headers)
+        except Exception as e:
+            future.set_exception(e)
+            return
+
+        sample = self._samples.pop(correlation_id, None)
+        if sample is not None:
+            sample.replied(len(record.value or b""), perf_counter() - started)
+        future.set_result(response_body)
+
+    def _decode(self, record: ConsumerRecord, headers: dict[str, bytes]) -> dict:
+        """
+        Rebuild the `{response|err, isDisposed}` packet that NestJS splits
+        between the message value and headers.
+        """
+        response_body: dict = {"isDisposed": NEST_IS_DISPOSED in headers}
+        if NEST_ERR in headers:
+            response_body["err"] = self._loads(headers[NEST_ERR])
+        elif record.value is not None:
+            response_body["response"] = self._loads(record.value)
+        else:
+            response_body["response"] = None
+        return response_body
+
+    def _loads(self, value: bytes) -> Any:
+        # NestJS sends strings unquoted, so fall back to the raw text.
+        try:
+            return self.config.serializer.loads(value)
+        except ValueError:
+            return value.decode()
+
+    def _fail_pending(self, error: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
@@ -0,0 +1,229 @@
+import asyncio
+import math
+from collections import deque
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any
+
+from ..config.limit import AIMDLimit, GradientLimit, LimitConfig
+from ..exceptions.timeout import RpcTimeoutError
+from ..pattern import PatternLike, as_pattern
+from ..transport import Transport
+from ..utils.timeout import with_timeout
+from .wrapper import WrapperTransport
+
+_DROPPED = (ConnectionError, RpcTimeoutError)
+
+
+@dataclass
+class LimiterStats:
+    limit: int
+    in_flight: int
+    queued: int
+    queued_by_pattern: dict[str, int]
+
+
+class ConcurrencyLimiter:
+    """
+    Grants up to `limit` concurrent slots, with optional per-pattern limits.
+    Callers over the limit wait in one FIFO queue per pattern, and freed slots
+    go to the patterns in turn, so a burst on one pattern cannot starve the
+    others.
+    """
+
+    def __init__(self, limit: float, pattern_limits: dict[str, int]):
+        self.limit = limit
+        self.pattern_limits = pattern_limits
+        self.in_flight = 0
+        self._pattern_in_flight: dict[str, int] = {}
+        # Insertion order is the round-robin order; served patterns move to
+        # the end.
+        self._queues: dict[str, deque[asyncio.Future]] = {}
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def queued_by_pattern(self) -> dict[str, int]:
+        return {pattern: len(queue) for pattern, queue in self._queues.items()}
+
+    async def acquire(self, pattern: str) -> None:
+        if pattern not in self._queues and self._has_room(pattern):
+            self._grant(pattern)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(pattern, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted right before the cancellation arrived.
+                self.release(pattern)
+            else:
+                self._remove(pattern, future)
+            raise
+
+    def release(self, pattern: str) -> None:
+        self.in_flight -= 1
+        self._pattern_in_flight[pattern] -= 1
+        self.wake()
+
+    def wake(self) -> None:
+        """Hand free slots to queued callers, one pattern at a time."""
+        while self.in_flight < self.limit and self._queues:
+            for pattern in self._queues:
+                if self._has_room(pattern):
+                    break
+            else:
+                return
+
+            queue = self._queues.pop(pattern)
+            # Waiters cancelled in this loop iteration are still queued;
+            # they remove themselves only once their task runs.
+            while queue:
+                future = queue.popleft()
+                if not future.done():
+                    future.set_result(None)
+                    self._grant(pattern)
+                    break
+            if queue:
+                self._queues[pattern] = queue
+
+    def _has_room(self, pattern: str) -> bool:
+        if self.in_flight >= self.limit:
+            return False
+        pattern_limit = self.pattern_limits.get(pattern)
+        return (
+            pattern_limit is None
+            or self._pattern_in_flight.get(pattern, 0) < pattern_limit
+        )
+
+    def _grant(self, pattern: str) -> None:
+        self.in_flight += 1
+        self._pattern_in_flight[pattern] = self._pattern_in_flight.get(pattern, 0) + 1
+
+    def _remove(self, pattern: str, future: asyncio.Future) -> None:
+        queue = self._queues.get(pattern)
+        if queue is None or future not in queue:
+            return
+        queue.remove(future)
+        if not queue:
+            del self._queues[pattern]
+
+
+class AIMD:
+    def __init__(self, policy: AIMDLimit):
+        self.policy = policy
+
+    def update(
+        self, limit: float, latency: float, in_flight: int, dropped: bool
+    ) -> float:
+        threshold = self.policy.latency_threshold
+        if dropped or (threshold is not None and latency > threshold):
+            return limit * self.policy.backoff_ratio
+        if in_flight * 2 >= limit:
+            return limit + 1
+        return limit
+
+
+class Gradient:
+    def __init__(self, policy: GradientLimit):
+        self.policy = policy
+        self._long_latency: float | None = None
+
+    def update(
+        self, limit: float, latency: float, in_flight: int, dropped: bool
+    ) -> float:
+        if dropped:
+            return limit * 0.5
+
+        long_latency = self._long_latency
+        if long_latency is None:
+            long_latency = latency
+        else:
+            long_latency += (latency - long_latency) / self.policy.long_window
+        self._long_latency = long_latency
+
+        # Do not grow the limit while it is not being used.
+        if in_flight * 2 < limit:
+            return limit
+
+        gradient = max(
+            0.5, min(1.0, self.policy.tolerance * long_latency / max(latency, 1e-9))
+        )
+        target = limit * gradient + math.sqrt(limit)
+        return limit * (1 - self.policy.smoothing) + target * self.policy.smoothing
+
+
+class LimitingTransport(WrapperTransport):
+    """
+    Caps the number of concurrent `send` calls on the wrapped transport,
+    in total and per pattern. Calls over the limit are queued fairly across
+    patterns. With `LimitConfig.adaptive` set, the total limit follows
+    observed latency and errors between `min_limit` and `max_in_flight`.
+
+    `emit` is not limited.
+    """
+
+    config: LimitConfig
+
+    def __init__(self, transport: Transport, config: LimitConfig):
+        super().__init__(transport)
+        self.config = config
+        initial = config.initial_limit or config.max_in_flight
+        pattern_limits = {
+            as_pattern(pattern).route: limit
+            for pattern, limit in config.pattern_limits.items()
+        }
+        self.limiter = ConcurrencyLimiter(initial, pattern_limits)
+        self._algorithm: AIMD | Gradient | None = None
+        if isinstance(config.adaptive, AIMDLimit):
+            self._algorithm = AIMD(config.adaptive)
+        elif isinstance(config.adaptive, GradientLimit):
+            self._algorithm = Gradient(config.adaptive)
+
+    @property
+    def queue_depth(self) -> int:
+        return self.limiter.queued
+
+    def stats(self) -> LimiterStats:
+        return LimiterStats(
+            limit=int(self.limiter.limit),
+            in_flight=self.limiter.in_flight,
+            queued=self.limiter.queued,
+            queued_by_pattern=self.limiter.queued_by_pattern(),
+        )
+
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> Any:
+        # Time spent queued counts toward `timeout`.
+        route = as_pattern(pattern).route
+        if timeout is None:
+            await self.limiter.acquire(route)
+        else:
+            queued_at = perf_counter()
+            await with_timeout(self.limiter.acquire(route), route, timeout)
+            timeout = max(timeout - (perf_counter() - queued_at), 0.0)
+
+        started = perf_counter()
+        dropped = False
+        try:
+            return await self.transport.send(pattern, data, timeout)
+        except _DROPPED:
+            dropped = True
+            raise
+        finally:
+            if self._algorithm is not None:
+                self._adjust(perf_counter() - started, dropped)
+            self.limiter.release(route)
+
+    def _adjust(self, latency: float, dropped: bool) -> None:
+        limiter = self.limiter
+        limit = self._algorithm.update(  # type: ignore[union-attr]
+            limiter.limit, latency, limiter.in_flight, dropped
+        )
+        limiter.limit = max(
+            self.config.min_limit, min(limit, self.config.max_in_flight)
+        )
@@ -1,5 +1,6 @@
 from typing import Any
 
+from ..pattern import PatternLike
 from ..transport import Transport
 
 
@@ -16,9 +17,11 @@ class MockTransport(Transport):
     async def close(self) -> None:
         self.closed = True
 
-    async def send(self, pattern: str, data: dict) -> Any:
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> Any:
         self.sent_patterns.append((pattern, data))
         return {"mocked": True, "pattern": pattern, "data": data}
 
-    async def emit(self, pattern: str, data: dict):
+    async def emit(self, pattern: PatternLike, data: dict):
         self.emitted_patterns.append((pattern, data))
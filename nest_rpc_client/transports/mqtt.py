@@ -0,0 +1,143 @@
+import asyncio
+import uuid
+from time import perf_counter
+
+import aiomqtt
+
+from ..config.mqtt import MQTTConfig
+from ..metrics import RequestSample
+from ..pattern import Pattern, PatternLike, as_pattern
+from ..transport import Transport
+from ..utils.parse_response import parse_response
+from ..utils.timeout import with_timeout
+
+
+class MQTTTransport(Transport):
+    """
+    Publishes requests to the `<pattern>` topic and receives replies on
+    `<pattern>/reply`, the NestJS MQTT convention. Each reply topic is
+    subscribed once and a single listener dispatches replies by id.
+    """
+
+    config: MQTTConfig
+    client: aiomqtt.Client
+
+    def __init__(self, config: MQTTConfig):
+        self.config = config
+        self.client = None  # type: ignore
+        self._pending: dict[str, asyncio.Future] = {}
+        self._samples: dict[str, RequestSample] = {}
+        self._topics: set[str] = set()
+        self._subscribe_lock = asyncio.Lock()
+        self._listener_task: asyncio.Task | None = None
+
+    async def connect(self) -> None:
+        self.client = aiomqtt.Client(
+            self.config.host,
+            self.config.port,
+            username=self.config.username,
+            password=self.config.password,
+            identifier=self.config.client_id,
+        )
+        await self.client.__aenter__()
+        self._listener_task = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        self._fail_pending(ConnectionError("MQTT transport closed"))
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        if self.client:
+            await self.client.__aexit__(None, None, None)
+            self.client = None  # type: ignore
+            self._topics.clear()
+
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> dict:
+        if timeout is None:
+            timeout = self.config.response_timeout
+
+        pattern = as_pattern(pattern)
+        if self.metrics.enabled:
+            request = self.metrics.measure_request(pattern, data, self._send)
+        else:
+            request = self._send(pattern, data, None)
+        return await with_timeout(request, pattern, timeout)
+
+    async def _send(
+        self, pattern: Pattern, data: dict, sample: RequestSample | None
+    ) -> dict:
+        correlation_id = str(uuid.uuid4())
+        message = self.config.serializer.encode_packet(pattern, data, correlation_id)
+        if sample is not None:
+            sample.encoded(len(message))
+            self._samples[correlation_id] = sample
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[correlation_id] = future
+        try:
+            await self._subscribe(f"{pattern.route}/reply")
+            await self.client.publish(pattern.route, message, qos=self.config.qos)
+
+            response_body = await future
+        finally:
+            self._pending.pop(correlation_id, None)
+            if sample is not None:
+                self._samples.pop(correlation_id, None)
+
+        return parse_response(response_body)
+
+    async def emit(self, pattern: PatternLike, data: dict) -> None:
+        pattern = as_pattern(pattern)
+        message = self.config.serializer.encode_packet(pattern, data)
+        if self.metrics.enabled:
+            self.metrics.event_emitted(pattern.route, len(message))
+        await self.client.publish(pattern.route, message, qos=self.config.emit_qos)
+
+    async def _subscribe(self, topic: str) -> None:
+        if topic in self._topics:
+            return
+
+        async with self._subscribe_lock:
+            if topic not in self._topics:
+                await self.client.subscribe(topic, qos=self.config.qos)
+                self._topics.add(topic)
+
+    async def _listen(self) -> None:
+        error: Exception = ConnectionError("MQTT connection closed")
+        try:
+            async for message in self.client.messages:
+                payload = message.payload
+                started = perf_counter()
+                try:
+                    response_body = self.config.serializer.loads(payload)
+                    correlation_id = response_body.get("id")
+                except (ValueError, TypeError, AttributeError):
+                    continue
+
+                if self._samples:
+                    sample = self._samples.pop(correlation_id, None)
+                    if sample is not None:
+                        sample.replied(len(payload), perf_counter() - started)
+
+                # Replies for other clients on the same topic are ignored.
+                future = self._pending.pop(correlation_id, None)
+                if future is not None and not future.done():
+                    future.set_result(response_body)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            self._fail_pending(error)
+
+    def _fail_pending(self, error: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
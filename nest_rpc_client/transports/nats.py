@@ -1,12 +1,19 @@
-import json
 import uuid
+from collections.abc import AsyncIterator
+from functools import partial
+from time import perf_counter
+from typing import Any
 
 import nats
 from nats.aio.client import Client
 
 from ..config.nats import NATSConfig
+from ..exceptions.timeout import RpcTimeoutError
+from ..metrics import RequestSample
+from ..pattern import Pattern, PatternLike, as_pattern
 from ..transport import Transport
 from ..utils.parse_response import parse_response
+from ..utils.stream import iterate_replies
 
 
 class NATSTransport(Transport):
@@ -27,22 +34,100 @@ class NATSTransport(Transport):
 
         await self.client.close()
 
-    async def send(self, pattern: str, data: dict) -> dict:
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> dict:
+        return await self._request(pattern, data, timeout, None)
+
+    async def send_typed(
+        self,
+        pattern: PatternLike,
+        data: dict,
+        response_type: Any,
+        timeout: float | None = None,
+    ) -> Any:
+        # The reply is parsed here, so the serializer can decode it straight
+        # into `response_type`.
+        return await self._request(pattern, data, timeout, response_type)
+
+    async def _request(
+        self,
+        pattern: PatternLike,
+        data: dict,
+        timeout: float | None,
+        response_type: Any,
+    ) -> Any:
+        if timeout is None:
+            timeout = self.config.response_timeout
+
+        pattern = as_pattern(pattern)
+        if self.metrics.enabled:
+            request = self.metrics.measure_request(
+                pattern,
+                data,
+                partial(self._send, timeout=timeout, response_type=response_type),
+            )
+        else:
+            request = self._send(pattern, data, None, timeout, response_type)
+
+        try:
+            return await request
+        except nats.errors.TimeoutError:
+            raise RpcTimeoutError(pattern.route, timeout) from None
+
+    async def _send(
+        self,
+        pattern: Pattern,
+        data: dict,
+        sample: RequestSample | None,
+        timeout: float,
+        response_type: Any,
+    ) -> Any:
         correlation_id = str(uuid.uuid4())
-        message = json.dumps(
-            {"id": correlation_id, "pattern": pattern, "data": data}
-        ).encode("utf-8")
+        message = self.config.serializer.encode_packet(pattern, data, correlation_id)
+        if sample is not None:
+            sample.encoded(len(message))
 
-        msg = await self.client.request(
-            pattern, message, timeout=self.config.response_timeout
-        )
-        response_body: dict = json.loads(msg.data)
+        msg = await self.client.request(pattern.route, message, timeout=timeout)
+        started = perf_counter()
+        if response_type is None:
+            response_body = self.config.serializer.loads(msg.data)
+        else:
+            response_body = self.config.serializer.loads_reply(msg.data, response_type)
+        if sample is not None:
+            sample.replied(len(msg.data), perf_counter() - started)
         return parse_response(response_body)
 
-    async def emit(self, pattern: str, data: dict) -> None:
-        await self.client.publish(
-            pattern,
-            json.dumps(
-                {"pattern": pattern, "data": data},
-            ).encode("utf-8"),
+    async def stream(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> AsyncIterator[Any]:
+        if timeout is None:
+            timeout = self.config.response_timeout
+
+        pattern = as_pattern(pattern)
+        message = self.config.serializer.encode_packet(
+            pattern, data, str(uuid.uuid4())
         )
+        # NestJS answers every packet of an Observable on the same reply
+        # subject, so the stream gets an inbox of its own.
+        inbox = self.client.new_inbox()
+        subscription = await self.client.subscribe(inbox)
+
+        async def next_reply() -> dict:
+            msg = await subscription.next_msg(timeout=None)
+            return self.config.serializer.loads(msg.data)
+
+        try:
+            await self.client.publish(pattern.route, message, reply=inbox)
+            async for response in iterate_replies(next_reply, pattern, timeout):
+                yield response
+        finally:
+            await subscription.unsubscribe()
+
+    async def emit(self, pattern: PatternLike, data: dict) -> None:
+        pattern = as_pattern(pattern)
+        message = self.config.serializer.encode_packet(pattern, data)
+        if self.metrics.enabled:
+            self.metrics.event_emitted(pattern.route, len(message))
+
+        await self.client.publish(pattern.route, message)
@@ -1,62 +1,198 @@
-import json
+import asyncio
 import uuid
+from collections.abc import AsyncIterator
+from time import perf_counter
+from typing import Any
 
 import aio_pika
 
 from ..config.rabbitmq import RabbitMQConfig
+from ..metrics import RequestSample
+from ..pattern import Pattern, PatternLike, as_pattern
 from ..transport import Transport
+from ..utils.coalescer import EmitCoalescer
 from ..utils.parse_response import parse_response
+from ..utils.stream import ReplyStream, iterate_replies
+from ..utils.timeout import with_timeout
 
 
 class RabbitMQTransport(Transport):
     config: RabbitMQConfig
     connection: aio_pika.abc.AbstractRobustConnection
     channel: aio_pika.abc.AbstractChannel
+    reply_queue: aio_pika.abc.AbstractQueue
 
     def __init__(self, config: RabbitMQConfig):
         self.config = config
         self.channel = None  # type: ignore
         self.connection = None  # type: ignore
+        self.reply_queue = None  # type: ignore
+        self._pending: dict[str, asyncio.Future] = {}
+        self._samples: dict[str, RequestSample] = {}
+        self._streams: dict[str, ReplyStream] = {}
+        self._coalescer: EmitCoalescer | None = None
+        if config.emit_linger is not None:
+            self._coalescer = EmitCoalescer(
+                self._publish_events, config.emit_batch_size, config.emit_linger
+            )
 
     async def connect(self) -> None:
         self.connection = await aio_pika.connect_robust(self.config.url)
         self.channel = await self.connection.channel()
+        self.reply_queue = await self.channel.declare_queue(exclusive=True)
+        await self.reply_queue.consume(self._on_reply, no_ack=True)
 
     async def close(self) -> None:
+        if self.channel:
+            await self.flush()
+        self._fail_pending(ConnectionError("RabbitMQ transport closed"))
         if self.channel:
             await self.channel.close()
         if self.connection:
             await self.connection.close()
 
-    async def send(self, pattern: str, data: dict) -> dict:
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> dict:
+        if timeout is None:
+            timeout = self.config.response_timeout
+
+        pattern = as_pattern(pattern)
+        if self.metrics.enabled:
+            request = self.metrics.measure_request(pattern, data, self._send)
+        else:
+            request = self._send(pattern, data, None)
+        return await with_timeout(request, pattern, timeout)
+
+    async def _send(
+        self, pattern: Pattern, data: dict, sample: RequestSample | None
+    ) -> dict:
         correlation_id = str(uuid.uuid4())
-        reply_queue = await self.channel.declare_queue(exclusive=True)
 
-        body = json.dumps(
-            {"id": correlation_id, "pattern": pattern, "data": data}
-        ).encode("utf-8")
+        body = self.config.serializer.encode_packet(pattern, data, correlation_id)
+        if sample is not None:
+            sample.encoded(len(body))
+            self._samples[correlation_id] = sample
 
-        await self.channel.default_exchange.publish(
-            aio_pika.Message(
-                body=body,
-                correlation_id=correlation_id,
-                reply_to=reply_queue.name,
-            ),
-            routing_key=self.config.queue,
+        future = asyncio.get_running_loop().create_future()
+        self._pending[correlation_id] = future
+        try:
+            await self.channel.default_exchange.publish(
+                aio_pika.Message(
+                    body=body,
+                    correlation_id=correlation_id,
+                    reply_to=self.reply_queue.name,
+                ),
+                routing_key=self.config.queue,
+            )
+
+            response_body = await future
+        finally:
+            self._pending.pop(correlation_id, None)
+            if sample is not None:
+                self._samples.pop(correlation_id, None)
+
+        return parse_response(response_body)
+
+    async def stream(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> AsyncIterator[Any]:
+        if timeout is None:
+            timeout = self.config.response_timeout
+
+        correlation_id = str(uuid.uuid4())
+        pattern = as_pattern(pattern)
+        body = self.config.serializer.encode_packet(pattern, data, correlation_id)
+        stream = self._streams[correlation_id] = ReplyStream(
+            self.config.stream_buffer
         )
+        try:
+            await self.channel.default_exchange.publish(
+                aio_pika.Message(
+                    body=body,
+                    correlation_id=correlation_id,
+                    reply_to=self.reply_queue.name,
+                ),
+                routing_key=self.config.queue,
+            )
 
-        async with reply_queue.iterator() as queue_iter:
-            async for message in queue_iter:
-                async with message.process():
-                    if message.correlation_id == correlation_id:
-                        response_body = json.loads(message.body.decode("utf-8"))
+            async for response in iterate_replies(stream.get, pattern, timeout):
+                yield response
+        finally:
+            self._streams.pop(correlation_id, None)
+            stream.close()
 
-                        return parse_response(response_body)
+    async def emit(self, pattern: PatternLike, data: dict) -> None:
+        if self._coalescer is not None:
+            await self._coalescer.add(pattern, data)
+            return
 
-    async def emit(self, pattern: str, data: dict) -> None:
-        body = json.dumps({"pattern": pattern, "data": data}).encode("utf-8")
+        pattern = as_pattern(pattern)
+        body = self.config.serializer.encode_packet(pattern, data)
+        if self.metrics.enabled:
+            self.metrics.event_emitted(pattern.route, len(body))
 
         await self.channel.default_exchange.publish(
             aio_pika.Message(body=body),
             routing_key=self.config.queue,
         )
+
+    async def flush(self) -> None:
+        if self._coalescer is not None:
+            await self._coalescer.flush()
+
+    async def _publish_events(self, events: list[tuple[PatternLike, dict]]) -> None:
+        # AMQP has no batch publish; start every publish before awaiting any
+        # of them so their confirmations overlap instead of running serially.
+        publishes = []
+        for pattern, data in events:
+            pattern = as_pattern(pattern)
+            body = self.config.serializer.encode_packet(pattern, data)
+            if self.metrics.enabled:
+                self.metrics.event_emitted(pattern.route, len(body))
+            publishes.append(
+                self.channel.default_exchange.publish(
+                    aio_pika.Message(body=body), routing_key=self.config.queue
+                )
+            )
+        await asyncio.gather(*publishes)
+
+    async def _on_reply(self, message: aio_pika.abc.AbstractIncomingMessage) -> None:
+        # Replies to requests that already timed out have no pending entry
+        # and are dropped here.
+        future = self._pending.pop(message.correlation_id, None)
+        if future is None or future.done():
+            if self._streams:
+                self._on_stream_reply(message)
+            return
+
+        started = perf_counter()
+        try:
+            response_body = self.config.serializer.loads(message.body)
+        except Exception as e:
+            future.set_exception(e)
+            return
+
+        sample = self._samples.pop(message.correlation_id, None)
+        if sample is not None:
+            sample.replied(len(message.body), perf_counter() - started)
+        future.set_result(response_body)
+
+    def _on_stream_reply(self, message: aio_pika.abc.AbstractIncomingMessage) -> None:
+        stream = self._streams.get(message.correlation_id)  # type: ignore[arg-type]
+        if stream is None:
+            return
+        try:
+            response_body = self.config.serializer.loads(message.body)
+        except Exception as e:
+            stream.fail(e)
+            return
+        stream.put(response_body)
+
+    def _fail_pending(self, error: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+        for stream in self._streams.values():
+            stream.fail(error)
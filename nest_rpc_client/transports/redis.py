@@ -1,63 +1,211 @@
 import asyncio
-import json
 import uuid
+from collections.abc import AsyncIterator
+from time import perf_counter
+from typing import Any
 
 from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
 
 from ..config.redis import RedisConfig
+from ..metrics import RequestSample
+from ..pattern import Pattern, PatternLike, as_pattern
 from ..transport import Transport
+from ..utils.batch import BatchItems, chunk_items
+from ..utils.coalescer import EmitCoalescer
 from ..utils.parse_response import parse_response
+from ..utils.stream import ReplyStream, iterate_replies
+from ..utils.timeout import with_timeout
 
 
 class RedisTransport(Transport):
     config: RedisConfig
     client: Redis
+    pubsub: PubSub
 
     def __init__(self, config: RedisConfig):
         self.config = config
+        self.pubsub = None  # type: ignore
+        self._pending: dict[str, asyncio.Future] = {}
+        self._samples: dict[str, RequestSample] = {}
+        self._streams: dict[str, ReplyStream] = {}
+        self._channels: set[str] = set()
+        self._subscribe_lock = asyncio.Lock()
+        self._listener_task: asyncio.Task | None = None
+        self._coalescer: EmitCoalescer | None = None
+        if config.emit_linger is not None:
+            self._coalescer = EmitCoalescer(
+                self._publish_events, config.emit_batch_size, config.emit_linger
+            )
 
     async def connect(self) -> None:
         self.client = Redis(host=self.config.host, port=self.config.port)
 
     async def close(self) -> None:
+        if hasattr(self, "client") and self.client:
+            await self.flush()
+        self._fail_pending(ConnectionError("Redis transport closed"))
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        if self.pubsub:
+            await self.pubsub.aclose()
+            self.pubsub = None  # type: ignore
+            self._channels.clear()
         if hasattr(self, "client") and self.client:
             await self.client.aclose()
 
-    async def send(self, pattern: str, data: dict) -> dict:
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> dict:
+        if timeout is None:
+            timeout = self.config.response_timeout
+
+        pattern = as_pattern(pattern)
+        if self.metrics.enabled:
+            request = self.metrics.measure_request(pattern, data, self._send)
+        else:
+            request = self._send(pattern, data, None)
+        return await with_timeout(request, pattern, timeout)
+
+    async def _send(
+        self, pattern: Pattern, data: dict, sample: RequestSample | None
+    ) -> dict:
         correlation_id = str(uuid.uuid4())
-        reply_channel = f"{pattern}.reply"
-
-        message = json.dumps({"id": correlation_id, "pattern": pattern, "data": data})
-
-        pubsub = self.client.pubsub()
-        await pubsub.subscribe(reply_channel)
+        message = self.config.serializer.encode_packet(pattern, data, correlation_id)
+        if sample is not None:
+            sample.encoded(len(message))
+            self._samples[correlation_id] = sample
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[correlation_id] = future
+        try:
+            await self._subscribe(f"{pattern.route}.reply")
+            await self.client.publish(pattern.route, message)
+
+            response_body = await future
+        finally:
+            self._pending.pop(correlation_id, None)
+            if sample is not None:
+                self._samples.pop(correlation_id, None)
+
+        return parse_response(response_body)
+
+    async def stream(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> AsyncIterator[Any]:
+        if timeout is None:
+            timeout = self.config.response_timeout
 
-        future = asyncio.get_event_loop().create_future()
-
-        async def listener():
-            try:
-                async for msg in pubsub.listen():
-                    if msg["type"] != "message":
-                        continue
-
-                    response_body = json.loads(msg["data"])
-
-                    if response_body.get("id") != correlation_id:
+        correlation_id = str(uuid.uuid4())
+        pattern = as_pattern(pattern)
+        message = self.config.serializer.encode_packet(pattern, data, correlation_id)
+        stream = self._streams[correlation_id] = ReplyStream(
+            self.config.stream_buffer
+        )
+        try:
+            await self._subscribe(f"{pattern.route}.reply")
+            await self.client.publish(pattern.route, message)
+
+            async for response in iterate_replies(stream.get, pattern, timeout):
+                yield response
+        finally:
+            self._streams.pop(correlation_id, None)
+            stream.close()
+
+    async def emit(self, pattern: PatternLike, data: dict) -> None:
+        if self._coalescer is not None:
+            await self._coalescer.add(pattern, data)
+            return
+
+        pattern = as_pattern(pattern)
+        message = self.config.serializer.encode_packet(pattern, data)
+        if self.metrics.enabled:
+            self.metrics.event_emitted(pattern.route, len(message))
+        await self.client.publish(pattern.route, message)
+
+    async def emit_many(self, items: BatchItems, *, concurrency: int = 100) -> None:
+        async for chunk in chunk_items(items, concurrency):
+            await self._publish_events(chunk)
+
+    async def flush(self) -> None:
+        if self._coalescer is not None:
+            await self._coalescer.flush()
+
+    async def _publish_events(self, events: list[tuple[PatternLike, dict]]) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            for pattern, data in events:
+                pattern = as_pattern(pattern)
+                message = self.config.serializer.encode_packet(pattern, data)
+                if self.metrics.enabled:
+                    self.metrics.event_emitted(pattern.route, len(message))
+                pipe.publish(pattern.route, message)
+            await pipe.execute()
+
+    async def _subscribe(self, channel: str) -> None:
+        """
+        Subscribe the shared pubsub connection to `channel` once and make sure
+        the listener task is running.
+        """
+        if channel in self._channels and self._listener_running():
+            return
+
+        async with self._subscribe_lock:
+            if self.pubsub is None:
+                self.pubsub = self.client.pubsub()
+            if channel not in self._channels:
+                await self.pubsub.subscribe(channel)
+                self._channels.add(channel)
+            if not self._listener_running():
+                self._listener_task = asyncio.create_task(self._listen())
+
+    def _listener_running(self) -> bool:
+        return self._listener_task is not None and not self._listener_task.done()
+
+    async def _listen(self) -> None:
+        error: Exception = ConnectionError("Redis reply subscription closed")
+        try:
+            async for msg in self.pubsub.listen():
+                if msg["type"] != "message":
+                    continue
+
+                started = perf_counter()
+                try:
+                    response_body = self.config.serializer.loads(msg["data"])
+                    correlation_id = response_body.get("id")
+                except (ValueError, AttributeError):
+                    continue
+
+                if self._samples:
+                    sample = self._samples.pop(correlation_id, None)
+                    if sample is not None:
+                        sample.replied(len(msg["data"]), perf_counter() - started)
+
+                if self._streams:
+                    stream = self._streams.get(correlation_id)
+                    if stream is not None:
+                        stream.put(response_body)
                         continue
 
-                    future.set_result(parse_response(response_body))
-                    break
-            except Exception as e:
-                future.set_exception(e)
-            finally:
-                await pubsub.unsubscribe(reply_channel)
-                await pubsub.aclose()
-
-        asyncio.create_task(listener())
-        await self.client.publish(pattern, message)
-
-        return await future
-
-    async def emit(self, pattern: str, data: dict) -> None:
-        message = json.dumps({"pattern": pattern, "data": data})
-        await self.client.publish(pattern, message)
+                # Replies for other clients on the same channel are ignored.
+                future = self._pending.pop(correlation_id, None)
+                if future is not None and not future.done():
+                    future.set_result(response_body)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            self._fail_pending(error)
+
+    def _fail_pending(self, error: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+        for stream in self._streams.values():
+            stream.fail(error)
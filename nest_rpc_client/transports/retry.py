@@ -0,0 +1,190 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any
+
+from ..config.retry import HedgePolicy, RetryConfig, RetryPolicy
+from ..pattern import Pattern, PatternLike, as_pattern
+from ..transport import Transport
+from ..utils.tasks import retrieve_exception
+from ..utils.timeout import with_timeout
+from .wrapper import WrapperTransport
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries and hedged requests to `ratio` of the
+    request volume, plus `min_per_second` so that low traffic can still
+    retry. Each extra attempt costs one token; the bucket holds at most
+    `burst` tokens.
+    """
+
+    def __init__(self, ratio: float, min_per_second: float, burst: float):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.burst = burst
+        self._tokens = min(min_per_second, burst)
+        self._updated = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def deposit(self) -> None:
+        self._refill()
+        self._tokens = min(self._tokens + self.ratio, self.burst)
+
+    def withdraw(self) -> bool:
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._tokens + (now - self._updated) * self.min_per_second, self.burst
+        )
+        self._updated = now
+
+
+class LatencyWindow:
+    """
+    The last `size` latencies of a pattern. Quantiles are recomputed every
+    `refresh` samples instead of on every lookup.
+    """
+
+    def __init__(self, size: int, refresh: int = 50):
+        self._samples: deque[float] = deque(maxlen=size)
+        self._refresh = refresh
+        self._since_refresh = 0
+        self._sorted: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, latency: float) -> None:
+        self._samples.append(latency)
+        self._since_refresh += 1
+
+    def quantile(self, q: float) -> float | None:
+        if not self._samples:
+            return None
+        if self._since_refresh >= self._refresh or not self._sorted:
+            self._sorted = sorted(self._samples)
+            self._since_refresh = 0
+        return self._sorted[min(int(q * len(self._sorted)), len(self._sorted) - 1)]
+
+
+class RetryTransport(WrapperTransport):
+    """
+    Retries failed `send` calls with exponential backoff and, for the patterns
+    listed in `RetryConfig.hedging`, sends a second copy of a request that has
+    not been answered after the pattern's observed latency quantile, using
+    whichever reply arrives first.
+
+    Retries and hedges draw from a shared `RetryBudget`, so they stop when
+    most requests are failing instead of multiplying the load.
+    """
+
+    config: RetryConfig
+
+    def __init__(self, transport: Transport, config: RetryConfig):
+        super().__init__(transport)
+        self.config = config
+        self.budget = RetryBudget(
+            config.budget_ratio, config.budget_min_per_second, config.budget_burst
+        )
+        self._policies = {
+            as_pattern(pattern).route: policy
+            for pattern, policy in config.policies.items()
+        }
+        self._hedging = {
+            as_pattern(pattern).route: policy
+            for pattern, policy in config.hedging.items()
+        }
+        self._latencies: dict[str, LatencyWindow] = {
+            route: LatencyWindow(policy.window)
+            for route, policy in self._hedging.items()
+        }
+
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> Any:
+        # `timeout` is a deadline for all attempts together.
+        pattern = as_pattern(pattern)
+        return await with_timeout(self._send(pattern, data), pattern, timeout)
+
+    async def _send(self, pattern: Pattern, data: dict) -> Any:
+        self.budget.deposit()
+        policy = self._policies.get(pattern.route, self.config.default)
+        hedge = self._hedging.get(pattern.route)
+
+        attempt = 1
+        while True:
+            try:
+                if hedge is not None:
+                    return await self._hedged_send(pattern, data, hedge)
+                return await self.transport.send(pattern, data)
+            except Exception as e:
+                if (
+                    policy is None
+                    or attempt >= policy.max_attempts
+                    or not isinstance(e, policy.retry_on)
+                    or not self.budget.withdraw()
+                ):
+                    raise
+
+            await asyncio.sleep(self._backoff(policy, attempt))
+            attempt += 1
+
+    async def _hedged_send(
+        self, pattern: Pattern, data: dict, hedge: HedgePolicy
+    ) -> Any:
+        latencies = self._latencies[pattern.route]
+        delay = hedge.delay
+        if delay is None:
+            delay = latencies.quantile(hedge.quantile) or hedge.initial_delay
+        delay = max(delay, hedge.min_delay)
+
+        started: dict[asyncio.Future, float] = {}
+
+        def start() -> None:
+            task = asyncio.ensure_future(self.transport.send(pattern, data))
+            task.add_done_callback(retrieve_exception)
+            started[task] = time.monotonic()
+
+        start()
+        pending = set(started)
+        error: BaseException | None = None
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done and self.budget.withdraw():
+                start()
+                pending = set(started)
+
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        latencies.add(time.monotonic() - started[task])
+                        return task.result()
+                    error = error or task.exception()
+                if not pending:
+                    raise error  # type: ignore[misc]
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _backoff(policy: RetryPolicy, attempt: int) -> float:
+        backoff = min(
+            policy.initial_backoff * policy.multiplier ** (attempt - 1),
+            policy.max_backoff,
+        )
+        return backoff * (1 + random.uniform(-policy.jitter, policy.jitter))
@@ -0,0 +1,148 @@
+import asyncio
+import fnmatch
+import re
+from collections.abc import AsyncIterator
+from typing import Any
+
+from ..config.router import Route, RouterConfig
+from ..pattern import PatternLike, as_pattern
+from ..transport import Transport
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+_MAX_CACHED_PATTERNS = 10_000
+
+
+class RouterTransport(Transport):
+    """
+    Sends each pattern to the transport configured for it.
+
+    Route keys are exact patterns, prefixes (`"reports.*"`, a single
+    trailing `*`) or globs (`"*.health"`), and they are matched in that
+    order: exact, longest prefix, then the first glob in declaration order.
+    The route table is compiled once into a dict, a prefix index and a
+    single regex, and every pattern's route is cached after its first
+    lookup. Patterns without a route go to `default`.
+
+    A `Route` with a `fallback` retries a call on the fallback transport
+    when the primary fails with one of `fallback_on`.
+    """
+
+    config: RouterConfig
+
+    def __init__(self, config: RouterConfig):
+        self.config = config
+        self._exact: dict[str, Route] = {}
+        self._prefixes: dict[str, Route] = {}
+        globs: list[tuple[str, Route]] = []
+
+        for key, target in config.routes.items():
+            route = target if isinstance(target, Route) else Route(target)
+            key = as_pattern(key).route
+            wildcards = _GLOB_CHARS.findall(key)
+            if not wildcards:
+                self._exact[key] = route
+            elif wildcards == ["*"] and key.endswith("*"):
+                self._prefixes[key[:-1]] = route
+            else:
+                globs.append((key, route))
+
+        self._prefix_lengths = sorted(
+            {len(prefix) for prefix in self._prefixes}, reverse=True
+        )
+        self._globs = [route for _, route in globs]
+        self._glob_regex = (
+            re.compile(
+                "|".join(
+                    f"(?P<_r{index}>{fnmatch.translate(key)})"
+                    for index, (key, _) in enumerate(globs)
+                )
+            )
+            if globs
+            else None
+        )
+
+        default = config.default
+        self._default = Route(default) if isinstance(default, Transport) else default
+        self._cache: dict[str, Route | None] = {}
+
+    @property
+    def transports(self) -> list[Transport]:
+        routes = [*self._exact.values(), *self._prefixes.values(), *self._globs]
+        if self._default is not None:
+            routes.append(self._default)
+
+        transports: dict[int, Transport] = {}
+        for route in routes:
+            for transport in (route.transport, route.fallback):
+                if transport is not None:
+                    transports.setdefault(id(transport), transport)
+        return list(transports.values())
+
+    async def connect(self) -> None:
+        await asyncio.gather(*(transport.connect() for transport in self.transports))
+
+    async def close(self) -> None:
+        await asyncio.gather(*(transport.close() for transport in self.transports))
+
+    async def flush(self) -> None:
+        await asyncio.gather(*(transport.flush() for transport in self.transports))
+
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> Any:
+        route = self.route(pattern)
+        try:
+            return await route.transport.send(pattern, data, timeout)
+        except Exception as e:
+            if route.fallback is None or not isinstance(e, route.fallback_on):
+                raise
+        return await route.fallback.send(pattern, data, timeout)
+
+    async def emit(self, pattern: PatternLike, data: dict) -> None:
+        route = self.route(pattern)
+        try:
+            await route.transport.emit(pattern, data)
+            return
+        except Exception as e:
+            if route.fallback is None or not isinstance(e, route.fallback_on):
+                raise
+        await route.fallback.emit(pattern, data)
+
+    async def stream(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> AsyncIterator[Any]:
+        async for response in self.route(pattern).transport.stream(
+            pattern, data, timeout
+        ):
+            yield response
+
+    def route(self, pattern: PatternLike) -> Route:
+        key = as_pattern(pattern).route
+        try:
+            route = self._cache[key]
+        except KeyError:
+            route = self._lookup(key)
+            if len(self._cache) >= _MAX_CACHED_PATTERNS:
+                self._cache.clear()
+            self._cache[key] = route
+
+        if route is None:
+            raise LookupError(f"No transport is routed for pattern {key!r}")
+        return route
+
+    def _lookup(self, pattern: str) -> Route | None:
+        route = self._exact.get(pattern)
+        if route is not None:
+            return route
+
+        for length in self._prefix_lengths:
+            route = self._prefixes.get(pattern[:length])
+            if route is not None:
+                return route
+
+        if self._glob_regex is not None:
+            match = self._glob_regex.match(pattern)
+            if match is not None:
+                return self._globs[int(match.lastgroup[2:])]  # type: ignore[index]
+
+        return self._default
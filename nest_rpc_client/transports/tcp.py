@@ -1,10 +1,19 @@
 import asyncio
-import json
 import uuid
+from collections.abc import AsyncIterator
+from time import perf_counter
+from typing import Any
 
 from ..config.tcp import TCPConfig
+from ..metrics import RequestSample
+from ..pattern import Pattern, PatternLike, as_pattern
 from ..transport import Transport
+from ..utils.batch import BatchItems, chunk_items
+from ..utils.coalescer import EmitCoalescer
+from ..utils.frame import FrameDecoder, encode_frame
 from ..utils.parse_response import parse_response
+from ..utils.stream import ReplyStream, iterate_replies
+from ..utils.timeout import with_timeout
 
 
 class TCPTransport(Transport):
@@ -13,54 +22,200 @@ class TCPTransport(Transport):
     writer: asyncio.StreamWriter
 
     def __init__(self, config: TCPConfig):
+        if config.serializer.binary:
+            raise ValueError(
+                "TCPTransport frames text payloads and cannot use "
+                f"{type(config.serializer).__name__}"
+            )
         self.config = config
         self.reader = None  # type: ignore
         self.writer = None  # type: ignore
+        self._pending: dict[str, asyncio.Future] = {}
+        self._samples: dict[str, RequestSample] = {}
+        self._streams: dict[str, ReplyStream] = {}
+        self._reader_task: asyncio.Task | None = None
+        self._coalescer: EmitCoalescer | None = None
+        if config.emit_linger is not None:
+            self._coalescer = EmitCoalescer(
+                self._write_events, config.emit_batch_size, config.emit_linger
+            )
 
     async def connect(self):
         self.reader, self.writer = await asyncio.open_connection(
             self.config.host,
             self.config.port,
         )
+        self._reader_task = asyncio.create_task(self._read_loop())
 
     async def close(self):
+        if self.writer:
+            await self.flush()
+        self._fail_pending(ConnectionError("TCP transport closed"))
         if self.writer:
             self.writer.close()
-            await self.writer.wait_closed()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                # The peer already reset the connection.
+                pass
+        if self._reader_task:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._reader_task is not None and not self._reader_task.done()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> dict:
+        if not self.is_connected:
+            raise ConnectionError("TCP transport is not connected")
+
+        if timeout is None:
+            timeout = self.config.response_timeout
+
+        pattern = as_pattern(pattern)
+        if self.metrics.enabled:
+            request = self.metrics.measure_request(pattern, data, self._send)
+        else:
+            request = self._send(pattern, data, None)
+        return await with_timeout(request, pattern, timeout)
+
+    async def _send(
+        self, pattern: Pattern, data: dict, sample: RequestSample | None
+    ) -> dict:
+        correlation_id = str(uuid.uuid4())
+        body = self.config.serializer.encode_packet(pattern, data, correlation_id)
+        if sample is not None:
+            sample.encoded(len(body))
+            self._samples[correlation_id] = sample
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[correlation_id] = future
+        try:
+            self.writer.write(encode_frame(body))
+            await self.writer.drain()
+
+            response_body = await future
+        finally:
+            self._pending.pop(correlation_id, None)
+            if sample is not None:
+                self._samples.pop(correlation_id, None)
+
+        return parse_response(response_body)
+
+    async def stream(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> AsyncIterator[Any]:
+        if not self.is_connected:
+            raise ConnectionError("TCP transport is not connected")
+
+        if timeout is None:
+            timeout = self.config.response_timeout
 
-    async def send(self, pattern: str, data: dict) -> dict:
         correlation_id = str(uuid.uuid4())
-        body = json.dumps(
-            {"id": correlation_id, "pattern": pattern, "data": data},
+        pattern = as_pattern(pattern)
+        body = self.config.serializer.encode_packet(pattern, data, correlation_id)
+        stream = self._streams[correlation_id] = ReplyStream(
+            self.config.stream_buffer
         )
-        body_with_length = f"{len(body)}#{body}"
+        try:
+            self.writer.write(encode_frame(body))
+            await self.writer.drain()
 
-        self.writer.write(body_with_length.encode("utf-8"))
-        await self.writer.drain()
+            async for response in iterate_replies(stream.get, pattern, timeout):
+                yield response
+        finally:
+            self._streams.pop(correlation_id, None)
+            stream.close()
 
-        buffer = ""
-        while True:
-            chunk = (await self.reader.read(4096)).decode()
-            if not chunk:
-                break
+    async def emit(self, pattern: PatternLike, data: dict) -> None:
+        if self._coalescer is not None:
+            await self._coalescer.add(pattern, data)
+            return
 
-            buffer += chunk
-            if "#" in buffer:
-                break
+        pattern = as_pattern(pattern)
+        body = self.config.serializer.encode_packet(pattern, data)
+        if self.metrics.enabled:
+            self.metrics.event_emitted(pattern.route, len(body))
 
-        length_str, rest = buffer.split("#", 1)
-        expected_length = int(length_str)
+        self.writer.write(encode_frame(body))
+        await self.writer.drain()
 
-        while len(rest) < expected_length:
-            rest += (await self.reader.read(4096)).decode()
+    async def emit_many(self, items: BatchItems, *, concurrency: int = 100) -> None:
+        async for chunk in chunk_items(items, concurrency):
+            await self._write_events(chunk)
 
-        response_body = json.loads(rest[:expected_length])
-        return parse_response(response_body)
+    async def flush(self) -> None:
+        if self._coalescer is not None:
+            await self._coalescer.flush()
 
-    async def emit(self, pattern: str, data: dict) -> None:
-        payload = {"pattern": pattern, "data": data}
-        body = json.dumps(payload)
-        body_with_length = f"{len(body)}#{body}"
+    async def _write_events(self, events: list[tuple[PatternLike, dict]]) -> None:
+        frames = []
+        for pattern, data in events:
+            pattern = as_pattern(pattern)
+            body = self.config.serializer.encode_packet(pattern, data)
+            if self.metrics.enabled:
+                self.metrics.event_emitted(pattern.route, len(body))
+            frames.append(encode_frame(body))
 
-        self.writer.write(body_with_length.encode("utf-8"))
+        self.writer.writelines(frames)
         await self.writer.drain()
+
+    async def _read_loop(self) -> None:
+        """
+        Read `len#json` frames from the socket and resolve the pending
+        request whose id matches the reply.
+        """
+        decoder = FrameDecoder()
+        error: Exception = ConnectionError("TCP connection closed by peer")
+        try:
+            while True:
+                chunk = await self.reader.read(65536)
+                if not chunk:
+                    break
+
+                for frame in decoder.feed(chunk):
+                    if not self._samples:
+                        response_body = self.config.serializer.loads(frame)
+                    else:
+                        started = perf_counter()
+                        response_body = self.config.serializer.loads(frame)
+                        sample = self._samples.pop(response_body.get("id"), None)
+                        if sample is not None:
+                            sample.replied(len(frame), perf_counter() - started)
+
+                    if self._streams:
+                        stream = self._streams.get(response_body.get("id"))
+                        if stream is not None:
+                            stream.put(response_body)
+                            continue
+                    self._dispatch(response_body)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            self._fail_pending(error)
+
+    def _dispatch(self, response_body: dict) -> None:
+        future = self._pending.pop(response_body.get("id"), None)
+        if future is not None and not future.done():
+            future.set_result(response_body)
+
+    def _fail_pending(self, error: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+        for stream in self._streams.values():
+            stream.fail(error)
@@ -0,0 +1,231 @@
+import asyncio
+import bisect
+import hashlib
+import itertools
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any
+
+from ..config.tcp import TCPClusterConfig, TCPConfig
+from ..exceptions.timeout import RpcTimeoutError
+from ..pattern import PatternLike
+from ..transport import Transport
+from ..utils.batch import BatchItems
+from .tcp import TCPTransport
+
+_FAILURES = (ConnectionError, RpcTimeoutError)
+
+
+@dataclass
+class TCPEndpointStats:
+    address: str
+    connected: bool
+    healthy: bool
+    in_flight: int
+    latency: float | None
+
+
+class _Endpoint:
+    __slots__ = ("config", "address", "transport", "healthy", "failures", "latency")
+
+    def __init__(self, config: TCPConfig, transport: TCPTransport):
+        self.config = config
+        self.address = f"{config.host}:{config.port}"
+        self.transport = transport
+        self.healthy = True
+        self.failures = 0
+        self.latency: float | None = None
+
+    @property
+    def available(self) -> bool:
+        return self.healthy and self.transport.is_connected
+
+
+def _hash(value: Any) -> int:
+    digest = hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class TCPClusterTransport(Transport):
+    """
+    Spreads requests over several NestJS TCP replicas, one connection each.
+
+    Endpoints are picked by `strategy`:
+    - `round_robin`: in turn.
+    - `least_outstanding`: fewest replies pending.
+    - `ewma`: lowest moving-average latency, weighted by replies pending.
+    - `consistent_hash`: by `hash_key(pattern, data)` on a hash ring, so the
+      same key keeps reaching the same replica while it is healthy. Calls
+      whose key is None use `least_outstanding`.
+
+    An endpoint is ejected after `eject_after` consecutive connection errors
+    or timeouts and re-probed every `probe_interval` seconds. Ejection only
+    affects routing, so requests already sent to it are not interrupted. If
+    every endpoint is ejected, the connected ones are used anyway.
+    """
+
+    config: TCPClusterConfig
+
+    def __init__(self, config: TCPClusterConfig):
+        self.config = config
+        self.endpoints: list[_Endpoint] = []
+        self._counter = itertools.count()
+        self._ring: list[tuple[int, int]] = sorted(
+            (_hash(f"{endpoint.host}:{endpoint.port}#{replica}"), index)
+            for index, endpoint in enumerate(config.endpoints)
+            for replica in range(config.virtual_nodes)
+        )
+        self._ring_hashes = [point for point, _ in self._ring]
+        self._probe_task: asyncio.Task | None = None
+
+    async def connect(self) -> None:
+        self.endpoints = [
+            _Endpoint(config, self._new_connection(config))
+            for config in self.config.endpoints
+        ]
+        results = await asyncio.gather(
+            *(endpoint.transport.connect() for endpoint in self.endpoints),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if len(errors) == len(self.endpoints):
+            self.endpoints = []
+            raise errors[0]
+
+        # Unreachable replicas start ejected and are picked up by the probe.
+        for endpoint, result in zip(self.endpoints, results):
+            endpoint.healthy = result is None
+
+        self._probe_task = asyncio.create_task(self._probe())
+
+    async def close(self) -> None:
+        if self._probe_task:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
+
+        endpoints, self.endpoints = self.endpoints, []
+        await asyncio.gather(*(endpoint.transport.close() for endpoint in endpoints))
+
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> Any:
+        endpoint = self._pick(pattern, data)
+        started = perf_counter()
+        try:
+            result = await endpoint.transport.send(pattern, data, timeout)
+        except _FAILURES:
+            endpoint.failures += 1
+            if endpoint.failures >= self.config.eject_after:
+                endpoint.healthy = False
+            raise
+        except Exception:
+            # An error reply still means the replica is answering.
+            self._record_latency(endpoint, perf_counter() - started)
+            raise
+        self._record_latency(endpoint, perf_counter() - started)
+        return result
+
+    async def emit(self, pattern: PatternLike, data: dict) -> None:
+        await self._pick(pattern, data).transport.emit(pattern, data)
+
+    async def emit_many(self, items: BatchItems, *, concurrency: int = 100) -> None:
+        if self.config.strategy == "consistent_hash":
+            await super().emit_many(items, concurrency=concurrency)
+            return
+        await self._pick(None, None).transport.emit_many(
+            items, concurrency=concurrency
+        )
+
+    async def flush(self) -> None:
+        await asyncio.gather(
+            *(endpoint.transport.flush() for endpoint in self.endpoints)
+        )
+
+    def stats(self) -> list[TCPEndpointStats]:
+        return [
+            TCPEndpointStats(
+                address=endpoint.address,
+                connected=endpoint.transport.is_connected,
+                healthy=endpoint.healthy,
+                in_flight=endpoint.transport.in_flight,
+                latency=endpoint.latency,
+            )
+            for endpoint in self.endpoints
+        ]
+
+    def _new_connection(self, config: TCPConfig) -> TCPTransport:
+        connection = TCPTransport(config)
+        connection.metrics = self.metrics
+        return connection
+
+    def _record_latency(self, endpoint: _Endpoint, latency: float) -> None:
+        endpoint.failures = 0
+        if endpoint.latency is None:
+            endpoint.latency = latency
+        else:
+            alpha = self.config.ewma_alpha
+            endpoint.latency += alpha * (latency - endpoint.latency)
+
+    def _pick(self, pattern: PatternLike | None, data: Any) -> _Endpoint:
+        candidates = [endpoint for endpoint in self.endpoints if endpoint.available]
+        if not candidates:
+            candidates = [e for e in self.endpoints if e.transport.is_connected]
+            if not candidates:
+                raise ConnectionError("No TCP endpoint in the cluster is available")
+
+        strategy = self.config.strategy
+        if strategy == "consistent_hash" and self.config.hash_key is not None:
+            key = self.config.hash_key(pattern, data) if pattern is not None else None
+            if key is not None:
+                return self._pick_by_hash(key, candidates)
+            strategy = "least_outstanding"
+
+        if strategy == "round_robin":
+            return candidates[next(self._counter) % len(candidates)]
+        if strategy == "ewma":
+            return min(
+                candidates,
+                key=lambda e: (e.latency or 0.0) * (e.transport.in_flight + 1),
+            )
+        return min(candidates, key=lambda e: e.transport.in_flight)
+
+    def _pick_by_hash(self, key: Any, candidates: list[_Endpoint]) -> _Endpoint:
+        # Walk the ring clockwise from the key to the first usable endpoint.
+        start = bisect.bisect(self._ring_hashes, _hash(key))
+        for offset in range(len(self._ring)):
+            _, index = self._ring[(start + offset) % len(self._ring)]
+            endpoint = self.endpoints[index]
+            if endpoint in candidates:
+                return endpoint
+        return candidates[0]
+
+    async def _probe(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.probe_interval)
+
+            for endpoint in self.endpoints:
+                if endpoint.available:
+                    continue
+
+                if not endpoint.transport.is_connected:
+                    replacement = self._new_connection(endpoint.config)
+                    try:
+                        await replacement.connect()
+                    except Exception:
+                        endpoint.healthy = False
+                        continue
+                    previous, endpoint.transport = endpoint.transport, replacement
+                    try:
+                        await previous.close()
+                    except Exception:
+                        # A dead connection failing to close must not stop
+                        # the probe loop.
+                        pass
+
+                # Readmit on probation: one more failure ejects it again.
+                endpoint.healthy = True
+                endpoint.failures = self.config.eject_after - 1
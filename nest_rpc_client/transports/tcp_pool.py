@@ -0,0 +1,158 @@
+import asyncio
+from dataclasses import dataclass, field
+
+from ..config.tcp import TCPPoolConfig
+from ..exceptions.circuit import CircuitOpenError
+from ..pattern import PatternLike
+from ..transport import Transport
+from ..utils.batch import BatchItems
+from ..utils.circuit import CircuitBreaker, CircuitState
+from .tcp import TCPTransport
+
+
+@dataclass
+class TCPPoolStats:
+    size: int
+    connected: int
+    in_flight: list[int]
+    reconnects: int
+    circuits: list[CircuitState] = field(default_factory=list)
+
+
+class TCPPoolTransport(Transport):
+    """
+    Keeps `pool_size` TCP connections to the same server and sends every
+    request over the connection with the fewest replies outstanding.
+    Dead connections are replaced in the background.
+
+    With `circuit_breaker` configured, each connection slot gets its own
+    circuit and requests avoid connections whose circuit is open.
+    """
+
+    config: TCPPoolConfig
+    connections: list[TCPTransport]
+
+    def __init__(self, config: TCPPoolConfig):
+        self.config = config
+        self.connections = []
+        self._reconnects = 0
+        self._maintain_task: asyncio.Task | None = None
+        self.breakers: list[CircuitBreaker] = []
+
+    async def connect(self) -> None:
+        connections = [self._new_connection() for _ in range(self.config.pool_size)]
+        results = await asyncio.gather(
+            *(connection.connect() for connection in connections),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                await asyncio.gather(*(c.close() for c in connections))
+                raise result
+
+        self.connections = connections
+        if self.config.circuit_breaker is not None:
+            address = f"{self.config.host}:{self.config.port}"
+            self.breakers = [
+                CircuitBreaker(
+                    f"{address}#{index}",
+                    self.config.circuit_breaker,
+                    self._state_changed,
+                )
+                for index in range(len(connections))
+            ]
+        self._maintain_task = asyncio.create_task(self._maintain())
+
+    async def close(self) -> None:
+        if self._maintain_task:
+            self._maintain_task.cancel()
+            try:
+                await self._maintain_task
+            except asyncio.CancelledError:
+                pass
+            self._maintain_task = None
+
+        connections, self.connections = self.connections, []
+        await asyncio.gather(*(connection.close() for connection in connections))
+
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> dict:
+        if not self.breakers:
+            return await self._pick().send(pattern, data, timeout)
+
+        index = self._pick_index(skip_open=True)
+        breaker = self.breakers[index]
+        breaker.allow()
+        return await breaker.call(self.connections[index].send(pattern, data, timeout))
+
+    async def emit(self, pattern: PatternLike, data: dict) -> None:
+        await self._pick().emit(pattern, data)
+
+    async def emit_many(self, items: BatchItems, *, concurrency: int = 100) -> None:
+        await self._pick().emit_many(items, concurrency=concurrency)
+
+    async def flush(self) -> None:
+        await asyncio.gather(*(connection.flush() for connection in self.connections))
+
+    def stats(self) -> TCPPoolStats:
+        return TCPPoolStats(
+            size=len(self.connections),
+            connected=sum(c.is_connected for c in self.connections),
+            in_flight=[c.in_flight for c in self.connections],
+            reconnects=self._reconnects,
+            circuits=[breaker.state for breaker in self.breakers],
+        )
+
+    def _new_connection(self) -> TCPTransport:
+        connection = TCPTransport(self.config)
+        connection.metrics = self.metrics
+        return connection
+
+    def _state_changed(self, circuit: str, state: CircuitState) -> None:
+        if self.metrics.enabled:
+            self.metrics.circuit_state_changed(circuit, state.value)
+
+    def _pick(self) -> TCPTransport:
+        return self.connections[self._pick_index()]
+
+    def _pick_index(self, skip_open: bool = False) -> int:
+        best = None
+        open_circuits = False
+        for index, connection in enumerate(self.connections):
+            if not connection.is_connected:
+                continue
+            if skip_open and not self.breakers[index].available:
+                open_circuits = True
+                continue
+            if best is None or connection.in_flight < self.connections[best].in_flight:
+                best = index
+                if connection.in_flight == 0:
+                    break
+
+        if best is None:
+            if open_circuits:
+                raise CircuitOpenError(
+                    f"{self.config.host}:{self.config.port}",
+                    min(b.retry_after for b in self.breakers if not b.available),
+                )
+            raise ConnectionError("No TCP connection in the pool is available")
+        return best
+
+    async def _maintain(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.reconnect_delay)
+
+            for index, connection in enumerate(self.connections):
+                if connection.is_connected:
+                    continue
+
+                replacement = self._new_connection()
+                try:
+                    await replacement.connect()
+                except Exception:
+                    continue
+
+                self.connections[index] = replacement
+                self._reconnects += 1
+                await connection.close()
@@ -0,0 +1,44 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+from ..pattern import PatternLike
+from ..transport import Transport
+from ..utils.batch import BatchItems
+
+
+class WrapperTransport(Transport):
+    """
+    Base class for transports that add behaviour around another transport.
+    Every method delegates to the wrapped transport unless overridden.
+    """
+
+    transport: Transport
+
+    def __init__(self, transport: Transport):
+        self.transport = transport
+
+    async def connect(self) -> None:
+        await self.transport.connect()
+
+    async def close(self) -> None:
+        await self.transport.close()
+
+    async def send(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> Any:
+        return await self.transport.send(pattern, data, timeout)
+
+    async def stream(
+        self, pattern: PatternLike, data: dict, timeout: float | None = None
+    ) -> AsyncIterator[Any]:
+        async for response in self.transport.stream(pattern, data, timeout):
+            yield response
+
+    async def emit(self, pattern: PatternLike, data: dict) -> None:
+        await self.transport.emit(pattern, data)
+
+    async def emit_many(self, items: BatchItems, *, concurrency: int = 100) -> None:
+        await self.transport.emit_many(items, concurrency=concurrency)
+
+    async def flush(self) -> None:
+        await self.transport.flush()
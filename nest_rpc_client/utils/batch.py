@@ -0,0 +1,92 @@
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any
+
+from ..pattern import PatternLike
+
+BatchItems = Iterable[tuple[PatternLike, Any]] | AsyncIterable[tuple[PatternLike, Any]]
+
+
+async def iterate_items(items: BatchItems) -> AsyncIterator[tuple[PatternLike, Any]]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def chunk_items(
+    items: BatchItems, size: int
+) -> AsyncIterator[list[tuple[PatternLike, Any]]]:
+    chunk = []
+    async for item in iterate_items(items):
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def run_bounded(
+    call: Callable[[PatternLike, Any], Awaitable[Any]],
+    items: BatchItems,
+    *,
+    concurrency: int,
+    ordered: bool,
+    return_exceptions: bool,
+) -> AsyncIterator[tuple[int, Any]]:
+    """
+    Run `call(pattern, data)` for every item with at most `concurrency` calls
+    in flight and yield `(index, result)` pairs, either in input order or as
+    soon as each call completes.
+
+    In ordered mode completed results waiting for an earlier item count
+    towards the limit, so a slow item cannot make the buffer grow unbounded.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    iterator = aiter(iterate_items(items))
+    exhausted = False
+    running: dict[asyncio.Task, int] = {}
+    buffered: dict[int, Any] = {}
+    next_index = 0
+    next_yield = 0
+
+    try:
+        while True:
+            while not exhausted and len(running) + len(buffered) < concurrency:
+                try:
+                    pattern, data = await anext(iterator)
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                running[asyncio.ensure_future(call(pattern, data))] = next_index
+                next_index += 1
+
+            if not running:
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=running.__getitem__):
+                index = running.pop(task)
+                error = task.exception()
+                if error is not None and not return_exceptions:
+                    raise error
+                result = error if error is not None else task.result()
+
+                if ordered:
+                    buffered[index] = result
+                else:
+                    yield index, result
+
+            while next_yield in buffered:
+                yield next_yield, buffered.pop(next_yield)
+                next_yield += 1
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
@@ -0,0 +1,143 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from enum import Enum
+from typing import TypeVar
+
+from ..config.circuit import CircuitBreakerConfig
+
+T = TypeVar("T")
+
+_BUCKETS = 10
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Tracks the failure rate of calls over a rolling `window` (in ten
+    buckets). Once at least `minimum_requests` calls were made and the rate
+    reaches `failure_rate`, the circuit opens and rejects calls for
+    `open_duration` seconds. After that it lets `half_open_requests` trial
+    calls through: if they all succeed it closes, otherwise it opens again.
+
+    Only errors listed in `trip_on` count as failures; an `RpcException`
+    reply means the server is answering.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: CircuitBreakerConfig,
+        on_change: Callable[[str, CircuitState], None] | None = None,
+    ):
+        self.name = name
+        self.config = config
+        self.state = CircuitState.CLOSED
+        self._on_change = on_change
+        self._buckets: deque[list[int]] = deque()  # [index, calls, failures]
+        self._opened_at = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+
+    @property
+    def retry_after(self) -> float:
+        if self.state is not CircuitState.OPEN:
+            return 0.0
+        return max(self._opened_at + self.config.open_duration - time.monotonic(), 0.0)
+
+    @property
+    def available(self) -> bool:
+        """Whether `allow` would let a call through, without recording one."""
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self.state is CircuitState.OPEN:
+            return self.retry_after == 0.0
+        return self._trials < self.config.half_open_requests
+
+    def allow(self) -> bool:
+        if self.state is CircuitState.OPEN:
+            if self.retry_after > 0:
+                return False
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self.state is CircuitState.HALF_OPEN:
+            if self._trials >= self.config.half_open_requests:
+                return False
+            self._trials += 1
+        return True
+
+    def record(self, error: BaseException | None) -> None:
+        failed = error is not None and isinstance(error, self.config.trip_on)
+
+        if self.state is CircuitState.HALF_OPEN:
+            if failed:
+                self._transition(CircuitState.OPEN)
+                return
+            self._trial_successes += 1
+            if self._trial_successes >= self.config.half_open_requests:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        if self.state is CircuitState.OPEN:
+            # A call started before the circuit opened.
+            return
+
+        calls, failures = self._count(failed)
+        if (
+            calls >= self.config.minimum_requests
+            and failures >= calls * self.config.failure_rate
+        ):
+            self._transition(CircuitState.OPEN)
+
+    def abandon(self) -> None:
+        """Forget a call that was cancelled before it had an outcome."""
+        if self.state is CircuitState.HALF_OPEN:
+            self._trials -= 1
+
+    async def call(self, awaitable: Awaitable[T]) -> T:
+        """Await an already allowed call and record its outcome."""
+        try:
+            result = await awaitable
+        except asyncio.CancelledError:
+            self.abandon()
+            raise
+        except BaseException as e:
+            self.record(e)
+            raise
+        self.record(None)
+        return result
+
+    def _count(self, failed: bool) -> tuple[int, int]:
+        index = int(time.monotonic() * _BUCKETS / self.config.window)
+        buckets = self._buckets
+        while buckets and buckets[0][0] <= index - _BUCKETS:
+            buckets.popleft()
+        if not buckets or buckets[-1][0] != index:
+            buckets.append([index, 0, 0])
+
+        bucket = buckets[-1]
+        bucket[1] += 1
+        bucket[2] += failed
+
+        calls = failures = 0
+        for _, bucket_calls, bucket_failures in buckets:
+            calls += bucket_calls
+            failures += bucket_failures
+        return calls, failures
+
+    def _transition(self, state: CircuitState) -> None:
+        self.state = state
+        self._trials = 0
+        self._trial_successes = 0
+        if state is CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        elif state is CircuitState.CLOSED:
+            self._buckets.clear()
+        if self._on_change is not None:
+            self._on_change(self.name, state)
@@ -0,0 +1,67 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from ..pattern import PatternLike
+
+
+class EmitCoalescer:
+    """
+    Buffers emitted events and hands them to `write_batch` in one call once
+    `batch_size` events are queued or `linger` seconds have passed since the
+    first buffered event.
+
+    An error raised by a background (linger) flush is re-raised by the next
+    `add` or `flush` call.
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[list[tuple[PatternLike, Any]]], Awaitable[None]],
+        batch_size: int,
+        linger: float,
+    ):
+        self.write_batch = write_batch
+        self.batch_size = batch_size
+        self.linger = linger
+        self._buffer: list[tuple[PatternLike, Any]] = []
+        self._lock = asyncio.Lock()
+        self._linger_task: asyncio.Task | None = None
+        self._error: Exception | None = None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    async def add(self, pattern: PatternLike, data: Any) -> None:
+        self._raise_pending_error()
+        self._buffer.append((pattern, data))
+
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+        elif self._linger_task is None:
+            self._linger_task = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        task = self._linger_task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self._linger_task = None
+
+        async with self._lock:
+            batch, self._buffer = self._buffer, []
+            if batch:
+                await self.write_batch(batch)
+
+        self._raise_pending_error()
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.linger)
+        try:
+            await self.flush()
+        except Exception as e:
+            self._error = e
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
@@ -0,0 +1,287 @@
+import dataclasses
+import enum
+import sys
+import types
+from collections.abc import Callable
+from functools import partial
+from typing import (
+    Annotated,
+    Any,
+    Literal,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+    is_typeddict,
+)
+
+from ..exceptions.decode import ResponseDecodeError
+
+Decoder = Callable[[Any], Any]
+
+_decoders: dict[Any, Decoder] = {}
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# Decoders that only check the reply and return it unchanged, so containers
+# of them can return the reply itself instead of a copy.
+_checks: set[Decoder] = {_identity}
+
+
+def _check(decoder: Decoder) -> Decoder:
+    _checks.add(decoder)
+    return decoder
+
+
+def _compile_scalar(tp: type, accepted: tuple[type, ...]) -> Decoder:
+    # `bool` is a subclass of `int`, but `true` is not a number in JSON.
+    reject_bool = tp is not bool
+
+    def decode(value: Any) -> Any:
+        if not isinstance(value, accepted) or (
+            reject_bool and isinstance(value, bool)
+        ):
+            raise TypeError(f"expected {tp.__name__}, got {type(value).__name__}")
+        return value
+
+    return _check(decode)
+
+
+_scalars: dict[type, Decoder] = {
+    tp: _compile_scalar(tp, accepted)
+    for tp, accepted in (
+        (int, (int,)),
+        (float, (int, float)),
+        (str, (str,)),
+        (bool, (bool,)),
+        (type(None), (type(None),)),
+        (list, (list,)),
+        (dict, (dict,)),
+    )
+}
+
+
+def decode_response(response: Any, response_type: Any) -> Any:
+    """
+    Convert a parsed reply into `response_type`, raising `ResponseDecodeError`
+    if it does not fit.
+    """
+    try:
+        return get_decoder(response_type)(response)
+    except ResponseDecodeError:
+        raise
+    except (TypeError, ValueError, KeyError) as e:
+        raise ResponseDecodeError(response_type, str(e)) from e
+
+
+def get_decoder(response_type: Any) -> Decoder:
+    """
+    Return the decoder for `response_type`, compiling it on first use.
+
+    Dataclasses, TypedDicts and containers of them get a converter built
+    from their type hints once. msgspec `Struct`s and pydantic models are
+    handed to their own compiled validators. JSON scalars, `Literal`s and
+    enums are checked against the reply. `Any` and classes a JSON reply
+    cannot hold decode to the reply unchecked.
+    """
+    decoder = _decoders.get(response_type)
+    if decoder is not None:
+        return decoder
+
+    # Recursive types reach themselves through this stub while compiling.
+    _decoders[response_type] = lambda value: _decoders[response_type](value)
+    try:
+        decoder = _compile(response_type)
+    except BaseException:
+        del _decoders[response_type]
+        raise
+    _decoders[response_type] = decoder
+    return decoder
+
+
+def _compile(tp: Any) -> Decoder:
+    if isinstance(tp, type):
+        # A reply can only hold these models if their library is imported.
+        msgspec = sys.modules.get("msgspec")
+        if msgspec is not None and issubclass(tp, msgspec.Struct):
+            return partial(msgspec.convert, type=tp)
+        pydantic = sys.modules.get("pydantic")
+        if pydantic is not None and issubclass(tp, pydantic.BaseModel):
+            return tp.model_validate
+        if issubclass(tp, enum.Enum):
+            return tp
+        if dataclasses.is_dataclass(tp):
+            return _compile_dataclass(tp)
+        if is_typeddict(tp):
+            return _compile_typeddict(tp)
+        return _scalars.get(tp, _identity)
+
+    origin = get_origin(tp)
+    args = get_args(tp)
+    if origin is Annotated:
+        return get_decoder(args[0])
+    if origin is Literal:
+        return _compile_literal(args)
+    if origin is Union or origin is types.UnionType:
+        return _compile_union(tp, args)
+    if origin in (list, set, frozenset) and args:
+        return _compile_sequence(origin, get_decoder(args[0]))
+    if origin is tuple and args:
+        return _compile_tuple(args)
+    if origin is dict and len(args) == 2:
+        return _compile_dict(get_decoder(args[1]))
+    if origin is not None and dataclasses.is_dataclass(origin):
+        return get_decoder(origin)
+    return _identity
+
+
+def _expect_object(value: Any, name: str) -> None:
+    if not isinstance(value, dict):
+        raise TypeError(f"expected an object for {name}, got {type(value).__name__}")
+
+
+def _compile_dataclass(cls: type) -> Decoder:
+    hints = get_type_hints(cls)
+    fields = [
+        (field.name, get_decoder(hints[field.name]))
+        for field in dataclasses.fields(cls)
+        if field.init
+    ]
+    name = cls.__name__
+
+    def decode(value: Any) -> Any:
+        _expect_object(value, name)
+        return cls(
+            **{
+                field: decoder(value[field])
+                for field, decoder in fields
+                if field in value
+            }
+        )
+
+    return decode
+
+
+def _compile_typeddict(tp: type) -> Decoder:
+    hints = get_type_hints(tp)
+    required = tp.__required_keys__  # type: ignore[attr-defined]
+    decoders = {
+        key: decoder
+        for key, hint in hints.items()
+        if (decoder := get_decoder(hint)) is not _identity
+    }
+    checks_only = all(decoder in _checks for decoder in decoders.values())
+    name = tp.__name__
+
+    def decode(value: Any) -> Any:
+        _expect_object(value, name)
+        missing = required - value.keys()
+        if missing:
+            raise KeyError(f"{name} is missing {', '.join(sorted(missing))}")
+        if checks_only:
+            for key, decoder in decoders.items():
+                if key in value:
+                    decoder(value[key])
+            return value
+        return {
+            key: decoders[key](item) if key in decoders else item
+            for key, item in value.items()
+        }
+
+    return _check(decode) if checks_only else decode
+
+
+def _compile_union(tp: Any, args: tuple) -> Decoder:
+    optional = type(None) in args
+    decoders = [get_decoder(arg) for arg in args if arg is not type(None)]
+    if all(decoder is _identity for decoder in decoders):
+        return _identity
+
+    checks_only = all(decoder in _checks for decoder in decoders)
+
+    if len(decoders) == 1:
+        (inner,) = decoders
+
+        def decode_optional(value: Any) -> Any:
+            return None if value is None else inner(value)
+
+        return _check(decode_optional) if checks_only else decode_optional
+
+    def decode(value: Any) -> Any:
+        if value is None and optional:
+            return None
+        for decoder in decoders:
+            try:
+                return decoder(value)
+            except (TypeError, ValueError, KeyError):
+                continue
+        raise ResponseDecodeError(tp, "reply matches none of the union members")
+
+    return _check(decode) if checks_only else decode
+
+
+def _compile_literal(args: tuple) -> Decoder:
+    # `1 == True`, so the value's type has to match as well.
+    members = {(type(arg), arg): arg for arg in args}
+    for arg in args:
+        if isinstance(arg, enum.Enum):
+            members[type(arg.value), arg.value] = arg
+    expected = ", ".join(map(repr, args))
+
+    def decode(value: Any) -> Any:
+        try:
+            return members[type(value), value]
+        except (KeyError, TypeError):
+            raise ValueError(f"expected one of {expected}, got {value!r}") from None
+
+    if any(isinstance(arg, enum.Enum) for arg in args):
+        return decode
+    return _check(decode)
+
+
+def _compile_sequence(container: type, items: Decoder) -> Decoder:
+    checks_only = items in _checks
+
+    def decode(value: Any) -> Any:
+        if not isinstance(value, list):
+            raise TypeError(f"expected an array, got {type(value).__name__}")
+        if not checks_only:
+            return container([items(item) for item in value])
+        if items is not _identity:
+            for item in value:
+                items(item)
+        return value if container is list else container(value)
+
+    return _check(decode) if checks_only and container is list else decode
+
+
+def _compile_tuple(args: tuple) -> Decoder:
+    if len(args) == 2 and args[1] is Ellipsis:
+        return _compile_sequence(tuple, get_decoder(args[0]))
+
+    decoders = [get_decoder(arg) for arg in args]
+
+    def decode(value: Any) -> Any:
+        if not isinstance(value, list) or len(value) != len(decoders):
+            raise TypeError(f"expected an array of {len(decoders)} items")
+        return tuple(decoder(item) for decoder, item in zip(decoders, value))
+
+    return decode
+
+
+def _compile_dict(values: Decoder) -> Decoder:
+    checks_only = values in _checks
+
+    def decode(value: Any) -> Any:
+        _expect_object(value, "dict")
+        if not checks_only:
+            return {key: values(item) for key, item in value.items()}
+        if values is not _identity:
+            for item in value.values():
+                values(item)
+        return value
+
+    return _check(decode) if checks_only else decode
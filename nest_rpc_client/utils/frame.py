@@ -0,0 +1,118 @@
+# NestJS `JsonSocket` frames messages as `<length>#<json>`, where `<length>` is
+# the JavaScript string length of the JSON body, i.e. its UTF-16 code units.
+# For ASCII bodies that equals the byte length, which is the fast path here.
+
+
+def _utf16_length(body: bytes) -> int:
+    return len(body.decode("utf-8").encode("utf-16-le")) // 2
+
+
+# Bytes that are not UTF-8 continuation bytes, and bytes that are not lead
+# bytes of 4-byte sequences (the characters taking two UTF-16 code units).
+_NOT_CONTINUATION = bytes(b for b in range(256) if b & 0xC0 != 0x80)
+_NOT_FOUR_BYTE_LEAD = bytes(b for b in range(256) if b < 0xF0)
+
+
+def _sequence_size(lead: int) -> int:
+    if lead < 0xE0:
+        return 1 if lead < 0x80 else 2
+    return 3 if lead < 0xF0 else 4
+
+
+def _utf16_units(data: bytes) -> int:
+    if data.isascii():
+        return len(data)
+    continuation = len(data.translate(None, _NOT_CONTINUATION))
+    four_byte = len(data.translate(None, _NOT_FOUR_BYTE_LEAD))
+    return len(data) - continuation + four_byte
+
+
+def _complete_prefix(data: bytes) -> int:
+    """Return the size of `data` without a trailing incomplete character."""
+    for index in range(len(data) - 1, max(len(data) - 4, 0) - 1, -1):
+        if data[index] & 0xC0 != 0x80:
+            if index + _sequence_size(data[index]) > len(data):
+                return index
+            break
+    return len(data)
+
+
+def encode_frame(body: bytes) -> bytes:
+    length = len(body) if body.isascii() else _utf16_length(body)
+    return b"%d#%b" % (length, body)
+
+
+class FrameDecoder:
+    """
+    Incremental decoder for the `<length>#<json>` TCP framing.
+
+    Bytes are accumulated in a single buffer and every call to `feed` returns
+    all frames completed by the new data, keeping any trailing partial frame
+    for the next call.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._body_start: int | None = None
+        self._length = 0
+        # How far the current body has been scanned, in bytes, and how many
+        # UTF-16 code units that covers, so each byte is counted only once.
+        self._scanned = 0
+        self._units = 0
+
+    def feed(self, data: bytes) -> list[bytes]:
+        buffer = self._buffer
+        buffer += data
+        frames = []
+        position = 0
+
+        while True:
+            if self._body_start is None:
+                separator = buffer.find(b"#", position)
+                if separator == -1:
+                    break
+                self._length = int(buffer[position:separator])
+                self._body_start = self._scanned = separator + 1
+                self._units = 0
+
+            if not self._scan():
+                break
+
+            frames.append(bytes(buffer[self._body_start : self._scanned]))
+            position = self._scanned
+            self._body_start = None
+
+        if position:
+            del buffer[:position]
+            if self._body_start is not None:
+                self._body_start -= position
+                self._scanned -= position
+
+        return frames
+
+    def _scan(self) -> bool:
+        """
+        Count the UTF-16 code units of the current body from where the last
+        call stopped. Return True once the body is complete.
+        """
+        buffer = self._buffer
+        while self._units < self._length:
+            # The remaining units span at least as many bytes, so this never
+            # reads past the body.
+            needed = self._length - self._units
+            chunk = bytes(buffer[self._scanned : self._scanned + needed])
+            size = _complete_prefix(chunk)
+            if size:
+                self._units += _utf16_units(chunk[:size])
+                self._scanned += size
+                continue
+
+            # The next character is longer in bytes than the units left.
+            if not chunk:
+                return False
+            size = _sequence_size(chunk[0])
+            if self._scanned + size > len(buffer):
+                return False
+            self._units += 2 if size == 4 else 1
+            self._scanned += size
+        return True
@@ -0,0 +1,71 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from ..exceptions.rpc import RpcException
+from ..exceptions.stream import StreamOverflowError
+from ..pattern import PatternLike
+from .timeout import with_timeout
+
+
+async def iterate_replies(
+    get: Callable[[], Awaitable[dict]], pattern: PatternLike, timeout: float | None
+) -> AsyncIterator[Any]:
+    """
+    Yield the `response` of every reply returned by `get` until one is
+    flagged `isDisposed`, which is how NestJS ends an `Observable` reply.
+    `timeout` applies to the wait for each reply.
+    """
+    while True:
+        response_body = await with_timeout(get(), pattern, timeout)
+        if "err" in response_body:
+            raise RpcException(response_body["err"])
+        if "response" in response_body:
+            yield response_body["response"]
+        if response_body.get("isDisposed"):
+            return
+
+
+class ReplyStream:
+    """
+    Buffer of replies to one streamed request, filled by a transport's
+    reader. `put` never waits, so the reader shared with other requests is
+    never held up by this stream's consumer. A consumer that falls
+    `max_buffer` replies behind gets `StreamOverflowError` after the
+    buffered replies, and later replies are dropped.
+    """
+
+    def __init__(self, max_buffer: int):
+        self.max_buffer = max_buffer
+        self._buffer: deque[dict] = deque()
+        self._error: Exception | None = None
+        self._closed = False
+        self._readable = asyncio.Event()
+
+    def put(self, response_body: dict) -> None:
+        if self._closed or self._error is not None:
+            return
+        if len(self._buffer) >= self.max_buffer:
+            self.fail(StreamOverflowError(self.max_buffer))
+            return
+        self._buffer.append(response_body)
+        self._readable.set()
+
+    def fail(self, error: Exception) -> None:
+        if self._error is None:
+            self._error = error
+        self._readable.set()
+
+    def close(self) -> None:
+        """Drop buffered replies and ignore any that arrive later."""
+        self._closed = True
+        self._buffer.clear()
+
+    async def get(self) -> dict:
+        while not self._buffer:
+            if self._error is not None:
+                raise self._error
+            self._readable.clear()
+            await self._readable.wait()
+        return self._buffer.popleft()
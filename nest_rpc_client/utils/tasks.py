@@ -0,0 +1,10 @@
+import asyncio
+
+
+def retrieve_exception(task: asyncio.Future) -> None:
+    """
+    Done callback for tasks whose result may never be awaited. It marks
+    their error as retrieved so asyncio does not log it as unhandled.
+    """
+    if not task.cancelled():
+        task.exception()
@@ -0,0 +1,25 @@
+import asyncio
+from collections.abc import Awaitable
+from typing import Any
+
+from ..exceptions.timeout import RpcTimeoutError
+from ..pattern import PatternLike, as_pattern
+
+
+async def with_timeout(
+    awaitable: Awaitable[Any], pattern: PatternLike, timeout: float | None
+) -> Any:
+    """
+    Await `awaitable`, cancelling it and raising `RpcTimeoutError` if it takes
+    longer than `timeout` seconds. `None` waits indefinitely.
+    """
+    if timeout is None:
+        return await awaitable
+
+    try:
+        async with asyncio.timeout(timeout) as scope:
+            return await awaitable
+    except TimeoutError:
+        if scope.expired():
+            raise RpcTimeoutError(as_pattern(pattern).route, timeout) from None
+        raise
@@ -0,0 +1,31 @@
+import pytest
+
+from nest_rpc_client.metrics import RequestSample
+
+prometheus_client = pytest.importorskip("prometheus_client")
+
+from nest_rpc_client.exporters.prometheus import PrometheusMetrics  # noqa: E402
+
+
+def test_prometheus_metrics_record_requests_and_events():
+    registry = prometheus_client.CollectorRegistry()
+    metrics = PrometheusMetrics(registry=registry)
+
+    metrics.request_started("sum")
+    sample = RequestSample("sum")
+    sample.encoded(10)
+    sample.replied(20, 0.001)
+    metrics.request_finished(sample, ValueError())
+    metrics.event_emitted("log", 5)
+    metrics.circuit_state_changed("sum", "open")
+
+    def value(name, **labels):
+        return registry.get_sample_value(f"nest_rpc_client_{name}", labels)
+
+    assert value("requests_total", pattern="sum") == 1
+    assert value("request_errors_total", pattern="sum") == 1
+    assert value("requests_in_flight", pattern="sum") == 0
+    assert value("request_phase_seconds_count", pattern="sum", phase="wire") == 1
+    assert value("bytes_total", pattern="sum", direction="in") == 20
+    assert value("events_total", pattern="log") == 1
+    assert value("circuit_state", circuit="sum") == 2
@@ -0,0 +1,133 @@
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from nest_rpc_client.exceptions.decode import ResponseDecodeError
+from nest_rpc_client.pattern import Pattern
+from nest_rpc_client.serializers.json import JSONSerializer
+from nest_rpc_client.utils.parse_response import parse_response
+
+envelope = {"id": "abc", "pattern": "sum", "data": {"values": [1, 2], "name": "é"}}
+serializers = [
+    ("nest_rpc_client.serializers.json", "JSONSerializer"),
+    ("nest_rpc_client.serializers.orjson", "OrjsonSerializer"),
+    ("nest_rpc_client.serializers.msgpack", "MsgpackSerializer"),
+    ("nest_rpc_client.serializers.msgspec", "MsgspecSerializer"),
+]
+json_serializers = [
+    ("nest_rpc_client.serializers.json", "JSONSerializer"),
+    ("nest_rpc_client.serializers.orjson", "OrjsonSerializer"),
+    ("nest_rpc_client.serializers.msgspec", "MsgspecSerializer"),
+]
+
+
+@dataclass
+class User:
+    id: int
+    name: str
+
+
+def test_json_serializer_matches_stdlib():
+    serializer = JSONSerializer()
+
+    encoded = serializer.dumps(envelope)
+
+    assert encoded == json.dumps(envelope).encode("utf-8")
+    assert serializer.loads(encoded) == envelope
+    assert serializer.loads(encoded.decode("utf-8")) == envelope
+
+
+def test_orjson_serializer_roundtrip():
+    pytest.importorskip("orjson")
+    from nest_rpc_client.serializers.orjson import OrjsonSerializer
+
+    serializer = OrjsonSerializer()
+
+    encoded = serializer.dumps(envelope)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == envelope
+    assert serializer.loads(encoded) == envelope
+
+
+def test_msgpack_serializer_roundtrip():
+    pytest.importorskip("msgpack")
+    from nest_rpc_client.serializers.msgpack import MsgpackSerializer
+
+    serializer = MsgpackSerializer()
+
+    assert serializer.loads(serializer.dumps(envelope)) == envelope
+
+
+@pytest.mark.parametrize("module, name", serializers)
+@pytest.mark.parametrize("pattern", ["sum", {"role": "math", "cmd": "sum"}])
+def test_encode_packet_matches_dumps(module, name, pattern):
+    serializer = getattr(pytest.importorskip(module), name)()
+    data = {"values": [1, 2], "name": "é"}
+    cached = Pattern(pattern)
+
+    for _ in range(2):
+        assert serializer.encode_packet(cached, data, "abc") == serializer.dumps(
+            {"id": "abc", "pattern": pattern, "data": data}
+        )
+        assert serializer.encode_packet(cached, data) == serializer.dumps(
+            {"pattern": pattern, "data": data}
+        )
+
+
+@pytest.mark.parametrize("module, name", serializers)
+def test_templates_are_shared_by_serializer_instances(module, name):
+    serializer_type = getattr(pytest.importorskip(module), name)
+    pattern = Pattern("shared")
+
+    for _ in range(100):
+        serializer_type().encode_packet(pattern, {}, "abc")
+
+    assert len(pattern._templates) == 1
+
+
+def test_msgspec_serializer_roundtrip():
+    pytest.importorskip("msgspec")
+    from nest_rpc_client.serializers.msgspec import MsgspecSerializer
+
+    serializer = MsgspecSerializer()
+
+    encoded = serializer.dumps(envelope)
+
+    assert json.loads(encoded) == envelope
+    assert serializer.loads(encoded) == envelope
+
+
+@pytest.mark.parametrize("module, name", json_serializers)
+def test_loads_reply_decodes_response(module, name):
+    serializer = getattr(pytest.importorskip(module), name)()
+    reply = b'{"id":"a","response":[{"id":1,"name":"x","extra":0}],"isDisposed":true}'
+
+    assert parse_response(serializer.loads_reply(reply, list[User])) == [
+        User(1, "x")
+    ]
+
+
+@pytest.mark.parametrize("module, name", json_serializers)
+def test_loads_reply_keeps_errors_and_rejects_mismatches(module, name):
+    serializer = getattr(pytest.importorskip(module), name)()
+
+    error = serializer.loads_reply(b'{"id":"a","err":"boom"}', User)
+    assert error["err"] == "boom"
+
+    with pytest.raises(ResponseDecodeError):
+        serializer.loads_reply(b'{"id":"a","response":{"id":true}}', User)
+
+
+def test_msgspec_loads_reply_hands_unknown_types_to_compiled_decoders():
+    pydantic = pytest.importorskip("pydantic")
+    pytest.importorskip("msgspec")
+    from nest_rpc_client.serializers.msgspec import MsgspecSerializer
+
+    class Model(pydantic.BaseModel):
+        id: int
+
+    reply = MsgspecSerializer().loads_reply(b'{"response":[{"id":1}]}', list[Model])
+
+    assert reply == {"response": [Model(id=1)]}
@@ -1,7 +1,14 @@
+import asyncio
+from dataclasses import dataclass
+
 import pytest
 
 from nest_rpc_client.client import Client
+from nest_rpc_client.exceptions import RpcTimeoutError
+from nest_rpc_client.interceptor import Interceptor
 from nest_rpc_client.transports.mock import MockTransport
+from nest_rpc_client.transports.wrapper import WrapperTransport
+from nest_rpc_client.utils.timeout import with_timeout
 
 
 @pytest.mark.asyncio
@@ -21,3 +28,102 @@ async def test_client_send_and_emit():
     assert transport.closed is True
     assert transport.sent_patterns == [("sum", {"a": 1, "b": 2})]
     assert transport.emitted_patterns == [("log", {"msg": "hello"})]
+
+
+@pytest.mark.asyncio
+async def test_client_send_many_and_emit_many():
+    transport = MockTransport()
+
+    async with Client(transport) as client:
+        results = [
+            item
+            async for item in client.send_many(
+                [("sum", {"n": 1}), ("sum", {"n": 2})], concurrency=1
+            )
+        ]
+        await client.emit_many([("log", {"n": 1}), ("log", {"n": 2})])
+
+    assert [index for index, _ in results] == [0, 1]
+    assert [result["data"] for _, result in results] == [{"n": 1}, {"n": 2}]
+    assert transport.emitted_patterns == [("log", {"n": 1}), ("log", {"n": 2})]
+
+
+class SlowTransport(MockTransport):
+    async def send(self, pattern, data, timeout=None):
+        await with_timeout(asyncio.sleep(1), pattern, timeout)
+
+
+class RecordingWrapper(WrapperTransport):
+    def __init__(self, transport):
+        super().__init__(transport)
+        self.errors = []
+
+    async def send(self, pattern, data, timeout=None):
+        try:
+            return await super().send(pattern, data, timeout)
+        except BaseException as e:
+            self.errors.append(type(e))
+            raise
+
+
+class PassThrough(Interceptor):
+    async def intercept_send(self, pattern, data, call_next):
+        return await call_next(pattern, data)
+
+
+@pytest.mark.asyncio
+async def test_client_send_timeout():
+    client = Client(SlowTransport())
+
+    with pytest.raises(RpcTimeoutError) as exc_info:
+        await client.send("slow", {}, timeout=0.01)
+
+    assert exc_info.value.pattern == "slow"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("interceptors", [(), (PassThrough(),)])
+async def test_client_send_timeout_reaches_wrapping_transports(interceptors):
+    transport = RecordingWrapper(SlowTransport())
+    client = Client(transport, interceptors)
+
+    with pytest.raises(RpcTimeoutError):
+        await client.send("slow", {}, timeout=0.01)
+
+    assert transport.errors == [RpcTimeoutError]
+
+
+@pytest.mark.asyncio
+async def test_client_stream_falls_back_to_single_reply():
+    client = Client(MockTransport())
+
+    chunks = [chunk async for chunk in client.stream("sum", {"a": 1})]
+
+    assert len(chunks) == 1
+    assert chunks[0]["pattern"] == "sum"
+
+
+@pytest.mark.asyncio
+async def test_client_send_decodes_response_type():
+    @dataclass
+    class Reply:
+        mocked: bool
+        pattern: str
+        data: dict
+
+    client = Client(MockTransport())
+
+    result = await client.send("sum", {"a": 1}, response_type=Reply)
+
+    assert result == Reply(mocked=True, pattern="sum", data={"a": 1})
+
+
+@pytest.mark.asyncio
+async def test_client_send_uses_transport_send_typed():
+    class TypedTransport(MockTransport):
+        async def send_typed(self, pattern, data, response_type, timeout=None):
+            return response_type, timeout
+
+    client = Client(TypedTransport())
+
+    assert await client.send("sum", {}, 1, response_type=int) == (int, 1)
@@ -0,0 +1,77 @@
+import pytest
+
+from nest_rpc_client.client import Client
+from nest_rpc_client.interceptor import Interceptor, compile_chain
+from nest_rpc_client.transports.mock import MockTransport
+
+
+class Recording(Interceptor):
+    def __init__(self, name: str, log: list):
+        self.name = name
+        self.log = log
+
+    async def intercept_send(self, pattern, data, call_next):
+        self.log.append(f"{self.name}:before")
+        result = await call_next(pattern, data)
+        self.log.append(f"{self.name}:after")
+        return result
+
+
+class AddTenant(Interceptor):
+    async def intercept_send(self, pattern, data, call_next):
+        return await call_next(pattern, {**data, "tenant": "acme"})
+
+    async def intercept_emit(self, pattern, data, call_next):
+        await call_next(f"acme.{pattern}", data)
+
+
+class ShortCircuit(Interceptor):
+    async def intercept_send(self, pattern, data, call_next):
+        if pattern == "ping":
+            return "pong"
+        return await call_next(pattern, data)
+
+
+@pytest.mark.asyncio
+async def test_interceptors_run_in_order():
+    log = []
+    transport = MockTransport()
+    client = Client(transport, [Recording("outer", log), Recording("inner", log)])
+
+    await client.send("sum", {"a": 1})
+
+    assert log == ["outer:before", "inner:before", "inner:after", "outer:after"]
+
+
+@pytest.mark.asyncio
+async def test_interceptors_can_mutate_and_short_circuit():
+    transport = MockTransport()
+    client = Client(transport, [ShortCircuit(), AddTenant()])
+
+    assert await client.send("ping", {}) == "pong"
+    await client.send("sum", {"a": 1})
+    await client.emit("log", {"msg": "hi"})
+
+    assert transport.sent_patterns == [("sum", {"a": 1, "tenant": "acme"})]
+    assert transport.emitted_patterns == [("acme.log", {"msg": "hi"})]
+
+
+@pytest.mark.asyncio
+async def test_batched_calls_go_through_interceptors():
+    transport = MockTransport()
+    client = Client(transport, [AddTenant()])
+
+    results = [r async for r in client.send_many([("sum", {"a": 1})])]
+    await client.emit_many([("log", {})])
+
+    assert results[0][1]["data"] == {"a": 1, "tenant": "acme"}
+    assert transport.emitted_patterns == [("acme.log", {})]
+
+
+def test_chain_skips_interceptors_without_overrides():
+    transport = MockTransport()
+
+    assert compile_chain([Interceptor()], "intercept_send", transport.send) == (
+        transport.send
+    )
+    assert Client(transport, [ShortCircuit()])._emit == transport.emit
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from nest_rpc_client.metrics import NO_METRICS, InMemoryMetrics, RequestSample
+
+
+def test_default_metrics_are_disabled():
+    assert NO_METRICS.enabled is False
+
+
+def test_request_sample_splits_phases():
+    sample = RequestSample("sum")
+    sample.encoded(10)
+    sample.replied(20, 0.001)
+    sample.finished()
+
+    assert sample.bytes_out == 10
+    assert sample.bytes_in == 20
+    assert sample.decode == 0.001
+    assert sample.wire >= 0
+    total = sample.total
+    assert total >= sample.encode
+    assert sample.total == total
+
+
+@pytest.mark.asyncio
+async def test_request_without_reply_spends_its_time_on_the_wire():
+    metrics = InMemoryMetrics()
+    samples = []
+
+    async def send(pattern, data, sample):
+        samples.append(sample)
+        sample.encoded(5)
+        await asyncio.sleep(0.05)
+        raise TimeoutError()
+
+    with pytest.raises(TimeoutError):
+        await metrics.measure_request("slow", None, send)
+
+    (sample,) = samples
+    assert sample.total >= 0.05
+    assert sample.wire >= 0.05
+    assert sample.total == pytest.approx(sample.encode + sample.wire)
+
+
+@pytest.mark.asyncio
+async def test_measure_request_records_success_and_errors():
+    metrics = InMemoryMetrics()
+
+    async def send(pattern, data, sample):
+        sample.encoded(5)
+        sample.replied(7, 0)
+        if data == "fail":
+            raise ValueError()
+        return data
+
+    assert await metrics.measure_request("sum", 1, send) == 1
+    with pytest.raises(ValueError):
+        await metrics.measure_request("sum", "fail", send)
+    metrics.event_emitted("log", 3)
+
+    stats = metrics.stats("sum")
+    assert stats.requests == 2
+    assert stats.errors == 1
+    assert stats.in_flight == 0
+    assert stats.bytes_out == 10
+    assert stats.bytes_in == 14
+    assert sum(stats.latency["total"]) == 2
+    assert metrics.stats("log").events == 1
+
+
+@pytest.mark.asyncio
+async def test_in_flight_gauge():
+    metrics = InMemoryMetrics()
+    release = asyncio.Event()
+
+    async def send(pattern, data, sample):
+        await release.wait()
+
+    task = asyncio.create_task(metrics.measure_request("slow", None, send))
+    await asyncio.sleep(0)
+    assert metrics.stats("slow").in_flight == 1
+
+    release.set()
+    await task
+    assert metrics.stats("slow").in_flight == 0
@@ -0,0 +1,73 @@
+from nest_rpc_client.pattern import Pattern, as_pattern
+
+
+def test_string_pattern_route_is_the_string():
+    assert Pattern("get_user").route == "get_user"
+    assert Pattern("get_user").value == "get_user"
+
+
+def test_object_pattern_route_sorts_keys_like_nestjs():
+    pattern = Pattern({"role": "math", "cmd": "sum", "version": 2, "beta": True})
+
+    assert pattern.route == '{"beta":true,"cmd":"sum","role":"math","version":2}'
+
+
+def test_nested_object_pattern_route():
+    pattern = Pattern({"cmd": "sum", "meta": {"z": 1, "a": "x"}})
+
+    assert pattern.route == '{"cmd":"sum","meta":{"a":"x","z":1}}'
+
+
+def test_json_string_is_parsed_as_object_pattern():
+    pattern = Pattern('{"role": "math", "cmd": "sum"}')
+
+    assert pattern.value == {"role": "math", "cmd": "sum"}
+    assert pattern == Pattern({"cmd": "sum", "role": "math"})
+    assert hash(pattern) == hash(Pattern({"cmd": "sum", "role": "math"}))
+
+
+def test_invalid_json_string_stays_a_string_pattern():
+    assert Pattern("{not json").route == "{not json"
+
+
+def test_as_pattern_interns_strings():
+    assert as_pattern("interned") is as_pattern("interned")
+
+
+def test_as_pattern_returns_patterns_unchanged():
+    pattern = Pattern({"cmd": "sum"})
+
+    assert as_pattern(pattern) is pattern
+
+
+def test_template_is_built_once_per_key():
+    pattern = Pattern("sum")
+    calls = []
+
+    def build(p: Pattern) -> str:
+        calls.append(p)
+        return p.route.upper()
+
+    assert pattern.template("a", build) == "SUM"
+    assert pattern.template("a", build) == "SUM"
+    assert pattern.template("b", build) == "SUM"
+    assert calls == [pattern, pattern]
+
+
+def test_object_pattern_keys_sort_like_locale_compare():
+    pattern = Pattern({"cmd": "sum", "action": "add", "Role": "math", "_v": 1})
+
+    assert pattern.route == '{"_v":1,"action":"add","cmd":"sum","Role":"math"}'
+    assert Pattern({"b": 1, "B": 2, "a": 3, "A": 4}).route == (
+        '{"a":3,"A":4,"b":1,"B":2}'
+    )
+
+
+def test_pattern_values_are_written_like_javascript():
+    pattern = Pattern(
+        {"none": None, "whole": 2.0, "half": 0.5, "tiny": 1e-7, "list": [1, "x"]}
+    )
+
+    assert pattern.route == (
+        '{"half":0.5,"list":{"0":1,"1":"x"},"none":null,"tiny":1e-7,"whole":2}'
+    )
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from nest_rpc_client.exceptions import RpcTimeoutError
+from nest_rpc_client.sync import SyncClient
+from nest_rpc_client.transports.mock import MockTransport
+from nest_rpc_client.utils.timeout import with_timeout
+
+
+class LoopRecordingTransport(MockTransport):
+    def __init__(self):
+        super().__init__()
+        self.loops = set()
+        self.connects = 0
+
+    async def connect(self):
+        self.connects += 1
+        await super().connect()
+
+    async def send(self, pattern, data, timeout=None):
+        self.loops.add(asyncio.get_running_loop())
+        if pattern == "slow":
+            await with_timeout(asyncio.sleep(1), pattern, timeout)
+        return await super().send(pattern, data, timeout)
+
+
+def test_sync_client_send_and_emit():
+    transport = LoopRecordingTransport()
+
+    with SyncClient(transport) as client:
+        result = client.send("sum", {"a": 1})
+        client.emit("log", {"msg": "hello"})
+
+        assert result["data"] == {"a": 1}
+        assert transport.emitted_patterns == [("log", {"msg": "hello"})]
+
+    assert transport.closed is True
+    assert client._thread is None
+
+
+def test_sync_client_shares_one_loop_across_threads():
+    transport = LoopRecordingTransport()
+    client = SyncClient(transport)
+    client.connect()
+    client.connect()
+    try:
+        with ThreadPoolExecutor(8) as pool:
+            results = list(
+                pool.map(lambda n: client.send("echo", n)["data"], range(50))
+            )
+
+        assert results == list(range(50))
+        assert len(transport.loops) == 1
+        assert transport.connects == 1
+    finally:
+        client.close()
+
+
+def test_sync_client_future_variants():
+    with SyncClient(MockTransport()) as client:
+        futures = [client.send_future("echo", n) for n in range(3)]
+        assert all(isinstance(future, Future) for future in futures)
+        assert [future.result()["data"] for future in futures] == [0, 1, 2]
+
+        assert client.emit_future("log", {}).result() is None
+
+
+def test_sync_client_timeout():
+    with SyncClient(LoopRecordingTransport()) as client:
+        with pytest.raises(RpcTimeoutError):
+            client.send("slow", {}, timeout=0.01)
+
+
+def test_sync_client_requires_connect():
+    client = SyncClient(MockTransport())
+
+    with pytest.raises(ConnectionError):
+        client.send("sum", {})
+
+
+def test_sync_client_failed_connect_stops_thread():
+    class BrokenTransport(MockTransport):
+        async def connect(self):
+            raise ConnectionError("refused")
+
+    client = SyncClient(BrokenTransport())
+    threads = threading.active_count()
+
+    with pytest.raises(ConnectionError):
+        client.connect()
+    assert client._thread is None
+    assert threading.active_count() == threads
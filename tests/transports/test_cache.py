@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+
+from nest_rpc_client.config.cache import CacheConfig, CachePolicy
+from nest_rpc_client.exceptions.rpc import RpcException
+from nest_rpc_client.transports.cache import CachingTransport
+from nest_rpc_client.transports.mock import MockTransport
+
+
+class SlowTransport(MockTransport):
+    def __init__(self, delay: float = 0, error: Exception | None = None):
+        super().__init__()
+        self.delay = delay
+        self.error = error
+
+    async def send(self, pattern: str, data: dict):
+        await asyncio.sleep(self.delay)
+        result = await super().send(pattern, data)
+        if self.error is not None:
+            raise self.error
+        return result
+
+
+def make_transport(inner: MockTransport, **policy) -> CachingTransport:
+    return CachingTransport(
+        inner, CacheConfig({"get_user": CachePolicy(**{"ttl": 60, **policy})})
+    )
+
+
+@pytest.mark.asyncio
+async def test_caches_by_pattern_and_canonical_data():
+    inner = MockTransport()
+    transport = make_transport(inner)
+
+    first = await transport.send("get_user", {"id": 1, "fields": ["a"]})
+    second = await transport.send("get_user", {"fields": ["a"], "id": 1})
+    await transport.send("get_user", {"id": 2})
+
+    assert first is second
+    assert len(inner.sent_patterns) == 2
+
+
+@pytest.mark.asyncio
+async def test_uncached_patterns_and_events_pass_through():
+    inner = MockTransport()
+    transport = make_transport(inner)
+
+    await transport.send("create_user", {"id": 1})
+    await transport.send("create_user", {"id": 1})
+    await transport.emit("user_seen", {"id": 1})
+
+    assert len(inner.sent_patterns) == 2
+    assert inner.emitted_patterns == [("user_seen", {"id": 1})]
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_and_evict_lru():
+    inner = MockTransport()
+    transport = make_transport(inner, ttl=0.01, max_size=2)
+
+    for user_id in (1, 2, 1, 3, 1):
+        await transport.send("get_user", {"id": user_id})
+    assert len(inner.sent_patterns) == 3
+
+    await transport.send("get_user", {"id": 2})
+    assert len(inner.sent_patterns) == 4
+
+    await asyncio.sleep(0.02)
+    await transport.send("get_user", {"id": 1})
+    assert len(inner.sent_patterns) == 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call():
+    inner = SlowTransport(delay=0.01)
+    transport = make_transport(inner)
+
+    results = await asyncio.gather(
+        *(transport.send("get_user", {"id": 1}) for _ in range(10))
+    )
+
+    assert len(inner.sent_patterns) == 1
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_rpc_errors_are_cached_only_when_asked():
+    inner = SlowTransport(error=RpcException("not found"))
+
+    transport = make_transport(inner)
+    for _ in range(2):
+        with pytest.raises(RpcException):
+            await transport.send("get_user", {"id": 1})
+    assert len(inner.sent_patterns) == 2
+
+    transport = make_transport(inner, cache_errors=True)
+    for _ in range(2):
+        with pytest.raises(RpcException):
+            await transport.send("get_user", {"id": 1})
+    assert len(inner.sent_patterns) == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_errors_raise_a_fresh_exception_per_hit():
+    inner = SlowTransport(error=RpcException("not found"))
+    transport = make_transport(inner, cache_errors=True)
+
+    raised = []
+    for _ in range(3):
+        with pytest.raises(RpcException) as info:
+            await transport.send("get_user", {"id": 1})
+        raised.append(info.value)
+
+    assert len(inner.sent_patterns) == 1
+    assert [e.err for e in raised] == ["not found"] * 3
+    assert raised[1] is not raised[2]
+    assert raised[1].__traceback__ is not raised[2].__traceback__
+
+
+@pytest.mark.asyncio
+async def test_invalidate_clears_entries():
+    inner = MockTransport()
+    transport = make_transport(inner)
+
+    await transport.send("get_user", {"id": 1})
+    transport.invalidate("get_user")
+    await transport.send("get_user", {"id": 1})
+
+    assert len(inner.sent_patterns) == 2
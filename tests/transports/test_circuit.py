@@ -0,0 +1,51 @@
+import pytest
+
+from nest_rpc_client.config.circuit import CircuitBreakerConfig
+from nest_rpc_client.exceptions.circuit import CircuitOpenError
+from nest_rpc_client.metrics import InMemoryMetrics
+from nest_rpc_client.transports.circuit import CircuitBreakerTransport
+from nest_rpc_client.transports.mock import MockTransport
+from nest_rpc_client.utils.circuit import CircuitState
+
+
+class FailingTransport(MockTransport):
+    async def send(self, pattern, data, timeout=None):
+        self.sent_patterns.append((pattern, data))
+        if pattern == "down":
+            raise ConnectionError()
+        return data
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_per_pattern():
+    inner = FailingTransport()
+    transport = CircuitBreakerTransport(
+        inner, CircuitBreakerConfig(minimum_requests=2, open_duration=60)
+    )
+    transport.metrics = metrics = InMemoryMetrics()
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await transport.send("down", {})
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        await transport.send("down", {})
+    assert exc_info.value.circuit == "down"
+    assert len(inner.sent_patterns) == 2
+
+    assert await transport.send("up", {"ok": True}) == {"ok": True}
+    assert transport.states() == {"down": CircuitState.OPEN, "up": CircuitState.CLOSED}
+    assert metrics.circuits == {"down": "open"}
+
+
+@pytest.mark.asyncio
+async def test_patterns_outside_config_are_not_guarded():
+    inner = FailingTransport()
+    transport = CircuitBreakerTransport(
+        inner, CircuitBreakerConfig(minimum_requests=1, patterns={"other"})
+    )
+
+    for _ in range(3):
+        with pytest.raises(ConnectionError):
+            await transport.send("down", {})
+    assert transport.states() == {}
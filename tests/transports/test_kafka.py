@@ -0,0 +1,228 @@
+import asyncio
+import json
+from collections import defaultdict
+from functools import partial
+from unittest.mock import patch
+
+import pytest
+from aiokafka.structs import ConsumerRecord, TopicPartition
+
+from nest_rpc_client.config.kafka import KafkaConfig
+from nest_rpc_client.exceptions.rpc import RpcException
+from nest_rpc_client.exceptions.timeout import RpcTimeoutError
+from nest_rpc_client.transports.kafka import KafkaTransport
+
+
+class FakeBroker:
+    """In-process stand-in for a Kafka cluster: topic partitions are lists."""
+
+    def __init__(self):
+        self.logs: dict[TopicPartition, list[ConsumerRecord]] = defaultdict(list)
+        self.appended = asyncio.Condition()
+
+    async def append(self, topic, partition, value, headers) -> None:
+        log = self.logs[TopicPartition(topic, partition)]
+        log.append(
+            ConsumerRecord(
+                topic=topic,
+                partition=partition,
+                offset=len(log),
+                timestamp=0,
+                timestamp_type=0,
+                key=None,
+                value=value,
+                checksum=None,
+                serialized_key_size=0,
+                serialized_value_size=len(value or b""),
+                headers=tuple(headers or ()),
+            )
+        )
+        async with self.appended:
+            self.appended.notify_all()
+
+
+class FakeProducer:
+    def __init__(self, broker: FakeBroker, **options):
+        self.broker = broker
+        self.options = options
+        self.started = self.stopped = False
+        self.flushed = 0
+
+    async def start(self):
+        self.started = True
+
+    async def stop(self):
+        self.stopped = True
+
+    async def flush(self):
+        self.flushed += 1
+
+    async def send(self, topic, value=None, key=None, partition=None, headers=None):
+        await self.broker.append(topic, partition or 0, value, headers)
+        delivery = asyncio.get_running_loop().create_future()
+        delivery.set_result(None)
+        return delivery
+
+
+class FakeConsumer:
+    def __init__(self, broker: FakeBroker, **options):
+        self.broker = broker
+        self.options = options
+        self.positions: dict[TopicPartition, int] = {}
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    def assign(self, partitions):
+        self.positions = {partition: 0 for partition in partitions}
+
+    async def seek_to_end(self, *partitions):
+        for partition in partitions:
+            self.positions[partition] = len(self.broker.logs[partition])
+
+    async def position(self, partition):
+        return self.positions[partition]
+
+    async def getmany(self, timeout_ms=0):
+        async with self.broker.appended:
+            while True:
+                batches = {}
+                for partition, position in self.positions.items():
+                    records = self.broker.logs[partition][position:]
+                    if records:
+                        batches[partition] = records
+                        self.positions[partition] += len(records)
+                if batches:
+                    return batches
+                await self.broker.appended.wait()
+
+
+async def nest_server(broker: FakeBroker, topic: str, handler) -> None:
+    """Answers requests on `topic` the way a NestJS Kafka microservice does."""
+    consumer = FakeConsumer(broker)
+    consumer.assign([TopicPartition(topic, 0)])
+    while True:
+        for records in (await consumer.getmany()).values():
+            for record in records:
+                headers = dict(record.headers)
+                if "kafka_correlationId" not in headers:
+                    continue
+                reply = [
+                    ("kafka_correlationId", headers["kafka_correlationId"]),
+                    ("kafka_nest-is-disposed", b"1"),
+                ]
+                try:
+                    value = json.dumps(handler(json.loads(record.value))).encode()
+                except Exception as e:
+                    reply.append(("kafka_nest-err", str(e).encode()))
+                    value = None
+                await FakeProducer(broker).send(
+                    headers["kafka_replyTopic"].decode(),
+                    value,
+                    partition=int(headers["kafka_replyPartition"]),
+                    headers=reply,
+                )
+
+
+@pytest.fixture
+def broker():
+    broker = FakeBroker()
+    with (
+        patch(
+            "nest_rpc_client.transports.kafka.AIOKafkaProducer",
+            partial(FakeProducer, broker),
+        ),
+        patch(
+            "nest_rpc_client.transports.kafka.AIOKafkaConsumer",
+            partial(FakeConsumer, broker),
+        ),
+    ):
+        yield broker
+
+
+def divide(data):
+    return data["a"] / data["b"]
+
+
+@pytest.mark.asyncio
+async def test_send_round_trip_through_reply_topic(broker):
+    server = asyncio.create_task(nest_server(broker, "divide", divide))
+    transport = KafkaTransport(
+        KafkaConfig("localhost:9092", reply_patterns=["divide"], linger_ms=10)
+    )
+    await transport.connect()
+    try:
+        results = await asyncio.gather(
+            *(transport.send("divide", {"a": n, "b": 2}) for n in range(10))
+        )
+        assert results == [n / 2 for n in range(10)]
+        assert transport.producer.options["linger_ms"] == 10
+
+        (request, *_) = broker.logs[TopicPartition("divide", 0)]
+        headers = dict(request.headers)
+        assert headers["kafka_replyTopic"] == b"divide.reply"
+        assert headers["kafka_replyPartition"] == b"0"
+        assert json.loads(request.value) == {"a": 0, "b": 2}
+    finally:
+        await transport.close()
+        server.cancel()
+
+
+@pytest.mark.asyncio
+async def test_error_header_raises_rpc_exception(broker):
+    server = asyncio.create_task(nest_server(broker, "divide", divide))
+    transport = KafkaTransport(KafkaConfig("localhost", reply_patterns=["divide"]))
+    await transport.connect()
+    try:
+        with pytest.raises(RpcException) as exc_info:
+            await transport.send("divide", {"a": 1, "b": 0})
+        assert exc_info.value.err == "division by zero"
+    finally:
+        await transport.close()
+        server.cancel()
+
+
+@pytest.mark.asyncio
+async def test_replies_sent_before_connect_are_skipped(broker):
+    await broker.append("divide.reply", 0, b"1", [("kafka_correlationId", b"old")])
+    transport = KafkaTransport(
+        KafkaConfig("localhost", reply_patterns=["divide"], response_timeout=0.01)
+    )
+    await transport.connect()
+    try:
+        assert transport.consumer.positions[TopicPartition("divide.reply", 0)] == 1
+        with pytest.raises(RpcTimeoutError):
+            await transport.send("divide", {"a": 1, "b": 1})
+        assert transport._pending == {}
+    finally:
+        await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_send_requires_reply_pattern(broker):
+    transport = KafkaTransport(KafkaConfig("localhost"))
+    await transport.connect()
+    try:
+        with pytest.raises(ValueError):
+            await transport.send("divide", {})
+        assert transport.consumer is None
+    finally:
+        await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_emit_produces_data_without_reply_headers(broker):
+    transport = KafkaTransport(KafkaConfig("localhost"))
+    await transport.connect()
+
+    await transport.emit("user_created", {"id": 1})
+    await transport.flush()
+
+    (event,) = broker.logs[TopicPartition("user_created", 0)]
+    assert json.loads(event.value) == {"id": 1}
+    assert event.headers == ()
+    assert transport.producer.flushed == 1
+    await transport.close()
@@ -0,0 +1,168 @@
+import asyncio
+
+import pytest
+
+from nest_rpc_client.config.limit import AIMDLimit, GradientLimit, LimitConfig
+from nest_rpc_client.exceptions.timeout import RpcTimeoutError
+from nest_rpc_client.transports.limit import (
+    AIMD,
+    ConcurrencyLimiter,
+    Gradient,
+    LimitingTransport,
+)
+from nest_rpc_client.transports.mock import MockTransport
+
+
+class BlockingTransport(MockTransport):
+    """Holds every send until `release` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+        self.active = 0
+        self.max_active = 0
+
+    async def send(self, pattern, data, timeout=None):
+        self.sent_patterns.append((pattern, data))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await self.release.wait()
+        finally:
+            self.active -= 1
+        if data.get("fail"):
+            raise ConnectionError()
+        return data
+
+
+@pytest.mark.asyncio
+async def test_queues_calls_over_the_limit():
+    inner = BlockingTransport()
+    transport = LimitingTransport(inner, LimitConfig(max_in_flight=2))
+
+    tasks = [asyncio.create_task(transport.send("p", {"n": n})) for n in range(5)]
+    await asyncio.sleep(0)
+
+    assert inner.active == 2
+    assert transport.queue_depth == 3
+    assert transport.stats().queued_by_pattern == {"p": 3}
+
+    inner.release.set()
+    assert await asyncio.gather(*tasks) == [{"n": n} for n in range(5)]
+    assert inner.max_active == 2
+    assert transport.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_pattern_limit_and_fair_queueing():
+    limiter = ConcurrencyLimiter(2, {"slow": 1})
+    await limiter.acquire("slow")
+
+    order = []
+
+    async def acquire(pattern):
+        await limiter.acquire(pattern)
+        order.append(pattern)
+
+    tasks = [asyncio.create_task(acquire(p)) for p in ["slow", "a", "a", "b"]]
+    await asyncio.sleep(0)
+
+    # "a" fits in the free slot; the second "slow" waits for its own limit.
+    assert order == ["a"]
+    assert limiter.queued_by_pattern() == {"slow": 1, "a": 1, "b": 1}
+
+    limiter.release("a")
+    await asyncio.sleep(0)
+    assert order == ["a", "a"]
+
+    limiter.release("slow")
+    await asyncio.sleep(0)
+    assert order == ["a", "a", "slow"]
+
+    limiter.release("a")
+    await asyncio.sleep(0)
+    assert order == ["a", "a", "slow", "b"]
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    limiter = ConcurrencyLimiter(1, {})
+    await limiter.acquire("p")
+
+    task = asyncio.create_task(limiter.acquire("p"))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter.queued == 0
+    limiter.release("p")
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_release_skips_waiter_cancelled_in_same_iteration():
+    limiter = ConcurrencyLimiter(1, {})
+    await limiter.acquire("p")
+
+    first = asyncio.create_task(limiter.acquire("p"))
+    second = asyncio.create_task(limiter.acquire("p"))
+    await asyncio.sleep(0)
+    first.cancel()
+    limiter.release("p")
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    await second
+    assert limiter.in_flight == 1
+    assert limiter.queued == 0
+
+    limiter.release("p")
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_time_queued_counts_toward_timeout():
+    inner = BlockingTransport()
+    transport = LimitingTransport(inner, LimitConfig(max_in_flight=1))
+
+    first = asyncio.create_task(transport.send("p", {}))
+    await asyncio.sleep(0)
+
+    with pytest.raises(RpcTimeoutError):
+        await transport.send("p", {}, timeout=0.01)
+    assert transport.queue_depth == 0
+
+    inner.release.set()
+    await first
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_backs_off_on_errors():
+    inner = BlockingTransport()
+    inner.release.set()
+    transport = LimitingTransport(
+        inner,
+        LimitConfig(max_in_flight=100, initial_limit=10, adaptive=AIMDLimit(0.5)),
+    )
+
+    with pytest.raises(ConnectionError):
+        await transport.send("p", {"fail": True})
+    assert transport.stats().limit == 5
+
+
+def test_aimd_grows_only_while_limit_is_used():
+    aimd = AIMD(AIMDLimit(backoff_ratio=0.5, latency_threshold=1.0))
+
+    assert aimd.update(10, 0.1, in_flight=5, dropped=False) == 11
+    assert aimd.update(10, 0.1, in_flight=1, dropped=False) == 10
+    assert aimd.update(10, 2.0, in_flight=5, dropped=False) == 5
+    assert aimd.update(10, 0.1, in_flight=5, dropped=True) == 5
+
+
+def test_gradient_shrinks_when_latency_grows():
+    gradient = Gradient(GradientLimit(smoothing=1.0, tolerance=1.0))
+
+    assert gradient.update(16, 0.01, in_flight=16, dropped=False) == 20
+    assert gradient.update(16, 1.0, in_flight=16, dropped=False) < 16
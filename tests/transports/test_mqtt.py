@@ -0,0 +1,139 @@
+import asyncio
+import json
+from collections import defaultdict
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from nest_rpc_client.config.mqtt import MQTTConfig
+from nest_rpc_client.exceptions.rpc import RpcException
+from nest_rpc_client.exceptions.timeout import RpcTimeoutError
+from nest_rpc_client.transports.mqtt import MQTTTransport
+
+
+class FakeBroker:
+    """In-process stand-in for an MQTT broker with exact topic matching."""
+
+    def __init__(self):
+        self.subscribers: dict[str, list["FakeClient"]] = defaultdict(list)
+        self.published: list[tuple[str, bytes, int]] = []
+
+    def client(self, hostname, port=1883, **options) -> "FakeClient":
+        return FakeClient(self)
+
+
+class FakeClient:
+    def __init__(self, broker: FakeBroker):
+        self.broker = broker
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.subscriptions: list[tuple[str, int]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        for clients in self.broker.subscribers.values():
+            if self in clients:
+                clients.remove(self)
+
+    async def subscribe(self, topic, qos=0):
+        self.subscriptions.append((topic, qos))
+        self.broker.subscribers[topic].append(self)
+
+    async def publish(self, topic, payload=None, qos=0):
+        self.broker.published.append((topic, payload, qos))
+        for client in self.broker.subscribers[topic]:
+            client.queue.put_nowait(SimpleNamespace(topic=topic, payload=payload))
+
+    @property
+    async def messages(self):
+        while True:
+            yield await self.queue.get()
+
+
+async def nest_server(broker: FakeBroker, pattern: str, handler) -> None:
+    """Answers requests on `pattern` the way a NestJS MQTT microservice does."""
+    client = broker.client("localhost")
+    await client.subscribe(pattern)
+    async for message in client.messages:
+        packet = json.loads(message.payload)
+        if "id" not in packet:
+            continue
+        try:
+            reply = {"response": handler(packet["data"])}
+        except Exception as e:
+            reply = {"err": str(e)}
+        reply.update(id=packet["id"], isDisposed=True)
+        await client.publish(f"{pattern}/reply", json.dumps(reply).encode())
+
+
+@pytest.fixture
+def broker():
+    broker = FakeBroker()
+    with patch("nest_rpc_client.transports.mqtt.aiomqtt.Client", broker.client):
+        yield broker
+
+
+def divide(data):
+    return data["a"] / data["b"]
+
+
+@pytest.mark.asyncio
+async def test_send_round_trip_through_reply_topic(broker):
+    server = asyncio.create_task(nest_server(broker, "sensors/divide", divide))
+    await asyncio.sleep(0)
+    transport = MQTTTransport(MQTTConfig("localhost"))
+    await transport.connect()
+    try:
+        results = await asyncio.gather(
+            *(transport.send("sensors/divide", {"a": n, "b": 2}) for n in range(5))
+        )
+        assert results == [n / 2 for n in range(5)]
+        assert transport.client.subscriptions == [("sensors/divide/reply", 1)]
+
+        with pytest.raises(RpcException) as exc_info:
+            await transport.send("sensors/divide", {"a": 1, "b": 0})
+        assert exc_info.value.err == "division by zero"
+    finally:
+        await transport.close()
+        server.cancel()
+
+
+@pytest.mark.asyncio
+async def test_send_timeout_drops_pending_entry(broker):
+    transport = MQTTTransport(MQTTConfig("localhost", response_timeout=0.01))
+    await transport.connect()
+    try:
+        with pytest.raises(RpcTimeoutError):
+            await transport.send("nobody_listens", {})
+        assert transport._pending == {}
+    finally:
+        await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_emit_publishes_with_emit_qos(broker):
+    transport = MQTTTransport(MQTTConfig("localhost"))
+    await transport.connect()
+
+    await transport.emit("devices/event", {"on": True})
+
+    ((topic, payload, qos),) = broker.published
+    assert topic == "devices/event"
+    assert json.loads(payload) == {"pattern": "devices/event", "data": {"on": True}}
+    assert qos == 0
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_close_fails_pending_requests(broker):
+    transport = MQTTTransport(MQTTConfig("localhost"))
+    await transport.connect()
+
+    request = asyncio.create_task(transport.send("nobody_listens", {}))
+    await asyncio.sleep(0)
+    await transport.close()
+
+    with pytest.raises(ConnectionError):
+        await request
@@ -1,9 +1,11 @@
 import json
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import nats
 import pytest
 
 from nest_rpc_client.config.nats import NATSConfig
+from nest_rpc_client.exceptions.timeout import RpcTimeoutError
 from nest_rpc_client.transports.nats import NATSTransport
 
 
@@ -79,3 +81,74 @@ async def test_send_sends_and_parses_response(mock_uuid4):
         fake_client.request.call_args.args[1],
         timeout=config.response_timeout,
     )
+
+
+@pytest.mark.asyncio
+async def test_send_uses_configured_serializer():
+    serializer = Mock()
+    serializer.encode_packet.return_value = b"encoded"
+    serializer.loads.return_value = {"response": 42}
+
+    transport = NATSTransport(NATSConfig([""], serializer=serializer))
+    fake_client = AsyncMock()
+    fake_client.request.return_value = Mock(data=b"reply")
+    transport.client = fake_client
+
+    assert await transport.send("subject", {"x": 1}) == 42
+
+    assert fake_client.request.call_args.args[1] == b"encoded"
+    serializer.loads.assert_called_once_with(b"reply")
+
+
+@pytest.mark.asyncio
+async def test_send_typed_decodes_while_parsing_reply():
+    serializer = Mock()
+    serializer.encode_packet.return_value = b"encoded"
+    serializer.loads_reply.return_value = {"response": 42}
+
+    transport = NATSTransport(NATSConfig([""], serializer=serializer))
+    fake_client = AsyncMock()
+    fake_client.request.return_value = Mock(data=b"reply")
+    transport.client = fake_client
+
+    assert await transport.send_typed("subject", {"x": 1}, int) == 42
+
+    serializer.loads_reply.assert_called_once_with(b"reply", int)
+    serializer.loads.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_send_raises_rpc_timeout_error():
+    transport = NATSTransport(NATSConfig([""]))
+    fake_client = AsyncMock()
+    fake_client.request.side_effect = nats.errors.TimeoutError
+    transport.client = fake_client
+
+    with pytest.raises(RpcTimeoutError) as exc_info:
+        await transport.send("subject", {}, timeout=2)
+
+    assert exc_info.value.timeout == 2
+    assert fake_client.request.call_args.kwargs["timeout"] == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_reads_replies_from_own_inbox():
+    transport = NATSTransport(NATSConfig([]))
+
+    replies = [
+        {"id": "x", "response": 1},
+        {"id": "x", "response": 2, "isDisposed": True},
+    ]
+    subscription = AsyncMock()
+    subscription.next_msg = AsyncMock(
+        side_effect=[Mock(data=json.dumps(r).encode()) for r in replies]
+    )
+    transport.client = AsyncMock()
+    transport.client.new_inbox = Mock(return_value="_INBOX.1")
+    transport.client.subscribe = AsyncMock(return_value=subscription)
+
+    assert [chunk async for chunk in transport.stream("numbers", {})] == [1, 2]
+
+    transport.client.subscribe.assert_awaited_once_with("_INBOX.1")
+    assert transport.client.publish.call_args.kwargs == {"reply": "_INBOX.1"}
+    subscription.unsubscribe.assert_awaited_once()
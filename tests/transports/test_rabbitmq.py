@@ -1,31 +1,14 @@
+import asyncio
 import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from nest_rpc_client.config.rabbitmq import RabbitMQConfig
+from nest_rpc_client.exceptions.timeout import RpcTimeoutError
 from nest_rpc_client.transports.rabbitmq import RabbitMQTransport
 
 
-class FakeAsyncContextManager:
-    def __init__(self, result):
-        self._result = result
-
-    async def __aenter__(self):
-        return self._result
-
-    async def __aexit__(self, exc_type, exc, tb):
-        pass
-
-
-class FakeProcessContext:
-    async def __aenter__(self):
-        return None
-
-    async def __aexit__(self, exc_type, exc, tb):
-        pass
-
-
 @pytest.mark.asyncio
 async def test_emit_publisher_correct_message():
     config = RabbitMQConfig(url="amqp://localhost:5672", queue="test_queue")
@@ -55,9 +38,11 @@ async def test_emit_publisher_correct_message():
 async def test_connect_calls_aio_pika_connect(mock_connect_robust: AsyncMock):
     fake_connection = AsyncMock()
     fake_channel = AsyncMock()
+    fake_reply_queue = AsyncMock()
 
     mock_connect_robust.return_value = fake_connection
     fake_connection.channel.return_value = fake_channel
+    fake_channel.declare_queue.return_value = fake_reply_queue
 
     config = RabbitMQConfig(url="amqp://localhost:5672", queue="test_queue")
     transport = RabbitMQTransport(config)
@@ -70,6 +55,12 @@ async def test_connect_calls_aio_pika_connect(mock_connect_robust: AsyncMock):
     assert transport.connection == fake_connection
     assert transport.channel == fake_channel
 
+    fake_channel.declare_queue.assert_awaited_once_with(exclusive=True)
+    fake_reply_queue.consume.assert_awaited_once_with(
+        transport._on_reply, no_ack=True
+    )
+    assert transport.reply_queue == fake_reply_queue
+
 
 @pytest.mark.asyncio
 async def test_close_closes_connection_and_channel():
@@ -92,37 +83,42 @@ async def test_close_does_not_fail_if_none():
     await transport.close()
 
 
-@pytest.mark.asyncio
-@patch("nest_rpc_client.transports.rabbitmq.uuid.uuid4")
-async def test_send_publishes_message_and_receives_reply(mock_uuid4):
-    correlation_id = "test-id-123"
-    mock_uuid4.return_value = correlation_id
+def make_reply(correlation_id: str, payload: dict) -> Mock:
+    message = Mock()
+    message.correlation_id = correlation_id
+    message.body = json.dumps(payload).encode("utf-8")
+    return message
 
-    config = RabbitMQConfig(url="amqp://localhost:5672", queue="test_queue")
+
+def make_transport(config: RabbitMQConfig) -> RabbitMQTransport:
     transport = RabbitMQTransport(config)
 
     fake_channel = AsyncMock()
-    fake_exchange = AsyncMock()
     fake_reply_queue = AsyncMock()
     fake_reply_queue.name = "reply-queue-name"
-    fake_channel.default_exchange = fake_exchange
-    fake_channel.declare_queue.return_value = fake_reply_queue
+    fake_channel.default_exchange = AsyncMock()
 
     transport.channel = fake_channel
+    transport.reply_queue = fake_reply_queue
+    return transport
 
-    reply_body = json.dumps({"response": {"result": "ok"}}).encode("utf-8")
 
-    fake_message = AsyncMock()
-    fake_message.correlation_id = correlation_id
-    fake_message.body = reply_body
-    fake_message.process = Mock(return_value=FakeProcessContext())
+@pytest.mark.asyncio
+@patch("nest_rpc_client.transports.rabbitmq.uuid.uuid4")
+async def test_send_publishes_message_and_receives_reply(mock_uuid4):
+    correlation_id = "test-id-123"
+    mock_uuid4.return_value = correlation_id
 
-    async def fake_iterator():
-        yield fake_message
+    config = RabbitMQConfig(url="amqp://localhost:5672", queue="test_queue")
+    transport = make_transport(config)
+    fake_exchange = transport.channel.default_exchange
 
-    fake_reply_queue.iterator = Mock(
-        return_value=FakeAsyncContextManager(fake_iterator())
-    )
+    async def reply(message, routing_key):
+        await transport._on_reply(
+            make_reply(message.correlation_id, {"response": {"result": "ok"}})
+        )
+
+    fake_exchange.publish.side_effect = reply
 
     response = await transport.send("pattern", {"x": 1})
 
@@ -136,6 +132,72 @@ async def test_send_publishes_message_and_receives_reply(mock_uuid4):
     assert body["id"] == correlation_id
     assert body["pattern"] == "pattern"
     assert body["data"] == {"x": 1}
-    assert msg_arg.reply_to == fake_reply_queue.name
+    assert msg_arg.reply_to == "reply-queue-name"
     assert msg_arg.correlation_id == correlation_id
     assert kwargs["routing_key"] == config.queue
+    assert transport._pending == {}
+    transport.channel.declare_queue.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sends_share_reply_queue():
+    transport = make_transport(RabbitMQConfig(url="", queue="test_queue"))
+    fake_exchange = transport.channel.default_exchange
+
+    first = asyncio.create_task(transport.send("pattern", {"n": 1}))
+    second = asyncio.create_task(transport.send("pattern", {"n": 2}))
+    await asyncio.sleep(0)
+
+    first_msg, second_msg = (c.args[0] for c in fake_exchange.publish.call_args_list)
+    await transport._on_reply(make_reply(second_msg.correlation_id, {"response": 2}))
+    await transport._on_reply(make_reply(first_msg.correlation_id, {"response": 1}))
+
+    assert await first == 1
+    assert await second == 2
+    assert first_msg.reply_to == second_msg.reply_to == "reply-queue-name"
+
+
+@pytest.mark.asyncio
+async def test_send_timeout_drops_pending_entry():
+    transport = make_transport(
+        RabbitMQConfig(url="", queue="test_queue", response_timeout=0.01)
+    )
+
+    with pytest.raises(RpcTimeoutError):
+        await transport.send("pattern", {})
+
+    assert transport._pending == {}
+
+    (msg_arg,) = transport.channel.default_exchange.publish.call_args[0]
+    await transport._on_reply(make_reply(msg_arg.correlation_id, {"response": 1}))
+
+
+@pytest.mark.asyncio
+async def test_close_fails_pending_requests():
+    transport = make_transport(RabbitMQConfig(url="", queue="test_queue"))
+
+    task = asyncio.create_task(transport.send("pattern", {}))
+    await asyncio.sleep(0)
+    await transport.close()
+
+    with pytest.raises(ConnectionError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_replies_until_disposed():
+    transport = make_transport(RabbitMQConfig(url="", queue="test_queue"))
+
+    chunks = transport.stream("numbers", {})
+    first = asyncio.create_task(anext(chunks))
+    await asyncio.sleep(0)
+    (message,) = transport.channel.default_exchange.publish.call_args[0]
+
+    await transport._on_reply(make_reply(message.correlation_id, {"response": 1}))
+    await transport._on_reply(
+        make_reply(message.correlation_id, {"response": 2, "isDisposed": True})
+    )
+
+    assert await first == 1
+    assert [chunk async for chunk in chunks] == [2]
+    assert transport._streams == {}
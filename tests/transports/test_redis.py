@@ -1,26 +1,14 @@
+import asyncio
 import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from nest_rpc_client.config.redis import RedisConfig
+from nest_rpc_client.exceptions.timeout import RpcTimeoutError
 from nest_rpc_client.transports.redis import RedisTransport
 
 
-class FakeListen:
-    def __init__(self, items: list):
-        self._items = iter(items)
-
-    def __aiter__(self):
-        return self
-
-    async def __anext__(self):
-        try:
-            return next(self._items)
-        except StopIteration:
-            raise StopAsyncIteration
-
-
 @pytest.mark.asyncio
 @patch("nest_rpc_client.transports.redis.Redis")
 async def test_connect(mock_redis):
@@ -66,39 +54,73 @@ async def test_emit_publishes_correct_message():
 
     await transport.emit("pattern", {"key": "value"})
 
-    expected_body = json.dumps({"pattern": "pattern", "data": {"key": "value"}})
+    expected_body = json.dumps(
+        {"pattern": "pattern", "data": {"key": "value"}}
+    ).encode("utf-8")
     fake_client.publish.assert_awaited_once_with("pattern", expected_body)
 
 
 @pytest.mark.asyncio
-@patch("nest_rpc_client.transports.redis.uuid.uuid4")
-async def test_send_publishes_and_listens_for_response(mock_uuid4):
-    correlation_id = "1234"
-    mock_uuid4.return_value = correlation_id
+async def test_emit_many_uses_pipeline():
+    transport = RedisTransport(RedisConfig("", 1))
 
-    config = RedisConfig("", 1)
+    fake_pipe = Mock()
+    fake_pipe.execute = AsyncMock()
+    fake_pipe.__aenter__ = AsyncMock(return_value=fake_pipe)
+    fake_pipe.__aexit__ = AsyncMock(return_value=None)
+    transport.client = Mock()
+    transport.client.pipeline = Mock(return_value=fake_pipe)
+
+    await transport.emit_many([("a", 1), ("b", 2)])
+
+    transport.client.pipeline.assert_called_once_with(transaction=False)
+    assert [c.args[0] for c in fake_pipe.publish.call_args_list] == ["a", "b"]
+    fake_pipe.execute.assert_awaited_once()
+
+
+class FakePubSub:
+    def __init__(self):
+        self.messages: asyncio.Queue[dict] = asyncio.Queue()
+        self.subscribe = AsyncMock()
+        self.aclose = AsyncMock()
+
+    async def listen(self):
+        while True:
+            yield await self.messages.get()
+
+    def reply(self, payload: dict) -> None:
+        self.messages.put_nowait({"type": "message", "data": json.dumps(payload)})
+
+
+def make_transport(config: RedisConfig) -> tuple[RedisTransport, FakePubSub]:
     transport = RedisTransport(config)
 
     fake_client = AsyncMock()
+    fake_pubsub = FakePubSub()
+    fake_client.pubsub = Mock(return_value=fake_pubsub)
     transport.client = fake_client
 
-    fake_pubsub = AsyncMock()
-    fake_client.pubsub = Mock(return_value=fake_pubsub)
+    return transport, fake_pubsub
 
-    expected_response = {"foo": "bar"}
-    response_message = {
-        "type": "message",
-        "data": json.dumps({"id": correlation_id, "response": expected_response}),
-    }
 
-    async def fake_listen():
-        yield response_message
+def published_ids(transport: RedisTransport) -> list[str]:
+    return [
+        json.loads(c.args[1])["id"] for c in transport.client.publish.call_args_list
+    ]
 
-    fake_pubsub.listen = Mock(return_value=fake_listen())
 
-    fake_pubsub.subscribe = AsyncMock()
-    fake_pubsub.unsubscribe = AsyncMock()
-    fake_pubsub.aclose = AsyncMock()
+@pytest.mark.asyncio
+@patch("nest_rpc_client.transports.redis.uuid.uuid4")
+async def test_send_publishes_and_listens_for_response(mock_uuid4):
+    correlation_id = "1234"
+    mock_uuid4.return_value = correlation_id
+
+    config = RedisConfig("", 1)
+    transport, fake_pubsub = make_transport(config)
+    fake_client = transport.client
+
+    expected_response = {"foo": "bar"}
+    fake_pubsub.reply({"id": correlation_id, "response": expected_response})
 
     result = await transport.send("pattern", {"x": 123})
 
@@ -110,5 +132,88 @@ async def test_send_publishes_and_listens_for_response(mock_uuid4):
     assert sent_data["data"] == {"x": 123}
 
     fake_pubsub.subscribe.assert_awaited_once_with("pattern.reply")
-    fake_pubsub.unsubscribe.assert_awaited_once_with("pattern.reply")
+
+    await transport.close()
     fake_pubsub.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sends_share_one_subscription():
+    transport, fake_pubsub = make_transport(RedisConfig("", 1))
+
+    first = asyncio.create_task(transport.send("pattern", {"n": 1}))
+    second = asyncio.create_task(transport.send("pattern", {"n": 2}))
+    await asyncio.sleep(0.01)
+
+    first_id, second_id = published_ids(transport)
+    fake_pubsub.reply({"id": "someone-else", "response": 0})
+    fake_pubsub.reply({"id": second_id, "response": 2})
+    fake_pubsub.reply({"id": first_id, "response": 1})
+
+    assert await first == 1
+    assert await second == 2
+
+    transport.client.pubsub.assert_called_once()
+    fake_pubsub.subscribe.assert_awaited_once_with("pattern.reply")
+
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_send_timeout_drops_pending_entry():
+    transport, _ = make_transport(RedisConfig("", 1, response_timeout=0.01))
+
+    with pytest.raises(RpcTimeoutError):
+        await transport.send("pattern", {})
+
+    assert transport._pending == {}
+
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_close_fails_pending_requests():
+    transport, _ = make_transport(RedisConfig("", 1))
+
+    task = asyncio.create_task(transport.send("pattern", {}))
+    await asyncio.sleep(0.01)
+    await transport.close()
+
+    with pytest.raises(ConnectionError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_replies_until_disposed():
+    transport, fake_pubsub = make_transport(RedisConfig("", 1))
+
+    chunks = transport.stream("numbers", {})
+    first = asyncio.create_task(anext(chunks))
+    await asyncio.sleep(0)
+    (correlation_id,) = published_ids(transport)
+
+    fake_pubsub.reply({"id": correlation_id, "response": 1})
+    fake_pubsub.reply({"id": correlation_id, "response": 2})
+    fake_pubsub.reply({"id": correlation_id, "isDisposed": True})
+
+    assert await first == 1
+    assert [chunk async for chunk in chunks] == [2]
+    fake_pubsub.subscribe.assert_awaited_once_with("numbers.reply")
+
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_emit_object_pattern_publishes_on_canonical_channel():
+    transport = RedisTransport(RedisConfig("", 1))
+    fake_client = AsyncMock()
+    transport.client = fake_client
+
+    await transport.emit({"role": "math", "cmd": "sum"}, {"key": "value"})
+
+    expected_body = json.dumps(
+        {"pattern": {"role": "math", "cmd": "sum"}, "data": {"key": "value"}}
+    ).encode("utf-8")
+    fake_client.publish.assert_awaited_once_with(
+        '{"cmd":"sum","role":"math"}', expected_body
+    )
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from nest_rpc_client.config.retry import HedgePolicy, RetryConfig, RetryPolicy
+from nest_rpc_client.exceptions.rpc import RpcException
+from nest_rpc_client.exceptions.timeout import RpcTimeoutError
+from nest_rpc_client.transports.mock import MockTransport
+from nest_rpc_client.transports.retry import LatencyWindow, RetryBudget, RetryTransport
+
+FAST = RetryPolicy(max_attempts=3, initial_backoff=0.001, jitter=0)
+
+
+class ScriptedTransport(MockTransport):
+    """
+    Returns (or raises) the next scripted outcome on each send, after an
+    optional delay.
+    """
+
+    def __init__(self, outcomes: list):
+        super().__init__()
+        self.outcomes = outcomes
+        self.cancelled = 0
+
+    async def send(self, pattern, data, timeout=None):
+        delay, outcome = self.outcomes[len(self.sent_patterns)]
+        self.sent_patterns.append((pattern, data))
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+@pytest.mark.asyncio
+async def test_retries_retryable_errors():
+    inner = ScriptedTransport(
+        [(0, ConnectionError()), (0, RpcTimeoutError("p", 1)), (0, "ok")]
+    )
+    transport = RetryTransport(inner, RetryConfig(default=FAST))
+
+    assert await transport.send("p", {}) == "ok"
+    assert len(inner.sent_patterns) == 3
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_rpc_errors_or_past_max_attempts():
+    inner = ScriptedTransport([(0, RpcException("bad"))])
+    transport = RetryTransport(inner, RetryConfig(default=FAST))
+    with pytest.raises(RpcException):
+        await transport.send("p", {})
+    assert len(inner.sent_patterns) == 1
+
+    inner = ScriptedTransport([(0, ConnectionError())] * 3)
+    transport = RetryTransport(inner, RetryConfig(default=FAST))
+    with pytest.raises(ConnectionError):
+        await transport.send("p", {})
+    assert len(inner.sent_patterns) == 3
+
+
+@pytest.mark.asyncio
+async def test_per_pattern_policy_overrides_default():
+    inner = ScriptedTransport([(0, ConnectionError())])
+    transport = RetryTransport(
+        inner,
+        RetryConfig(default=FAST, policies={"p": RetryPolicy(max_attempts=1)}),
+    )
+
+    with pytest.raises(ConnectionError):
+        await transport.send("p", {})
+    assert len(inner.sent_patterns) == 1
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_stops_retries():
+    inner = ScriptedTransport([(0, ConnectionError())] * 3)
+    transport = RetryTransport(
+        inner, RetryConfig(default=FAST, budget_min_per_second=0, budget_ratio=0)
+    )
+
+    with pytest.raises(ConnectionError):
+        await transport.send("p", {})
+    assert len(inner.sent_patterns) == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_a_deadline_for_all_attempts():
+    inner = ScriptedTransport([(0.05, ConnectionError())] * 3)
+    transport = RetryTransport(inner, RetryConfig(default=FAST))
+
+    with pytest.raises(RpcTimeoutError):
+        await transport.send("p", {}, timeout=0.08)
+    assert len(inner.sent_patterns) == 2
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_takes_first_reply_and_cancels_other():
+    inner = ScriptedTransport([(1, "slow"), (0, "fast")])
+    transport = RetryTransport(
+        inner, RetryConfig(default=None, hedging={"p": HedgePolicy(delay=0.01)})
+    )
+
+    assert await transport.send("p", {}) == "fast"
+    await asyncio.sleep(0)
+
+    assert len(inner.sent_patterns) == 2
+    assert inner.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_when_first_reply_is_fast():
+    inner = ScriptedTransport([(0, "fast")])
+    transport = RetryTransport(
+        inner, RetryConfig(default=None, hedging={"p": HedgePolicy(delay=0.05)})
+    )
+
+    assert await transport.send("p", {}) == "fast"
+    assert len(inner.sent_patterns) == 1
+    assert len(transport._latencies["p"]) == 1
+
+
+def test_latency_window_quantile():
+    window = LatencyWindow(size=100, refresh=1)
+    assert window.quantile(0.95) is None
+
+    for value in range(100):
+        window.add(value)
+
+    assert window.quantile(0.95) == 95
+    assert window.quantile(0.5) == 50
+
+
+def test_budget_limits_extra_attempts():
+    budget = RetryBudget(ratio=0.5, min_per_second=0, burst=10)
+    assert budget.withdraw() is False
+
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw() is True
+    assert budget.withdraw() is False
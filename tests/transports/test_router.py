@@ -0,0 +1,110 @@
+import json
+
+import pytest
+
+from nest_rpc_client.config.router import Route, RouterConfig
+from nest_rpc_client.exceptions.rpc import RpcException
+from nest_rpc_client.transports.mock import MockTransport
+from nest_rpc_client.transports.router import RouterTransport
+
+
+class NamedTransport(MockTransport):
+    def __init__(self, name: str, error: Exception | None = None):
+        super().__init__()
+        self.name = name
+        self.error = error
+
+    async def send(self, pattern, data, timeout=None):
+        self.sent_patterns.append((pattern, data))
+        if self.error is not None:
+            raise self.error
+        return self.name
+
+    async def emit(self, pattern, data):
+        if self.error is not None:
+            raise self.error
+        await super().emit(pattern, data)
+
+
+@pytest.mark.asyncio
+async def test_routes_by_exact_prefix_glob_then_default():
+    tcp, nats = NamedTransport("tcp"), NamedTransport("nats")
+    glob, default = NamedTransport("glob"), NamedTransport("default")
+    transport = RouterTransport(
+        RouterConfig(
+            routes={
+                "reports.daily": tcp,
+                "reports.*": nats,
+                "reports.daily.*": tcp,
+                "*.health": glob,
+            },
+            default=default,
+        )
+    )
+
+    assert await transport.send("reports.daily", {}) == "tcp"
+    assert await transport.send("reports.weekly", {}) == "nats"
+    assert await transport.send("reports.daily.pdf", {}) == "tcp"
+    assert await transport.send("users.health", {}) == "glob"
+    assert await transport.send("get_user", {}) == "default"
+
+
+@pytest.mark.asyncio
+async def test_object_patterns_match_regardless_of_key_order():
+    tcp = NamedTransport("tcp")
+    transport = RouterTransport(
+        RouterConfig(routes={json.dumps({"cmd": "sum", "role": "math"}): tcp})
+    )
+
+    pattern = json.dumps({"role": "math", "cmd": "sum"})
+    assert await transport.send(pattern, {}) == "tcp"
+    assert tcp.sent_patterns == [(pattern, {})]
+
+
+@pytest.mark.asyncio
+async def test_unrouted_pattern_raises():
+    transport = RouterTransport(RouterConfig(routes={"a": NamedTransport("a")}))
+
+    with pytest.raises(LookupError):
+        await transport.send("b", {})
+
+
+@pytest.mark.asyncio
+async def test_falls_back_on_connection_errors_only():
+    primary = NamedTransport("tcp", ConnectionError())
+    secondary = NamedTransport("nats")
+    transport = RouterTransport(
+        RouterConfig(routes={"get_user": Route(primary, fallback=secondary)})
+    )
+
+    assert await transport.send("get_user", {}) == "nats"
+    await transport.emit("get_user", {"id": 1})
+    assert secondary.emitted_patterns == [("get_user", {"id": 1})]
+
+    primary.error = RpcException("not found")
+    with pytest.raises(RpcException):
+        await transport.send("get_user", {})
+
+
+@pytest.mark.asyncio
+async def test_connects_and_closes_each_transport_once():
+    tcp, nats = NamedTransport("tcp"), NamedTransport("nats")
+    transport = RouterTransport(
+        RouterConfig(
+            routes={"a": tcp, "b": Route(tcp, fallback=nats), "c.*": nats},
+            default=tcp,
+        )
+    )
+
+    assert transport.transports == [tcp, nats]
+    await transport.connect()
+    await transport.close()
+    assert tcp.connected and tcp.closed and nats.connected and nats.closed
+
+
+def test_route_lookup_is_cached():
+    transport = RouterTransport(RouterConfig(routes={"a.*": NamedTransport("a")}))
+
+    route = transport.route("a.b")
+    assert transport._cache == {"a.b": route}
+    assert transport.route("a.b") is route
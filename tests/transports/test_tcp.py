@@ -1,9 +1,13 @@
+import asyncio
 import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from nest_rpc_client.config.tcp import TCPConfig
+from nest_rpc_client.exceptions.stream import StreamOverflowError
+from nest_rpc_client.exceptions.timeout import RpcTimeoutError
+from nest_rpc_client.metrics import InMemoryMetrics
 from nest_rpc_client.transports.tcp import TCPTransport
 
 
@@ -11,6 +15,7 @@ from nest_rpc_client.transports.tcp import TCPTransport
 @patch("nest_rpc_client.transports.tcp.asyncio.open_connection", new_callable=AsyncMock)
 async def test_connect(mock_open_connection):
     fake_reader = AsyncMock()
+    fake_reader.read = AsyncMock(return_value=b"")
     fake_writer = AsyncMock()
     mock_open_connection.return_value = (fake_reader, fake_writer)
 
@@ -71,6 +76,94 @@ async def test_emit_sends_correct_format():
     fake_writer.drain.assert_awaited_once()
 
 
+def test_binary_serializers_are_rejected():
+    pytest.importorskip("msgpack")
+    from nest_rpc_client.serializers.msgpack import MsgpackSerializer
+
+    with pytest.raises(ValueError):
+        TCPTransport(TCPConfig("localhost", 3002, serializer=MsgpackSerializer()))
+
+
+def frame(payload: dict) -> bytes:
+    body = json.dumps(payload)
+    return f"{len(body)}#{body}".encode()
+
+
+class FakeReader:
+    def __init__(self):
+        self.chunks: asyncio.Queue[bytes] = asyncio.Queue()
+
+    async def read(self, n: int) -> bytes:
+        return await self.chunks.get()
+
+
+async def connect_transport(config: TCPConfig, reader: FakeReader) -> TCPTransport:
+    fake_writer = AsyncMock()
+    fake_writer.write = Mock()
+    fake_writer.close = Mock()
+
+    with patch(
+        "nest_rpc_client.transports.tcp.asyncio.open_connection",
+        new_callable=AsyncMock,
+        return_value=(reader, fake_writer),
+    ):
+        transport = TCPTransport(config)
+        await transport.connect()
+
+    return transport
+
+
+def sent_ids(transport: TCPTransport) -> list[str]:
+    ids = []
+    for call in transport.writer.write.call_args_list:
+        _, json_str = call.args[0].decode().split("#", 1)
+        ids.append(json.loads(json_str)["id"])
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_emit_many_writes_frames_in_one_call():
+    transport = TCPTransport(TCPConfig("localhost", 3002))
+    fake_writer = AsyncMock()
+    fake_writer.writelines = Mock()
+    transport.writer = fake_writer
+
+    await transport.emit_many([("a", 1), ("b", 2), ("c", 3)], concurrency=2)
+
+    assert fake_writer.writelines.call_count == 2
+    frames = [f for c in fake_writer.writelines.call_args_list for f in c.args[0]]
+    payloads = [json.loads(frame.split(b"#", 1)[1]) for frame in frames]
+    assert payloads == [
+        {"pattern": "a", "data": 1},
+        {"pattern": "b", "data": 2},
+        {"pattern": "c", "data": 3},
+    ]
+    assert fake_writer.drain.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_emit_coalesces_until_flush_or_close():
+    transport = TCPTransport(TCPConfig("localhost", 3002, emit_linger=10))
+    fake_writer = AsyncMock()
+    fake_writer.write = Mock()
+    fake_writer.writelines = Mock()
+    fake_writer.close = Mock()
+    transport.writer = fake_writer
+
+    await transport.emit("a", 1)
+    await transport.emit("b", 2)
+    fake_writer.write.assert_not_called()
+    fake_writer.writelines.assert_not_called()
+
+    await transport.flush()
+    assert len(fake_writer.writelines.call_args.args[0]) == 2
+
+    await transport.emit("c", 3)
+    await transport.close()
+    assert fake_writer.writelines.call_count == 2
+    assert len(fake_writer.writelines.call_args.args[0]) == 1
+
+
 @pytest.mark.asyncio
 @patch("uuid.uuid4")
 async def test_send_sends_and_receives_response(mock_uuid4):
@@ -78,18 +171,13 @@ async def test_send_sends_and_receives_response(mock_uuid4):
     mock_uuid4.return_value = correlation_id
 
     config = TCPConfig("localhost", 3002)
-    transport = TCPTransport(config)
+    fake_reader = FakeReader()
+    transport = await connect_transport(config, fake_reader)
+    fake_writer = transport.writer
 
-    fake_reader = AsyncMock()
-    fake_writer = AsyncMock()
-    fake_writer.write = Mock()
-
-    transport.reader = fake_reader
-    transport.writer = fake_writer
-
-    response_payload = json.dumps({"id": correlation_id, "response": {"result": "ok"}})
-    server_message = f"{len(response_payload)}#{response_payload}"
-    fake_reader.read = AsyncMock(side_effect=[server_message.encode(), b""])
+    fake_reader.chunks.put_nowait(
+        frame({"id": correlation_id, "response": {"result": "ok"}})
+    )
 
     result = await transport.send("pattern", {"foo": "bar"})
 
@@ -106,3 +194,177 @@ async def test_send_sends_and_receives_response(mock_uuid4):
     assert sent_payload["id"] == correlation_id
 
     fake_writer.drain.assert_awaited()
+
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sends_are_dispatched_by_id():
+    fake_reader = FakeReader()
+    transport = await connect_transport(TCPConfig("localhost", 3002), fake_reader)
+
+    first = asyncio.create_task(transport.send("pattern", {"n": 1}))
+    second = asyncio.create_task(transport.send("pattern", {"n": 2}))
+    await asyncio.sleep(0)
+
+    first_id, second_id = sent_ids(transport)
+    replies = frame({"id": second_id, "response": 2}) + frame(
+        {"id": first_id, "response": 1}
+    )
+    fake_reader.chunks.put_nowait(replies[:7])
+    fake_reader.chunks.put_nowait(replies[7:])
+
+    assert await first == 1
+    assert await second == 2
+
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_send_times_out_and_forgets_pending_request():
+    fake_reader = FakeReader()
+    transport = await connect_transport(
+        TCPConfig("localhost", 3002, response_timeout=0.01), fake_reader
+    )
+
+    with pytest.raises(RpcTimeoutError):
+        await transport.send("pattern", {})
+
+    assert transport._pending == {}
+
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_send_timeout_argument_overrides_config():
+    fake_reader = FakeReader()
+    transport = await connect_transport(
+        TCPConfig("localhost", 3002, response_timeout=60), fake_reader
+    )
+
+    with pytest.raises(RpcTimeoutError) as exc_info:
+        await transport.send("pattern", {}, timeout=0.01)
+
+    assert exc_info.value.pattern == "pattern"
+    assert exc_info.value.timeout == 0.01
+    assert transport._pending == {}
+
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_fails_pending_requests():
+    fake_reader = FakeReader()
+    transport = await connect_transport(TCPConfig("localhost", 3002), fake_reader)
+
+    task = asyncio.create_task(transport.send("pattern", {}))
+    await asyncio.sleep(0)
+    fake_reader.chunks.put_nowait(b"")
+
+    with pytest.raises(ConnectionError):
+        await task
+
+    with pytest.raises(ConnectionError):
+        await transport.send("pattern", {})
+
+
+@pytest.mark.asyncio
+async def test_send_and_emit_report_metrics():
+    fake_reader = FakeReader()
+    transport = await connect_transport(TCPConfig("localhost", 3002), fake_reader)
+    transport.metrics = InMemoryMetrics()
+
+    task = asyncio.create_task(transport.send("pattern", {"n": 1}))
+    await asyncio.sleep(0)
+    (request_id,) = sent_ids(transport)
+    reply = frame({"id": request_id, "response": 1})
+    fake_reader.chunks.put_nowait(reply)
+    assert await task == 1
+
+    await transport.emit("event", {})
+
+    stats = transport.metrics.stats("pattern")
+    assert stats.requests == 1
+    assert stats.errors == 0
+    assert stats.in_flight == 0
+    assert stats.bytes_in == len(reply.split(b"#", 1)[1])
+    assert stats.bytes_out > 0
+    assert transport.metrics.stats("event").events == 1
+
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_chunks_until_disposed():
+    fake_reader = FakeReader()
+    transport = await connect_transport(TCPConfig("localhost", 3002), fake_reader)
+
+    chunks = transport.stream("numbers", {})
+    first = asyncio.create_task(anext(chunks))
+    await asyncio.sleep(0)
+    (correlation_id,) = sent_ids(transport)
+
+    fake_reader.chunks.put_nowait(
+        frame({"id": correlation_id, "response": 1})
+        + frame({"id": correlation_id, "response": 2})
+    )
+    assert await first == 1
+    assert await anext(chunks) == 2
+
+    fake_reader.chunks.put_nowait(
+        frame({"id": correlation_id, "response": 3, "isDisposed": True})
+    )
+    assert [chunk async for chunk in chunks] == [3]
+    assert transport._streams == {}
+
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_early_is_forgotten():
+    fake_reader = FakeReader()
+    transport = await connect_transport(TCPConfig("localhost", 3002), fake_reader)
+
+    chunks = transport.stream("numbers", {})
+    first = asyncio.create_task(anext(chunks))
+    await asyncio.sleep(0)
+    (correlation_id,) = sent_ids(transport)
+
+    fake_reader.chunks.put_nowait(frame({"id": correlation_id, "response": 1}))
+    assert await first == 1
+    await chunks.aclose()
+
+    assert transport._streams == {}
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_paused_stream_does_not_hold_up_other_replies():
+    fake_reader = FakeReader()
+    transport = await connect_transport(
+        TCPConfig("localhost", 3002, stream_buffer=2), fake_reader
+    )
+
+    chunks = transport.stream("numbers", {})
+    first = asyncio.create_task(anext(chunks))
+    await asyncio.sleep(0)
+    (stream_id,) = sent_ids(transport)
+    fake_reader.chunks.put_nowait(frame({"id": stream_id, "response": 0}))
+    assert await first == 0
+
+    request = asyncio.create_task(transport.send("ping", {}, timeout=1))
+    await asyncio.sleep(0)
+    _, request_id = sent_ids(transport)
+    fake_reader.chunks.put_nowait(
+        b"".join(frame({"id": stream_id, "response": n}) for n in range(1, 5))
+        + frame({"id": request_id, "response": "pong"})
+    )
+
+    assert await request == "pong"
+    assert await anext(chunks) == 1
+    assert await anext(chunks) == 2
+    with pytest.raises(StreamOverflowError):
+        await anext(chunks)
+    assert transport._streams == {}
+
+    await transport.close()
@@ -0,0 +1,210 @@
+import asyncio
+import json
+import socket
+import struct
+from collections import Counter
+
+import pytest
+
+from nest_rpc_client.config.tcp import TCPClusterConfig, TCPConfig
+from nest_rpc_client.exceptions.rpc import RpcException
+from nest_rpc_client.exceptions.timeout import RpcTimeoutError
+from nest_rpc_client.transports.tcp_cluster import TCPClusterTransport
+from nest_rpc_client.utils.frame import FrameDecoder, encode_frame
+
+
+async def start_replica(name: str, port: int = 0) -> asyncio.Server:
+    """NestJS-style TCP server replying with its own name."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        decoder = FrameDecoder()
+        while chunk := await reader.read(65536):
+            for frame in decoder.feed(chunk):
+                packet = json.loads(frame)
+                if "id" not in packet or packet["pattern"] == "hang":
+                    continue
+                if packet["pattern"] == "fail":
+                    reply = {"id": packet["id"], "err": name}
+                else:
+                    reply = {"id": packet["id"], "response": name}
+                writer.write(encode_frame(json.dumps(reply).encode()))
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", port)
+
+
+async def start_cluster(size: int, **options):
+    servers = [await start_replica(f"r{n}") for n in range(size)]
+    endpoints = [
+        TCPConfig("127.0.0.1", server.sockets[0].getsockname()[1]) for server in servers
+    ]
+    transport = TCPClusterTransport(TCPClusterConfig(endpoints, **options))
+    await transport.connect()
+    return transport, servers
+
+
+async def stop_cluster(transport, servers):
+    await transport.close()
+    for server in servers:
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_round_robin_visits_every_replica():
+    transport, servers = await start_cluster(3, strategy="round_robin")
+    try:
+        replies = [await transport.send("who", {}) for _ in range(6)]
+        assert Counter(replies) == {"r0": 2, "r1": 2, "r2": 2}
+    finally:
+        await stop_cluster(transport, servers)
+
+
+@pytest.mark.asyncio
+async def test_least_outstanding_avoids_busy_replica():
+    transport, servers = await start_cluster(2)
+    try:
+        busy = transport.endpoints[0].transport
+        busy._pending["busy"] = asyncio.get_running_loop().create_future()
+
+        assert await transport.send("who", {}) == "r1"
+    finally:
+        transport.endpoints[0].transport._pending.clear()
+        await stop_cluster(transport, servers)
+
+
+@pytest.mark.asyncio
+async def test_ewma_prefers_faster_replica():
+    transport, servers = await start_cluster(2, strategy="ewma")
+    try:
+        transport.endpoints[0].latency = 0.5
+        transport.endpoints[1].latency = 0.01
+
+        assert await transport.send("who", {}) == "r1"
+        assert transport.stats()[1].latency is not None
+    finally:
+        await stop_cluster(transport, servers)
+
+
+@pytest.mark.asyncio
+async def test_consistent_hash_is_sticky_and_fails_over():
+    transport, servers = await start_cluster(
+        3,
+        strategy="consistent_hash",
+        hash_key=lambda pattern, data: data.get("user_id"),
+    )
+    try:
+        owners = {
+            user_id: await transport.send("who", {"user_id": user_id})
+            for user_id in range(30)
+        }
+        assert len(set(owners.values())) == 3
+        for user_id, owner in owners.items():
+            assert await transport.send("who", {"user_id": user_id}) == owner
+
+        transport.endpoints[0].healthy = False
+        moved = {
+            user_id: await transport.send("who", {"user_id": user_id})
+            for user_id in owners
+        }
+        assert "r0" not in moved.values()
+        assert all(
+            moved[user_id] == owner
+            for user_id, owner in owners.items()
+            if owner != "r0"
+        )
+    finally:
+        await stop_cluster(transport, servers)
+
+
+@pytest.mark.asyncio
+async def test_failing_replica_is_ejected_and_reprobed():
+    transport, servers = await start_cluster(
+        2, strategy="round_robin", eject_after=2, probe_interval=0.01
+    )
+    try:
+        dead = transport.endpoints[0]
+        servers[0].close()
+        await dead.transport.close()
+
+        replies = [await transport.send("who", {}) for _ in range(4)]
+        assert replies == ["r1"] * 4
+        assert transport.stats()[0].connected is False
+
+        servers[0] = await start_replica("r0", dead.config.port)
+        for _ in range(100):
+            if transport.stats()[0].connected:
+                break
+            await asyncio.sleep(0.01)
+        assert transport.stats()[0].healthy is True
+    finally:
+        await stop_cluster(transport, servers)
+
+
+@pytest.mark.asyncio
+async def test_timeouts_eject_but_error_replies_do_not():
+    transport, servers = await start_cluster(2, eject_after=1, probe_interval=60)
+    try:
+        with pytest.raises(RpcException):
+            await transport.send("fail", {})
+        assert all(stats.healthy for stats in transport.stats())
+
+        with pytest.raises(RpcTimeoutError):
+            await transport.send("hang", {}, timeout=0.01)
+        assert [stats.healthy for stats in transport.stats()] == [False, True]
+        assert await transport.send("who", {}) == "r1"
+    finally:
+        await stop_cluster(transport, servers)
+
+
+@pytest.mark.asyncio
+async def test_connect_fails_only_when_no_replica_is_reachable():
+    server = await start_replica("r0")
+    port = server.sockets[0].getsockname()[1]
+    server.close()
+    await server.wait_closed()
+
+    transport = TCPClusterTransport(TCPClusterConfig([TCPConfig("127.0.0.1", port)]))
+    with pytest.raises(OSError):
+        await transport.connect()
+
+
+@pytest.mark.asyncio
+async def test_probe_survives_connections_reset_by_peer():
+    writers: list[asyncio.StreamWriter] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        writers.append(writer)
+        decoder = FrameDecoder()
+        while chunk := await reader.read(65536):
+            for frame in decoder.feed(chunk):
+                packet = json.loads(frame)
+                reply = {"id": packet["id"], "response": "ok"}
+                writer.write(encode_frame(json.dumps(reply).encode()))
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    transport = TCPClusterTransport(
+        TCPClusterConfig([TCPConfig("127.0.0.1", port)], probe_interval=0.01)
+    )
+    await transport.connect()
+    try:
+        for _ in range(2):
+            connection = transport.endpoints[0].transport
+            sock = writers[-1].get_extra_info("socket")
+            sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+            )
+            writers[-1].transport.abort()
+            for _ in range(200):
+                endpoint = transport.endpoints[0]
+                if endpoint.transport is not connection and endpoint.available:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert transport.endpoints[0].transport is not connection
+            assert not transport._probe_task.done()
+
+        assert await transport.send("who", {}) == "ok"
+    finally:
+        await transport.close()
+        server.close()
@@ -0,0 +1,172 @@
+import asyncio
+import json
+import socket
+import struct
+
+import pytest
+
+from nest_rpc_client.config.circuit import CircuitBreakerConfig
+from nest_rpc_client.config.tcp import TCPPoolConfig
+from nest_rpc_client.exceptions.circuit import CircuitOpenError
+from nest_rpc_client.transports.tcp_pool import TCPPoolTransport
+from nest_rpc_client.utils.circuit import CircuitState
+from nest_rpc_client.utils.frame import FrameDecoder, encode_frame
+
+
+async def start_echo_server() -> asyncio.Server:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        decoder = FrameDecoder()
+        while chunk := await reader.read(65536):
+            for frame in decoder.feed(chunk):
+                packet = json.loads(frame)
+                if "id" in packet:
+                    reply = {"id": packet["id"], "response": packet["data"]}
+                    writer.write(encode_frame(json.dumps(reply).encode()))
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+@pytest.mark.asyncio
+async def test_pool_spreads_requests_across_connections():
+    server = await start_echo_server()
+    port = server.sockets[0].getsockname()[1]
+    transport = TCPPoolTransport(TCPPoolConfig("127.0.0.1", port, pool_size=3))
+
+    await transport.connect()
+    try:
+        results = await asyncio.gather(
+            *(transport.send("echo", {"n": n}) for n in range(30))
+        )
+        assert results == [{"n": n} for n in range(30)]
+
+        stats = transport.stats()
+        assert stats.size == 3
+        assert stats.connected == 3
+        assert stats.in_flight == [0, 0, 0]
+    finally:
+        await transport.close()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_picks_least_loaded_connection():
+    server = await start_echo_server()
+    port = server.sockets[0].getsockname()[1]
+    transport = TCPPoolTransport(TCPPoolConfig("127.0.0.1", port, pool_size=2))
+
+    await transport.connect()
+    try:
+        first, second = transport.connections
+        first._pending["busy"] = asyncio.get_running_loop().create_future()
+
+        assert transport._pick() is second
+    finally:
+        await transport.close()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_replaces_dead_connections():
+    server = await start_echo_server()
+    port = server.sockets[0].getsockname()[1]
+    transport = TCPPoolTransport(
+        TCPPoolConfig("127.0.0.1", port, pool_size=2, reconnect_delay=0.01)
+    )
+
+    await transport.connect()
+    try:
+        dead = transport.connections[0]
+        await dead.close()
+        assert transport.stats().connected == 1
+
+        assert await transport.send("echo", 1) == 1
+
+        for _ in range(100):
+            if transport.stats().connected == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        stats = transport.stats()
+        assert stats.connected == 2
+        assert stats.reconnects == 1
+        assert dead not in transport.connections
+    finally:
+        await transport.close()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_skips_connections_with_open_circuit():
+    server = await start_echo_server()
+    port = server.sockets[0].getsockname()[1]
+    transport = TCPPoolTransport(
+        TCPPoolConfig(
+            "127.0.0.1",
+            port,
+            pool_size=2,
+            circuit_breaker=CircuitBreakerConfig(minimum_requests=1, open_duration=60),
+        )
+    )
+
+    await transport.connect()
+    try:
+        transport.breakers[0].record(ConnectionError())
+        transport.connections[1]._pending["busy"] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+        assert await transport.send("echo", 1) == 1
+        assert transport.stats().circuits == [CircuitState.OPEN, CircuitState.CLOSED]
+
+        transport.breakers[1].record(ConnectionError())
+        with pytest.raises(CircuitOpenError):
+            await transport.send("echo", 1)
+    finally:
+        transport.connections[1]._pending.clear()
+        await transport.close()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_keeps_replacing_connections_reset_by_peer():
+    writers: list[asyncio.StreamWriter] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        writers.append(writer)
+        decoder = FrameDecoder()
+        while chunk := await reader.read(65536):
+            for frame in decoder.feed(chunk):
+                packet = json.loads(frame)
+                reply = {"id": packet["id"], "response": packet["data"]}
+                writer.write(encode_frame(json.dumps(reply).encode()))
+
+    def reset(writer: asyncio.StreamWriter) -> None:
+        sock = writer.get_extra_info("socket")
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        writer.transport.abort()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    transport = TCPPoolTransport(
+        TCPPoolConfig("127.0.0.1", port, pool_size=2, reconnect_delay=0.01)
+    )
+
+    await transport.connect()
+    try:
+        for expected in (1, 2):
+            reset(writers[-1])
+            for _ in range(200):
+                stats = transport.stats()
+                if stats.reconnects == expected and stats.connected == 2:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert transport.stats().reconnects == expected
+            assert transport.stats().connected == 2
+            assert not transport._maintain_task.done()
+
+        assert await transport.send("echo", 1) == 1
+    finally:
+        await transport.close()
+        server.close()
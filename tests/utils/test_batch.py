@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from nest_rpc_client.utils.batch import chunk_items, run_bounded
+
+
+class Recorder:
+    def __init__(self, delays: dict[int, float] | None = None):
+        self.delays = delays or {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, pattern: str, data: int) -> int:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(data, 0))
+            if pattern == "fail":
+                raise ValueError(data)
+            return data * 10
+        finally:
+            self.in_flight -= 1
+
+
+async def collect(iterator) -> list:
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_preserves_input_order():
+    call = Recorder(delays={0: 0.02, 1: 0.01})
+    items = [("p", n) for n in range(5)]
+
+    results = await collect(
+        run_bounded(call, items, concurrency=2, ordered=True, return_exceptions=False)
+    )
+
+    assert results == [(n, n * 10) for n in range(5)]
+    assert call.max_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_yields_in_completion_order():
+    call = Recorder(delays={0: 0.02})
+    items = [("p", n) for n in range(3)]
+
+    results = await collect(
+        run_bounded(call, items, concurrency=3, ordered=False, return_exceptions=False)
+    )
+
+    assert results[-1] == (0, 0)
+    assert sorted(results) == [(0, 0), (1, 10), (2, 20)]
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_accepts_async_iterables():
+    call = Recorder()
+
+    async def items():
+        for n in range(3):
+            yield ("p", n)
+
+    results = await collect(
+        run_bounded(
+            call, items(), concurrency=10, ordered=True, return_exceptions=False
+        )
+    )
+
+    assert results == [(0, 0), (1, 10), (2, 20)]
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_raises_or_returns_exceptions():
+    call = Recorder()
+    items = [("p", 1), ("fail", 2), ("p", 3)]
+
+    with pytest.raises(ValueError):
+        await collect(
+            run_bounded(
+                call, items, concurrency=1, ordered=True, return_exceptions=False
+            )
+        )
+
+    results = await collect(
+        run_bounded(call, items, concurrency=1, ordered=True, return_exceptions=True)
+    )
+    assert results[0] == (0, 10)
+    assert isinstance(results[1][1], ValueError)
+    assert results[2] == (2, 30)
+
+
+@pytest.mark.asyncio
+async def test_chunk_items():
+    chunks = await collect(chunk_items([("p", n) for n in range(5)], 2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from nest_rpc_client.config.circuit import CircuitBreakerConfig
+from nest_rpc_client.exceptions.rpc import RpcException
+from nest_rpc_client.utils.circuit import CircuitBreaker, CircuitState
+
+
+def make_breaker(**kwargs) -> tuple[CircuitBreaker, list]:
+    changes = []
+    config = CircuitBreakerConfig(
+        **{"minimum_requests": 4, "open_duration": 0.01, **kwargs}
+    )
+    breaker = CircuitBreaker("p", config, lambda name, state: changes.append(state))
+    return breaker, changes
+
+
+def test_opens_once_failure_rate_is_reached():
+    breaker, changes = make_breaker(failure_rate=0.5)
+
+    breaker.record(None)
+    breaker.record(ConnectionError())
+    breaker.record(None)
+    assert breaker.state is CircuitState.CLOSED
+
+    breaker.record(ConnectionError())
+    assert breaker.state is CircuitState.OPEN
+    assert changes == [CircuitState.OPEN]
+    assert breaker.allow() is False
+    assert 0 < breaker.retry_after <= 0.01
+
+
+def test_rpc_errors_do_not_trip_the_circuit():
+    breaker, _ = make_breaker()
+
+    for _ in range(10):
+        breaker.record(RpcException("bad request"))
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_half_open_trial_closes_or_reopens():
+    breaker, changes = make_breaker(minimum_requests=1)
+    breaker.record(ConnectionError())
+    await asyncio.sleep(0.02)
+
+    assert breaker.available
+    assert breaker.allow() is True
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow() is False
+
+    breaker.record(ConnectionError())
+    assert breaker.state is CircuitState.OPEN
+    await asyncio.sleep(0.02)
+
+    assert breaker.allow() is True
+    breaker.record(None)
+    assert breaker.state is CircuitState.CLOSED
+    assert changes == [
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.CLOSED,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_frees_its_slot():
+    breaker, _ = make_breaker(minimum_requests=1)
+    breaker.record(ConnectionError())
+    await asyncio.sleep(0.02)
+    assert breaker.allow() is True
+
+    task = asyncio.create_task(breaker.call(asyncio.sleep(1)))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow() is True
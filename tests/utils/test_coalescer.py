@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from nest_rpc_client.utils.coalescer import EmitCoalescer
+
+
+class BatchRecorder:
+    def __init__(self, fail: bool = False):
+        self.batches: list[list] = []
+        self.fail = fail
+
+    async def __call__(self, batch: list) -> None:
+        if self.fail:
+            raise ConnectionError("broken")
+        self.batches.append(batch)
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_size_is_reached():
+    write = BatchRecorder()
+    coalescer = EmitCoalescer(write, batch_size=2, linger=10)
+
+    await coalescer.add("a", 1)
+    assert write.batches == []
+
+    await coalescer.add("b", 2)
+    assert write.batches == [[("a", 1), ("b", 2)]]
+    assert len(coalescer) == 0
+
+
+@pytest.mark.asyncio
+async def test_flushes_after_linger():
+    write = BatchRecorder()
+    coalescer = EmitCoalescer(write, batch_size=100, linger=0.01)
+
+    await coalescer.add("a", 1)
+    await coalescer.add("b", 2)
+    await asyncio.sleep(0.05)
+
+    assert write.batches == [[("a", 1), ("b", 2)]]
+
+
+@pytest.mark.asyncio
+async def test_explicit_flush_writes_buffer_once():
+    write = BatchRecorder()
+    coalescer = EmitCoalescer(write, batch_size=100, linger=0.01)
+
+    await coalescer.add("a", 1)
+    await coalescer.flush()
+    await asyncio.sleep(0.05)
+
+    assert write.batches == [[("a", 1)]]
+
+
+@pytest.mark.asyncio
+async def test_background_flush_error_is_raised_by_next_call():
+    coalescer = EmitCoalescer(BatchRecorder(fail=True), batch_size=100, linger=0.01)
+
+    await coalescer.add("a", 1)
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(ConnectionError):
+        await coalescer.add("b", 2)
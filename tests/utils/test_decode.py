@@ -0,0 +1,185 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Literal, NotRequired, TypedDict
+
+import pytest
+
+from nest_rpc_client.exceptions import ResponseDecodeError
+from nest_rpc_client.utils.decode import decode_response, get_decoder
+
+
+class Role(Enum):
+    ADMIN = "admin"
+    USER = "user"
+
+
+@dataclass
+class Address:
+    city: str
+    zip: str | None = None
+
+
+@dataclass
+class User:
+    id: int
+    name: str
+    role: Role
+    addresses: list[Address] = field(default_factory=list)
+    tags: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Node:
+    value: int
+    children: list["Node"]
+
+
+class Page(TypedDict):
+    total: int
+    users: list[User]
+    cursor: NotRequired[str]
+
+
+class Plain(TypedDict):
+    a: int
+    b: str
+
+
+reply = {
+    "id": 1,
+    "name": "Ann",
+    "role": "admin",
+    "addresses": [{"city": "Berlin"}, {"city": "Paris", "zip": "75001"}],
+    "tags": {"beta": True},
+    "extra": "ignored",
+}
+
+
+def test_decodes_nested_dataclasses():
+    user = decode_response(reply, User)
+
+    assert user == User(
+        id=1,
+        name="Ann",
+        role=Role.ADMIN,
+        addresses=[Address("Berlin"), Address("Paris", "75001")],
+        tags={"beta": True},
+    )
+
+
+def test_decodes_typeddict_with_nested_dataclasses():
+    page = decode_response({"total": 1, "users": [reply]}, Page)
+
+    assert page["total"] == 1
+    assert page["users"][0].addresses[1].zip == "75001"
+
+
+def test_typeddict_without_conversions_returns_reply_as_is():
+    value = {"a": 1, "b": "x"}
+
+    assert decode_response(value, Plain) is value
+
+
+def test_decodes_containers_and_optionals():
+    assert decode_response([{"city": "Oslo"}], list[Address]) == [Address("Oslo")]
+    assert decode_response({"x": {"city": "Oslo"}}, dict[str, Address]) == {
+        "x": Address("Oslo")
+    }
+    assert decode_response(None, Address | None) is None
+    assert decode_response([1, {"city": "Rome"}], tuple[int, Address]) == (
+        1,
+        Address("Rome"),
+    )
+
+
+def test_decodes_recursive_dataclasses():
+    tree = decode_response(
+        {"value": 1, "children": [{"value": 2, "children": []}]}, Node
+    )
+
+    assert tree == Node(1, [Node(2, [])])
+
+
+def test_decoders_are_compiled_once_per_type():
+    assert get_decoder(User) is get_decoder(User)
+    assert get_decoder(list[Address]) is get_decoder(list[Address])
+
+
+def test_missing_fields_raise_response_decode_error():
+    with pytest.raises(ResponseDecodeError) as exc_info:
+        decode_response({"name": "Ann"}, User)
+    assert exc_info.value.response_type is User
+
+    with pytest.raises(ResponseDecodeError):
+        decode_response({"total": 1}, Page)
+
+    with pytest.raises(ResponseDecodeError):
+        decode_response("not an object", Address)
+
+
+@pytest.mark.parametrize(
+    "response, response_type",
+    [
+        ("1", int),
+        (True, int),
+        (1.5, int),
+        (True, float),
+        (1, str),
+        (1, bool),
+        (0, type(None)),
+        ({}, list),
+        ([], dict),
+        ([1, "2"], list[int]),
+        ({"a": True}, dict[str, int]),
+        ({"a": "1", "b": "x"}, Plain),
+        ({**reply, "id": "1"}, User),
+        ({**reply, "role": "owner"}, User),
+        ("c", Literal["a", "b"]),
+        (True, Literal[1, 2]),
+        ("1", int | None),
+    ],
+)
+def test_replies_of_the_wrong_type_raise(response, response_type):
+    with pytest.raises(ResponseDecodeError):
+        decode_response(response, response_type)
+
+
+def test_checked_replies_are_returned_as_is():
+    numbers = [1, 2, 3]
+    scores = {"a": 1.5, "b": 2}
+
+    assert decode_response(numbers, list[int]) is numbers
+    assert decode_response(scores, dict[str, float]) is scores
+    assert decode_response(2, float) == 2
+    assert decode_response(False, bool) is False
+    assert decode_response(None, int | None) is None
+
+
+def test_decodes_literals():
+    assert decode_response("a", Literal["a", "b"]) == "a"
+    assert decode_response(1, Literal[1, True]) == 1
+    assert decode_response("admin", Literal[Role.ADMIN]) is Role.ADMIN
+
+
+def test_decodes_msgspec_structs():
+    msgspec = pytest.importorskip("msgspec")
+
+    class Item(msgspec.Struct):
+        id: int
+        name: str
+
+    assert decode_response([{"id": 1, "name": "a"}], list[Item]) == [Item(1, "a")]
+    with pytest.raises(ResponseDecodeError):
+        decode_response({"id": "x", "name": "a"}, Item)
+
+
+def test_decodes_pydantic_models():
+    pydantic = pytest.importorskip("pydantic")
+
+    class Item(pydantic.BaseModel):
+        id: int
+        name: str
+
+    assert decode_response({"id": 1, "name": "a"}, Item) == Item(id=1, name="a")
+    with pytest.raises(ResponseDecodeError):
+        decode_response({"id": "x", "name": "a"}, Item)
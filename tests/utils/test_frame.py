@@ -0,0 +1,77 @@
+import json
+
+from nest_rpc_client.utils.frame import FrameDecoder, encode_frame
+
+
+def test_encode_frame_ascii():
+    assert encode_frame(b'{"a":1}') == b'7#{"a":1}'
+
+
+def test_encode_frame_counts_utf16_code_units():
+    body = json.dumps({"a": "é😀"}, ensure_ascii=False).encode("utf-8")
+
+    length, rest = encode_frame(body).split(b"#", 1)
+
+    assert rest == body
+    assert int(length) == len(body.decode("utf-8").encode("utf-16-le")) // 2
+
+
+def test_decoder_yields_multiple_frames_per_read():
+    decoder = FrameDecoder()
+
+    frames = decoder.feed(b'7#{"a":1}7#{"b":2}7#{"c')
+
+    assert frames == [b'{"a":1}', b'{"b":2}']
+    assert decoder.feed(b'":3') == []
+    assert decoder.feed(b"}") == [b'{"c":3}']
+
+
+def test_decoder_handles_split_header_and_body():
+    decoder = FrameDecoder()
+    data = encode_frame(b'{"value":"' + b"x" * 100 + b'"}')
+
+    frames = []
+    for i in range(0, len(data), 3):
+        frames += decoder.feed(data[i : i + 3])
+
+    assert frames == [data.split(b"#", 1)[1]]
+
+
+def test_decoder_handles_multibyte_characters_across_chunks():
+    body = json.dumps({"a": "héllo 😀"}, ensure_ascii=False).encode("utf-8")
+    data = encode_frame(body) + encode_frame(b'{"x":1}')
+    decoder = FrameDecoder()
+
+    frames = []
+    for i in range(len(data)):
+        frames += decoder.feed(data[i : i + 1])
+
+    assert frames == [body, b'{"x":1}']
+
+
+def test_decoder_handles_many_pipelined_non_ascii_frames():
+    bodies = [
+        json.dumps({"n": n, "text": "привет 😀"}, ensure_ascii=False).encode()
+        for n in range(16_000)
+    ]
+    data = b"".join(encode_frame(body) for body in bodies)
+
+    assert FrameDecoder().feed(data) == bodies
+
+    decoder = FrameDecoder()
+    frames = []
+    for i in range(0, len(data), 65536):
+        frames += decoder.feed(data[i : i + 65536])
+    assert frames == bodies
+
+
+def test_decoder_counts_surrogate_pairs_across_chunks():
+    body = ("😀" * 50 + "é" * 50).encode()
+    data = encode_frame(body) + encode_frame(b"{}")
+    decoder = FrameDecoder()
+
+    frames = []
+    for i in range(0, len(data), 7):
+        frames += decoder.feed(data[i : i + 7])
+
+    assert frames == [body, b"{}"]
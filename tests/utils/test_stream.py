@@ -0,0 +1,86 @@
+import pytest
+
+from nest_rpc_client.exceptions.rpc import RpcException
+from nest_rpc_client.exceptions.stream import StreamOverflowError
+from nest_rpc_client.exceptions.timeout import RpcTimeoutError
+from nest_rpc_client.utils.stream import ReplyStream, iterate_replies
+
+
+async def collect(stream: ReplyStream, timeout: float | None = None) -> list:
+    return [r async for r in iterate_replies(stream.get, "p", timeout)]
+
+
+@pytest.mark.asyncio
+async def test_yields_responses_until_disposed():
+    stream = ReplyStream(10)
+    stream.put({"response": 1})
+    stream.put({"response": 2, "isDisposed": False})
+    stream.put({"isDisposed": True})
+    stream.put({"response": "late"})
+
+    assert await collect(stream) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_last_chunk_may_carry_the_disposed_flag():
+    stream = ReplyStream(10)
+    stream.put({"response": 1, "isDisposed": True})
+
+    assert await collect(stream) == [1]
+
+
+@pytest.mark.asyncio
+async def test_error_reply_raises():
+    stream = ReplyStream(10)
+    stream.put({"response": 1})
+    stream.put({"err": "boom"})
+
+    replies = iterate_replies(stream.get, "p", None)
+    assert await anext(replies) == 1
+    with pytest.raises(RpcException):
+        await anext(replies)
+
+
+@pytest.mark.asyncio
+async def test_overflow_fails_the_stream_after_buffered_replies():
+    stream = ReplyStream(2)
+    stream.put({"response": 1})
+    stream.put({"response": 2})
+    stream.put({"response": 3})
+    stream.put({"response": 4, "isDisposed": True})
+
+    replies = iterate_replies(stream.get, "p", None)
+    assert await anext(replies) == 1
+    assert await anext(replies) == 2
+    with pytest.raises(StreamOverflowError) as exc_info:
+        await anext(replies)
+    assert exc_info.value.max_buffer == 2
+
+
+def test_close_drops_buffered_and_later_replies():
+    stream = ReplyStream(1)
+    stream.put({"response": 1})
+
+    stream.close()
+    stream.put({"response": 2})
+
+    assert not stream._buffer
+
+
+@pytest.mark.asyncio
+async def test_failure_is_raised_after_buffered_replies():
+    stream = ReplyStream(10)
+    stream.put({"response": 1})
+    stream.fail(ConnectionError("closed"))
+
+    replies = iterate_replies(stream.get, "p", None)
+    assert await anext(replies) == 1
+    with pytest.raises(ConnectionError):
+        await anext(replies)
+
+
+@pytest.mark.asyncio
+async def test_timeout_applies_per_reply():
+    stream = ReplyStream(10)
+    with pytest.raises(RpcTimeoutError):
+        await collect(stream, timeout=0.01)
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from nest_rpc_client.exceptions.timeout import RpcTimeoutError
+from nest_rpc_client.utils.timeout import with_timeout
+
+
+@pytest.mark.asyncio
+async def test_with_timeout_returns_result():
+    async def fast():
+        return 1
+
+    assert await with_timeout(fast(), "p", 1) == 1
+    assert await with_timeout(fast(), "p", None) == 1
+
+
+@pytest.mark.asyncio
+async def test_with_timeout_cancels_and_raises():
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(RpcTimeoutError) as exc_info:
+        await with_timeout(slow(), "p", 0.01)
+
+    assert exc_info.value == RpcTimeoutError("p", 0.01)
+    assert isinstance(exc_info.value, TimeoutError)
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_with_timeout_keeps_inner_timeout_errors():
+    async def failing():
+        raise TimeoutError("inner")
+
+    with pytest.raises(TimeoutError) as exc_info:
+        await with_timeout(failing(), "p", 1)
+
+    assert not isinstance(exc_info.value, RpcTimeoutError)